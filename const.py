@@ -13,6 +13,8 @@ DEFAULT_MAX_MOISTURE = 25  # percentage
 DEFAULT_MAX_WATERING_HOURS = 0
 DEFAULT_MAX_WATERING_MINUTES = 20
 DEFAULT_RAIN_THRESHOLD = 3.0  # mm of rain above which watering is skipped
+DEFAULT_FORECAST_TTL = 3600  # seconds before the forecast is refetched
+MAX_MOISTURE_HISTORY = 30 * 24 * 12  # 30 days assuming readings every 5 minutes
 
 # Configuration keys
 CONF_ZONES = "zones"
@@ -32,6 +34,7 @@ CONF_SCHEDULE_ENTITY = "schedule_entity"  # Schedule helper entity ID
 CONF_SYSTEM_ENABLED = "system_enabled"  # Added to persist system enabled state
 CONF_RAIN_SENSOR = "rain_sensor"  # Entity ID of rain sensor (optional)
 CONF_RAIN_THRESHOLD = "rain_threshold"  # mm of rain above which watering is skipped
+CONF_FORECAST_TTL = "forecast_ttl_seconds"  # Optional override of DEFAULT_FORECAST_TTL
 
 # Services
 SERVICE_REFRESH_FORECAST = "refresh_forecast"
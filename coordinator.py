@@ -26,16 +26,44 @@ _LOGGER = logging.getLogger(__name__)
 class SprinklersCoordinator:
     """Coordinator for Smart Sprinklers integration."""
     
+    __slots__ = (
+        "hass",
+        "config_entry",
+        "_cycle_time",
+        "_cycle_seconds",
+        "_soak_time",
+        "_soak_seconds",
+        "zones",
+        "absorption_learners",
+        "daily_et",
+        "daily_precipitation",
+        "weather_manager",
+        "zone_controller",
+        "_system_enabled",
+        "_system_lock",
+        "_operation_lock",
+        "_sprinklers_active",
+        "_queue_processing_active",
+        "_manual_operation_requested",
+        "_shutdown_event",
+        "_pending_tasks",
+        "_notification_tasks",
+        "freeze_threshold",
+        "rain_threshold",
+        "weather_entity",
+    )
+    
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry):
         """Initialize the coordinator."""
         self.hass = hass
         self.config_entry = config_entry
         
         # Get configuration
-        weather_entity = config_entry.data.get(CONF_WEATHER_ENTITY)
-        freeze_threshold = config_entry.data.get(CONF_FREEZE_THRESHOLD, DEFAULT_FREEZE_THRESHOLD)
-        self.cycle_time = config_entry.data.get(CONF_CYCLE_TIME, DEFAULT_CYCLE_TIME)
-        self.soak_time = config_entry.data.get(CONF_SOAK_TIME, DEFAULT_SOAK_TIME)
+        cfg = config_entry.data
+        self.weather_entity = cfg.get(CONF_WEATHER_ENTITY)
+        self.freeze_threshold = cfg.get(CONF_FREEZE_THRESHOLD, DEFAULT_FREEZE_THRESHOLD)
+        self.cycle_time = cfg.get(CONF_CYCLE_TIME, DEFAULT_CYCLE_TIME)
+        self.soak_time = cfg.get(CONF_SOAK_TIME, DEFAULT_SOAK_TIME)
         
         # State data
         self.zones = {}  # Maps zone_id to zone data
@@ -54,13 +82,44 @@ class SprinklersCoordinator:
         self._sprinklers_active = False
         self._queue_processing_active = False
         self._manual_operation_requested = False
-        self._shutdown_requested = False  # Flag for shutdown
-        self._pending_tasks = []
+        self._shutdown_event = asyncio.Event()  # Set once shutdown is requested
+        self._pending_tasks = []  # Unsubscribe callbacks for the regular checks
+        self._notification_tasks = set()  # Notifications still being delivered
         
         # Configuration values
-        self.freeze_threshold = freeze_threshold
         self.rain_threshold = 3.0  # Default, may be overridden in setup
-        self.weather_entity = weather_entity
+        
+    @property
+    def cycle_time(self):
+        """Return the watering cycle length in minutes."""
+        return self._cycle_time
+        
+    @cycle_time.setter
+    def cycle_time(self, minutes):
+        """Set the watering cycle length in minutes."""
+        self._cycle_time = minutes
+        self._cycle_seconds = minutes * 60
+        
+    @property
+    def cycle_seconds(self):
+        """Return the watering cycle length in seconds."""
+        return self._cycle_seconds
+        
+    @property
+    def soak_time(self):
+        """Return the soak period in minutes."""
+        return self._soak_time
+        
+    @soak_time.setter
+    def soak_time(self, minutes):
+        """Set the soak period in minutes."""
+        self._soak_time = minutes
+        self._soak_seconds = minutes * 60
+        
+    @property
+    def soak_seconds(self):
+        """Return the soak period in seconds."""
+        return self._soak_seconds
         
     @property
     def system_enabled(self):
@@ -73,20 +132,26 @@ class SprinklersCoordinator:
         self._system_enabled = value
         # TODO: Persist to config entry if needed
         
+    @property
+    def shutdown_requested(self):
+        """Return True once an emergency shutdown has been requested."""
+        return self._shutdown_event.is_set()
+        
     async def async_initialize(self):
         """Initialize the coordinator."""
         try:
-            # Set up weather manager
-            await self.weather_manager.setup(self.config_entry.data)
-            
-            # Set up zones
-            await self.zone_controller.setup_zones(self.config_entry.data)
-            
-            # Set up daily update for weather data
-            await self.weather_manager.async_daily_update()
+            # Weather and zone setup are independent, run them together
+            await asyncio.gather(
+                self.weather_manager.setup(self.config_entry.data),
+                self.zone_controller.setup_zones(self.config_entry.data),
+            )
             
-            # Update weather data
-            await self.weather_manager.async_update_forecast()
+            # Daily update needs the zones; forecast only needs the weather
+            # setup, and is skipped if a saved forecast is still fresh
+            await asyncio.gather(
+                self.weather_manager.async_daily_update(),
+                self.weather_manager.check_and_update_forecast(),
+            )
             
             # Schedule regular checks
             self._schedule_regular_checks()
@@ -123,23 +188,23 @@ class SprinklersCoordinator:
     
     async def emergency_shutdown(self, reason="Emergency shutdown"):
         """Perform emergency shutdown of all sprinkler zones."""
-        self._shutdown_requested = True
+        self._shutdown_event.set()
         # Set cancel flag for any running watering cycles
         await self.zone_controller.stop_all_watering(reason)
         
         # Double-check: directly turn off all zone switches as a failsafe
         try:
-            for zone_id, zone in self.zones.items():
-                if "switch" in zone:
+            for zone_id, zone in tuple(self.zones.items()):
+                if zone.switch:
                     try:
-                        _LOGGER.debug("Emergency shutdown - turning off zone %s", zone["name"])
+                        _LOGGER.debug("Emergency shutdown - turning off zone %s", zone.name)
                         await self.hass.services.async_call(
                             "switch", "turn_off", 
-                            {"entity_id": zone["switch"]},
+                            {"entity_id": zone.switch},
                             blocking=True
                         )
                     except Exception as e:
-                        _LOGGER.error("Failed to turn off zone %s during emergency shutdown: %s", zone["name"], e)
+                        _LOGGER.error("Failed to turn off zone %s during emergency shutdown: %s", zone.name, e)
         except Exception as e:
             _LOGGER.error("Error during emergency shutdown: %s", e)
             
@@ -164,21 +229,52 @@ class SprinklersCoordinator:
         except Exception as e:
             _LOGGER.error("Error unloading zone controller: %s", e)
         
+        # Stop following the weather entity and save the forecast
+        try:
+            await self.weather_manager.async_unload()
+        except Exception as e:
+            _LOGGER.error("Error unloading weather manager: %s", e)
+        
+        # Cancel notifications still in flight and wait for them to finish
+        notification_tasks = tuple(self._notification_tasks)
+        for task in notification_tasks:
+            task.cancel()
+        await asyncio.gather(*notification_tasks, return_exceptions=True)
+        
         return True
         
     async def async_send_notification(self, message):
-        """Send a notification."""
+        """Send a notification without waiting for it to be delivered."""
         try:
-            await self.hass.services.async_call(
-                "persistent_notification",
-                "create",
-                {"title": "Smart Sprinklers", "message": message},
+            task = self.hass.async_create_task(
+                self.hass.services.async_call(
+                    "persistent_notification",
+                    "create",
+                    {"title": "Smart Sprinklers", "message": message},
+                )
             )
         except Exception as e:
             _LOGGER.error("Failed to send notification: %s", e)
+            return
+        self._notification_tasks.add(task)
+        task.add_done_callback(self._notification_done)
+
+    def _notification_done(self, task):
+        """Forget a finished notification task and log any failure."""
+        self._notification_tasks.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            _LOGGER.error("Failed to send notification: %s", error)
 
     async def execute_watering_program(self, mode="scheduled"):
         """Execute a watering program with proper locking to prevent multiple runs."""
+        # Bail out early without touching the lock if shutdown already started
+        if self.shutdown_requested:
+            _LOGGER.warning("Shutdown requested, not starting %s watering program", mode)
+            return False
+            
         # Use lock to ensure only one watering operation runs at a time
         if self._operation_lock.locked():
             _LOGGER.warning("Watering program already running, ignoring %s request", mode)
@@ -189,7 +285,7 @@ class SprinklersCoordinator:
             
         async with self._operation_lock:
             # Double check we're not in shutdown
-            if self._shutdown_requested:
+            if self.shutdown_requested:
                 _LOGGER.warning("Shutdown requested, not starting watering program")
                 return False
                 
@@ -200,8 +296,13 @@ class SprinklersCoordinator:
                 
                 # For now, just call process_queue if not already processing
                 if not self._queue_processing_active and self.system_enabled:
-                    for zone_id in self.zones:
-                        await self.zone_controller.process_zone(zone_id)
+                    # Snapshot the ids since zones may change while we await
+                    zone_ids = tuple(self.zones)
+                    should_process = self.zone_controller.should_process_zone
+                    process_zone = self.zone_controller.process_zone
+                    for zone_id in zone_ids:
+                        if should_process(zone_id):
+                            await process_zone(zone_id)
                 return True
             except Exception as e:
                 _LOGGER.error("Error executing watering program: %s", e)
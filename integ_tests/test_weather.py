@@ -111,8 +111,8 @@ async def test_moisture_deficit_tracking(hass: HomeAssistant) -> Optional[str]:
     
     # Check if moisture_deficit is defined in zones
     for zone_id, zone in coordinator.zones.items():
-        if "moisture_deficit" not in zone:
-            return f"Zone {zone['name']} missing moisture_deficit attribute"
+        if not hasattr(zone, "moisture_deficit"):
+            return f"Zone {zone.name} missing moisture_deficit attribute"
     
     # Check daily ET and precipitation attributes
     if not hasattr(coordinator, "daily_et"):
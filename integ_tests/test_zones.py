@@ -55,7 +55,7 @@ async def test_zone_entities_created(hass: HomeAssistant) -> Optional[str]:
     
     # Check for each zone
     for zone_id, zone in coordinator.zones.items():
-        zone_name = zone["name"].lower().replace(" ", "_")
+        zone_name = zone.name.lower().replace(" ", "_")
         
         for sensor_type in sensor_types:
             # Look for entity IDs matching patterns
@@ -94,10 +94,10 @@ async def test_zone_status_values(hass: HomeAssistant) -> Optional[str]:
     # Check each zone's status
     for zone_id, zone in coordinator.zones.items():
         # The state should be one of the defined states
-        state = zone.get("state")
+        state = zone.state
         
         if state not in ["idle", "watering", "soaking", "measuring"]:
-            return f"Zone {zone['name']} has invalid state: {state}"
+            return f"Zone {zone.name} has invalid state: {state}"
     
     return None  # None indicates success
 
@@ -25,11 +25,10 @@ from .const import (
     ATTR_NEXT_WATERING,
     ATTR_CYCLE_COUNT,
     ATTR_CURRENT_CYCLE,
-    ATTR_SOAKING_EFFICIENCY,
     ATTR_MOISTURE_HISTORY,
     ATTR_ABSORPTION_RATE,
     ATTR_ESTIMATED_WATERING_DURATION,
-    ATTR_EFFICIENCY_FACTOR,
+    ATTR_MOISTURE_DEFICIT,
     ZONE_STATE_IDLE,
     ZONE_STATE_WATERING,
     ZONE_STATE_SOAKING,
@@ -64,11 +63,19 @@ async def async_setup_entry(
 class ZoneStatusSensor(SensorEntity):
     """Sensor showing the status of an sprinklers zone."""
 
+    # Icon per zone state, built once instead of on every property access
+    _ICONS = {
+        ZONE_STATE_IDLE: "mdi:water-off",
+        ZONE_STATE_WATERING: "mdi:water",
+        ZONE_STATE_SOAKING: "mdi:water-percent",
+        ZONE_STATE_MEASURING: "mdi:gauge",
+    }
+
     def __init__(self, coordinator, zone_id):
         """Initialize the zone status sensor."""
         self.coordinator = coordinator
         self.zone_id = zone_id
-        zone_name = coordinator.zones[zone_id]["name"]
+        zone_name = coordinator.zones[zone_id].name
         
         self._attr_name = f"{zone_name} Status"
         self._attr_unique_id = f"{DOMAIN}_{zone_id}_status"
@@ -80,21 +87,13 @@ class ZoneStatusSensor(SensorEntity):
     @property
     def icon(self):
         """Return the icon for the sensor."""
-        state = self.coordinator.zones[self.zone_id]["state"]
-        
-        icons = {
-            ZONE_STATE_IDLE: "mdi:water-off",
-            ZONE_STATE_WATERING: "mdi:water",
-            ZONE_STATE_SOAKING: "mdi:water-percent",
-            ZONE_STATE_MEASURING: "mdi:gauge",
-        }
-        
-        return icons.get(state, "mdi:water-alert")
+        state = self.coordinator.zones[self.zone_id].state
+        return self._ICONS.get(state, "mdi:water-alert")
         
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""
-        return self.coordinator.zones[self.zone_id]["state"]
+        return self.coordinator.zones[self.zone_id].state
     
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
@@ -102,17 +101,14 @@ class ZoneStatusSensor(SensorEntity):
         zone = self.coordinator.zones[self.zone_id]
         
         return {
-            ATTR_ZONE: zone["name"],
-            ATTR_LAST_WATERED: zone.get("last_watered"),
-            ATTR_NEXT_WATERING: zone.get("next_watering"),
-            ATTR_CYCLE_COUNT: zone.get("cycle_count", 0),
-            ATTR_CURRENT_CYCLE: zone.get("current_cycle", 0),
-            ATTR_ESTIMATED_WATERING_DURATION: (
-                zone.get("cycle_count", 0) * self.coordinator.cycle_time
-                if zone.get("cycle_count", 0) > 0 else 0
-            ),
+            ATTR_ZONE: zone.name,
+            ATTR_LAST_WATERED: zone.last_watered,
+            ATTR_NEXT_WATERING: zone.next_watering,
+            ATTR_CYCLE_COUNT: zone.cycle_count,
+            ATTR_CURRENT_CYCLE: zone.current_cycle,
+            ATTR_ESTIMATED_WATERING_DURATION: zone.cycle_count * self.coordinator.cycle_time,
             # Add moisture deficit as an attribute
-            ATTR_MOISTURE_DEFICIT: zone.get("moisture_deficit", 0.0),
+            ATTR_MOISTURE_DEFICIT: zone.moisture_deficit,
         }
 
 
@@ -123,7 +119,7 @@ class ZoneEfficiencySensor(SensorEntity):
         """Initialize the zone efficiency sensor."""
         self.coordinator = coordinator
         self.zone_id = zone_id
-        zone_name = coordinator.zones[zone_id]["name"]
+        zone_name = coordinator.zones[zone_id].name
         
         self._attr_name = f"{zone_name} Efficiency"
         self._attr_unique_id = f"{DOMAIN}_{zone_id}_efficiency"
@@ -132,6 +128,10 @@ class ZoneEfficiencySensor(SensorEntity):
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_native_unit_of_measurement = "%/h"  # Percent per hour
         
+        # Exported moisture history, rebuilt only when the history changes
+        self._history_export = []
+        self._history_revision = None
+        
     @property
     def icon(self):
         """Return the icon for the sensor."""
@@ -140,7 +140,7 @@ class ZoneEfficiencySensor(SensorEntity):
     @property
     def native_value(self) -> float:
         """Return the state of the sensor."""
-        efficiency = self.coordinator.zones[self.zone_id].get(ATTR_SOAKING_EFFICIENCY, 0)
+        efficiency = self.coordinator.zones[self.zone_id].soaking_efficiency
         # Convert to percent per hour
         return round(efficiency * 60, 2)
     
@@ -149,13 +149,20 @@ class ZoneEfficiencySensor(SensorEntity):
         """Return additional attributes."""
         zone = self.coordinator.zones[self.zone_id]
         
-        # Include moisture history
-        moisture_history = zone.get("moisture_history", [])
-        
         return {
-            ATTR_ZONE: zone["name"],
-            ATTR_MOISTURE_HISTORY: moisture_history
+            ATTR_ZONE: zone.name,
+            ATTR_MOISTURE_HISTORY: self._export_moisture_history(zone.moisture_history)
         }
+    
+    def _export_moisture_history(self, history):
+        """Return the history as timestamp/value dicts, reusing the last export."""
+        if history.revision != self._history_revision:
+            self._history_export = [
+                {"timestamp": datetime.fromtimestamp(ts).isoformat(), "value": value}
+                for ts, value in history
+            ]
+            self._history_revision = history.revision
+        return self._history_export
 
 
 class ZoneAbsorptionSensor(SensorEntity):
@@ -165,7 +172,7 @@ class ZoneAbsorptionSensor(SensorEntity):
         """Initialize the zone absorption sensor."""
         self.coordinator = coordinator
         self.zone_id = zone_id
-        zone_name = coordinator.zones[zone_id]["name"]
+        zone_name = coordinator.zones[zone_id].name
         
         self._attr_name = f"{zone_name} Absorption Rate"
         self._attr_unique_id = f"{DOMAIN}_{zone_id}_absorption"
@@ -194,7 +201,7 @@ class ZoneLastWateredSensor(SensorEntity):
         """Initialize the last watered sensor."""
         self.coordinator = coordinator
         self.zone_id = zone_id
-        zone_name = coordinator.zones[zone_id]["name"]
+        zone_name = coordinator.zones[zone_id].name
         
         self._attr_name = f"{zone_name} Last Watered"
         self._attr_unique_id = f"{DOMAIN}_{zone_id}_last_watered"
@@ -210,7 +217,7 @@ class ZoneLastWateredSensor(SensorEntity):
     @property
     def native_value(self) -> datetime | None:
         """Return the state of the sensor."""
-        last_watered = self.coordinator.zones[self.zone_id].get("last_watered")
+        last_watered = self.coordinator.zones[self.zone_id].last_watered
         if last_watered:
             return dt.parse_datetime(last_watered)
         return None
@@ -263,7 +270,7 @@ class ZoneMoistureDeficitSensor(SensorEntity):
         """Initialize the zone moisture deficit sensor."""
         self.coordinator = coordinator
         self.zone_id = zone_id
-        zone_name = coordinator.zones[zone_id]["name"]
+        zone_name = coordinator.zones[zone_id].name
         
         self._attr_name = f"{zone_name} Moisture Deficit"
         self._attr_unique_id = f"{DOMAIN}_{zone_id}_moisture_deficit"
@@ -277,7 +284,7 @@ class ZoneMoistureDeficitSensor(SensorEntity):
     def icon(self):
         """Return the icon for the sensor."""
         zone = self.coordinator.zones[self.zone_id]
-        deficit = zone.get("moisture_deficit", 0)
+        deficit = zone.moisture_deficit
         
         if deficit <= 1.0:
             return "mdi:water-check"  # Low deficit
@@ -290,7 +297,7 @@ class ZoneMoistureDeficitSensor(SensorEntity):
     def native_value(self) -> float:
         """Return the state of the sensor."""
         zone = self.coordinator.zones[self.zone_id]
-        return round(zone.get("moisture_deficit", 0.0), 1)
+        return round(zone.moisture_deficit, 1)
 
 
 class ZoneEfficiencyFactorSensor(SensorEntity):
@@ -300,7 +307,7 @@ class ZoneEfficiencyFactorSensor(SensorEntity):
         """Initialize the zone efficiency factor sensor."""
         self.coordinator = coordinator
         self.zone_id = zone_id
-        zone_name = coordinator.zones[zone_id]["name"]
+        zone_name = coordinator.zones[zone_id].name
         
         self._attr_name = f"{zone_name} Efficiency Factor"
         self._attr_unique_id = f"{DOMAIN}_{zone_id}_efficiency_factor"
@@ -313,9 +320,7 @@ class ZoneEfficiencyFactorSensor(SensorEntity):
     @property
     def icon(self):
         """Return the icon for the sensor."""
-        efficiency_factor = self.coordinator.zones[self.zone_id].get(
-            ATTR_EFFICIENCY_FACTOR, 1.0
-        )
+        efficiency_factor = self.coordinator.zones[self.zone_id].efficiency_factor
         
         if efficiency_factor >= 0.9:
             return "mdi:water-check-outline"  # High efficiency
@@ -328,5 +333,5 @@ class ZoneEfficiencyFactorSensor(SensorEntity):
     def native_value(self) -> float:
         """Return the state of the sensor."""
         zone = self.coordinator.zones[self.zone_id]
-        factor = zone.get(ATTR_EFFICIENCY_FACTOR, 1.0)
+        factor = zone.efficiency_factor
         return round(factor, 2)
\ No newline at end of file
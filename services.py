@@ -51,11 +51,11 @@ async def register_services(hass: HomeAssistant, coordinator):
 async def async_service_reset_statistics(coordinator, call: ServiceCall):
     """Service to reset statistics for all zones."""
     for zone_id, zone in coordinator.zones.items():
-        zone["soaking_efficiency"] = 0
-        zone["moisture_history"] = []
-        zone["moisture_deficit"] = 0.0
-        zone["efficiency_factor"] = DEFAULT_EFFICIENCY_FACTOR  # Reset efficiency factor
-        zone["watering_expected_increase"] = 0.0  # Reset expected increase tracker
+        zone.soaking_efficiency = 0
+        zone.moisture_history.clear()
+        zone.moisture_deficit = 0.0
+        zone.efficiency_factor = DEFAULT_EFFICIENCY_FACTOR  # Reset efficiency factor
+        zone.watering_expected_increase = 0.0  # Reset expected increase tracker
         
         # Reset absorption learner
         coordinator.absorption_learners[zone_id].reset()
@@ -79,15 +79,15 @@ async def async_service_update_moisture_deficit(coordinator, call: ServiceCall):
         effective_rain = coordinator.daily_precipitation
         
         # Update moisture deficit
-        old_deficit = zone.get("moisture_deficit", 0.0)
+        old_deficit = zone.moisture_deficit
         new_deficit = old_deficit + zone_et - effective_rain
         
         # Ensure deficit isn't negative
-        zone["moisture_deficit"] = max(0.0, new_deficit)
+        zone.moisture_deficit = max(0.0, new_deficit)
         
         _LOGGER.info(
             "Zone %s: ET=%.2fmm, Rain=%.2fmm, Old deficit=%.2fmm, New deficit=%.2fmm",
-            zone["name"], zone_et, effective_rain, old_deficit, zone["moisture_deficit"]
+            zone.name, zone_et, effective_rain, old_deficit, zone.moisture_deficit
         )
     
     await coordinator.async_send_notification(
@@ -101,7 +101,7 @@ async def async_service_force_et_calculation(coordinator, call: ServiceCall):
     await coordinator.weather_manager.async_calculate_et()
     message = "ET calculation completed:\n"
     for zone_id, et in coordinator.daily_et.items():
-        zone_name = coordinator.zones[zone_id]["name"]
+        zone_name = coordinator.zones[zone_id].name
         message += f"• {zone_name}: {et:.2f}mm\n"
     
     await coordinator.async_send_notification(message)
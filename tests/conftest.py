@@ -1,46 +1,61 @@
 """Configure test environment."""
+import asyncio
 import os
 import sys
 from unittest.mock import MagicMock
 
-# Add proper path for imports - pointing to the parent directory
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
 
-# Create mock classes we need
-class MockSensorStateClass:
-    MEASUREMENT = "measurement"
-    
-class MockSensorDeviceClass:
-    TEMPERATURE = "temperature"
-    HUMIDITY = "humidity"
-    TIMESTAMP = "timestamp"
-    
-class MockEntityCategory:
-    CONFIG = "config"
-    DIAGNOSTIC = "diagnostic"
+# Make test_helpers importable the same way the test modules import it
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+if TEST_DIR not in sys.path:
+    sys.path.insert(0, TEST_DIR)
+
+from fakes import FakeServices
+from test_helpers import (
+    setup_test_env,
+    warm_component_modules,
+    load_package_module,
+    async_return,
+)
+
+# Same single entry point the test modules call; it is idempotent
+setup_test_env()
 
-# Create a complete mock structure for homeassistant
-homeassistant = MagicMock()
-homeassistant.components = MagicMock()
-homeassistant.components.sensor = MagicMock()
-homeassistant.components.sensor.SensorStateClass = MockSensorStateClass
-homeassistant.components.sensor.SensorDeviceClass = MockSensorDeviceClass
-homeassistant.helpers = MagicMock()
-homeassistant.helpers.entity = MagicMock()
-homeassistant.helpers.entity.EntityCategory = MockEntityCategory
+# Import each component once up front; later load_component_module calls
+# are served from the cache in test_helpers
+warm_component_modules()
 
-# Add all mock modules to sys.modules
-sys.modules['homeassistant'] = homeassistant
-sys.modules['homeassistant.core'] = MagicMock()
-sys.modules['homeassistant.config_entries'] = MagicMock()
-sys.modules['homeassistant.helpers'] = homeassistant.helpers
-sys.modules['homeassistant.helpers.entity'] = homeassistant.helpers.entity
-sys.modules['homeassistant.helpers.entity_platform'] = MagicMock()
-sys.modules['homeassistant.helpers.event'] = MagicMock()
-sys.modules['homeassistant.components'] = homeassistant.components
-sys.modules['homeassistant.components.switch'] = MagicMock()
-sys.modules['homeassistant.components.sensor'] = homeassistant.components.sensor
-sys.modules['homeassistant.util'] = MagicMock()
-sys.modules['homeassistant.util.dt'] = MagicMock()
-sys.modules['homeassistant.const'] = MagicMock()
-sys.modules['voluptuous'] = MagicMock()
\ No newline at end of file
+@pytest.fixture(scope="session")
+def zone_control():
+    """Load the zone_control package once per session."""
+    return load_package_module("zone_control")
+
+@pytest.fixture
+async def controller(zone_control):
+    """Return a ZoneController with one idle zone, running on the test loop."""
+    loop = asyncio.get_running_loop()
+    hass = MagicMock()
+    hass.loop = loop
+    hass.services = FakeServices()
+    hass.async_create_task = loop.create_task
+    
+    coordinator = MagicMock()
+    coordinator.hass = hass
+    coordinator.zones = {}
+    coordinator.absorption_learners = {}
+    coordinator.shutdown_requested = False
+    coordinator.cycle_time = 15
+    coordinator.async_send_notification = async_return()
+    
+    controller = zone_control.ZoneController(coordinator)
+    coordinator.zones["front_lawn"] = zone_control.ZoneRecord(
+        name="Front Lawn",
+        switch="switch.front_lawn",
+        temp_sensor="sensor.front_lawn_temp",
+        moisture_sensor="sensor.front_lawn_moisture",
+    )
+    yield controller
+    # Leave no timers behind on the shared loop
+    await controller.processor.cancel_all_callbacks()
+    controller.queue_manager.cancel_queue_notices()
@@ -0,0 +1,57 @@
+"""Lightweight typed fakes for Home Assistant objects used in tests."""
+
+
+class FakeState:
+    """Minimal stand-in for a Home Assistant State."""
+
+    __slots__ = ("state", "attributes")
+
+    def __init__(self, state="unknown", attributes=None):
+        self.state = state
+        self.attributes = attributes or {}
+
+
+class FakeStates:
+    """State machine backed by a plain dict of entity_id -> FakeState.
+
+    Tests seed states by assigning into _store; every entity_id looked up is
+    recorded in lookups.
+    """
+
+    __slots__ = ("_store", "lookups")
+
+    def __init__(self):
+        self._store = {}
+        self.lookups = []
+
+    def get(self, entity_id):
+        self.lookups.append(entity_id)
+        return self._store.get(entity_id)
+
+
+class FakeServices:
+    """Service registry that records calls and returns a canned response."""
+
+    __slots__ = ("_response", "_error", "calls")
+
+    def __init__(self, response=None, error=None):
+        self._response = response
+        self._error = error
+        self.calls = []
+
+    async def async_call(self, domain, service, data=None, **kwargs):
+        self.calls.append((domain, service, data, kwargs))
+        if self._error is not None:
+            raise self._error
+        return self._response
+
+
+class FakeHass:
+    """Home Assistant instance exposing only services and states."""
+
+    __slots__ = ("services", "states", "data")
+
+    def __init__(self):
+        self.services = FakeServices()
+        self.states = FakeStates()
+        self.data = {}
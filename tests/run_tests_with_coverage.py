@@ -2,8 +2,8 @@
 """Run tests with coverage for smart_sprinklers."""
 import os
 import sys
-import unittest
 import coverage
+import pytest
 
 # Set up the test environment
 from test_helpers import setup_test_env, TEST_DIR, ROOT_DIR
@@ -21,11 +21,9 @@ cov = coverage.Coverage(
 )
 cov.start()
 
-# Create test suite
-loader = unittest.TestLoader()
-suite = loader.discover(TEST_DIR, pattern="test_*.py")
-runner = unittest.TextTestRunner(verbosity=2)
-result = runner.run(suite)
+# Run the suite through pytest, which collects both the unittest.TestCase
+# classes and the plain pytest test functions
+exit_code = pytest.main(["-v", TEST_DIR])
 
 # Stop coverage
 cov.stop()
@@ -40,4 +38,4 @@ cov.html_report(directory=os.path.join(TEST_DIR, "coverage_html"))
 print(f"\nHTML coverage report generated in {os.path.join(TEST_DIR, 'coverage_html')}")
 
 # Return appropriate exit code
-sys.exit(not result.wasSuccessful())
\ No newline at end of file
+sys.exit(exit_code)
\ No newline at end of file
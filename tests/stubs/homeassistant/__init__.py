@@ -0,0 +1 @@
+"""Static Home Assistant stub package for the unit tests."""
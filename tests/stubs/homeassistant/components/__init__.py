@@ -0,0 +1 @@
+"""Stub of homeassistant.components."""
@@ -0,0 +1,22 @@
+"""Stub of homeassistant.components.sensor."""
+from homeassistant.helpers.entity import Entity
+
+
+class SensorStateClass:
+    """Sensor state classes."""
+
+    MEASUREMENT = "measurement"
+    TOTAL = "total"
+    TOTAL_INCREASING = "total_increasing"
+
+
+class SensorDeviceClass:
+    """Sensor device classes."""
+
+    TEMPERATURE = "temperature"
+    HUMIDITY = "humidity"
+    TIMESTAMP = "timestamp"
+
+
+class SensorEntity(Entity):
+    """Stand-in for the sensor entity base class."""
@@ -0,0 +1,6 @@
+"""Stub of homeassistant.components.switch."""
+from homeassistant.helpers.entity import Entity
+
+
+class SwitchEntity(Entity):
+    """Stand-in for the switch entity base class."""
@@ -0,0 +1,23 @@
+"""Stub of homeassistant.config_entries."""
+
+
+class ConfigEntry:
+    """Stand-in for a config entry."""
+
+    def __init__(self, data=None, options=None, entry_id="test"):
+        self.data = data or {}
+        self.options = options or {}
+        self.entry_id = entry_id
+
+
+class ConfigFlow:
+    """Stand-in for the config flow base class."""
+
+    def __init_subclass__(cls, domain=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if domain is not None:
+            cls.domain = domain
+
+
+class OptionsFlow:
+    """Stand-in for the options flow base class."""
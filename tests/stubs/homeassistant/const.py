@@ -0,0 +1,20 @@
+"""Stub of homeassistant.const."""
+from enum import Enum
+
+CONF_NAME = "name"
+PERCENTAGE = "%"
+EVENT_HOMEASSISTANT_STOP = "homeassistant_stop"
+
+
+class Platform(str, Enum):
+    """Entity platforms."""
+
+    SENSOR = "sensor"
+    SWITCH = "switch"
+
+
+class UnitOfTemperature(str, Enum):
+    """Temperature units."""
+
+    CELSIUS = "°C"
+    FAHRENHEIT = "°F"
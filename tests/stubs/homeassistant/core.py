@@ -0,0 +1,19 @@
+"""Stub of homeassistant.core."""
+
+
+def callback(func):
+    """Mark a function as safe to run in the event loop."""
+    return func
+
+
+class HomeAssistant:
+    """Stand-in for the Home Assistant core object."""
+
+
+class ServiceCall:
+    """Stand-in for a service call."""
+
+    def __init__(self, domain=None, service=None, data=None):
+        self.domain = domain
+        self.service = service
+        self.data = data or {}
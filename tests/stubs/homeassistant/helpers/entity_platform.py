@@ -0,0 +1,4 @@
+"""Stub of homeassistant.helpers.entity_platform."""
+from typing import Callable
+
+AddEntitiesCallback = Callable
@@ -0,0 +1,6 @@
+"""Stub of homeassistant.helpers.entity_registry."""
+
+
+def async_get(hass):
+    """Return the entity registry (not available in tests)."""
+    return None
@@ -0,0 +1,33 @@
+"""Stub of homeassistant.helpers.event.
+
+The trackers never fire; each returns an unsubscribe callable.
+"""
+
+
+def _unsub():
+    """Cancel a tracker (no-op)."""
+
+
+def async_track_state_change(hass, entity_ids, action, from_state=None, to_state=None):
+    """Track state changes of entities."""
+    return _unsub
+
+
+def async_track_state_change_event(hass, entity_ids, action):
+    """Track state change events of entities."""
+    return _unsub
+
+
+def async_track_time_interval(hass, action, interval):
+    """Track a recurring time interval."""
+    return _unsub
+
+
+def async_track_time_change(hass, action, hour=None, minute=None, second=None):
+    """Track a recurring wall-clock time."""
+    return _unsub
+
+
+def async_call_later(hass, delay, action):
+    """Call an action after a delay."""
+    return _unsub
@@ -0,0 +1,42 @@
+"""Stub of homeassistant.helpers.selector."""
+from enum import Enum
+
+
+class _Selector:
+    """Selector that just keeps its config."""
+
+    def __init__(self, config=None):
+        self.config = config
+
+    def __call__(self, value):
+        return value
+
+
+class _SelectorConfig(dict):
+    """Selector configuration stored as a plain dict."""
+
+    def __init__(self, **kwargs):
+        super().__init__(kwargs)
+
+
+class EntitySelector(_Selector):
+    """Entity selector."""
+
+
+class EntitySelectorConfig(_SelectorConfig):
+    """Entity selector configuration."""
+
+
+class SelectSelector(_Selector):
+    """Select selector."""
+
+
+class SelectSelectorConfig(_SelectorConfig):
+    """Select selector configuration."""
+
+
+class SelectSelectorMode(str, Enum):
+    """Select selector display modes."""
+
+    DROPDOWN = "dropdown"
+    LIST = "list"
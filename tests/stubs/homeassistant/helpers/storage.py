@@ -0,0 +1,23 @@
+"""Stub of homeassistant.helpers.storage.
+
+Stores keep their data in memory, shared by key for the whole session.
+"""
+
+_DATA = {}
+
+
+class Store:
+    """In-memory stand-in for a JSON store."""
+
+    def __init__(self, hass, version, key):
+        self.hass = hass
+        self.version = version
+        self.key = key
+
+    async def async_load(self):
+        """Return the saved data, or None if nothing was saved."""
+        return _DATA.get(self.key)
+
+    async def async_save(self, data):
+        """Save data under this store's key."""
+        _DATA[self.key] = data
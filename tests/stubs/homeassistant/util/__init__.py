@@ -0,0 +1,2 @@
+"""Stub of homeassistant.util."""
+from . import dt
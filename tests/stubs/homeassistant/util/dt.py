@@ -0,0 +1,27 @@
+"""Stub of homeassistant.util.dt backed by the datetime module."""
+from datetime import datetime, timezone
+
+DEFAULT_TIME_ZONE = timezone.utc
+
+
+def now(time_zone=None):
+    """Return the current time in the given (or default) time zone."""
+    return datetime.now(time_zone or DEFAULT_TIME_ZONE)
+
+
+def utcnow():
+    """Return the current time in UTC."""
+    return datetime.now(timezone.utc)
+
+
+def as_local(dattim):
+    """Convert a datetime to the default time zone."""
+    return dattim.astimezone(DEFAULT_TIME_ZONE)
+
+
+def parse_datetime(dt_str):
+    """Parse an ISO 8601 string, returning None if it is not valid."""
+    try:
+        return datetime.fromisoformat(dt_str)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,37 @@
+"""Stub of voluptuous: schemas store their definition and pass data through."""
+
+
+class Schema:
+    """Schema that keeps its definition and returns data unchanged."""
+
+    def __init__(self, schema, extra=None):
+        self.schema = schema
+
+    def __call__(self, data):
+        return data
+
+
+class Marker(str):
+    """Schema key with an optional default."""
+
+    def __new__(cls, key, default=None, description=None, msg=None):
+        marker = super().__new__(cls, key)
+        marker.default = default
+        marker.description = description
+        return marker
+
+
+class Required(Marker):
+    """Required schema key."""
+
+
+class Optional(Marker):
+    """Optional schema key."""
+
+
+def _passthrough(*args, **kwargs):
+    """Return a validator that accepts any value."""
+    return lambda value: value
+
+
+All = Coerce = In = Range = _passthrough
@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 """Test absorption learning algorithm."""
 import unittest
-from unittest.mock import MagicMock
-from datetime import datetime
 
 # Import test helpers
 from test_helpers import setup_test_env, load_component_module
@@ -13,11 +11,11 @@ setup_test_env()
 class TestAbsorptionLearner(unittest.TestCase):
     """Test the AbsorptionLearner class."""
     
-    def setUp(self):
-        """Set up test environment."""
-        # Load the module
-        self.absorption = load_component_module("algorithms/absorption")
-        self.AbsorptionLearner = self.absorption.AbsorptionLearner
+    @classmethod
+    def setUpClass(cls):
+        """Load the module once for the whole class."""
+        cls.absorption = load_component_module("algorithms/absorption")
+        cls.AbsorptionLearner = cls.absorption.AbsorptionLearner
     
     def test_absorption_learner_initialization(self):
         """Test initialization of AbsorptionLearner."""
@@ -1,9 +1,7 @@
 #!/usr/bin/env python3
 """Simple tests for config flow functionality."""
 import unittest
-import asyncio
 import inspect
-from unittest.mock import MagicMock, patch
 
 # Import test helpers
 from test_helpers import setup_test_env, load_component_module
@@ -39,9 +37,10 @@ class TestConfigFlowBasics(unittest.TestCase):
 class TestConfigFlowStructure(unittest.TestCase):
     """Test the structure of config flow."""
     
-    def setUp(self):
-        """Set up test environment."""
-        self.config_flow = load_component_module("config_flow")
+    @classmethod
+    def setUpClass(cls):
+        """Load the module once for the whole class."""
+        cls.config_flow = load_component_module("config_flow")
     
     def test_classes_exist(self):
         """Test that required classes exist."""
@@ -71,48 +70,5 @@ class TestConfigFlowStructure(unittest.TestCase):
         self.assertIn("async_step_edit_zone", source)
 
 
-# Only test services since we're not loading the full module
-class TestServicesFixed(unittest.TestCase):
-    """Test services registration without runtime errors."""
-    
-    def setUp(self):
-        """Set up test environment."""
-        # Create a fully mocked environment for services
-        self.hass = MagicMock()
-        self.hass.services = MagicMock()
-        
-        # Create a correctly mocked version of async_register that doesn't cause warnings
-        self.hass.services.async_register = MagicMock()
-        
-        # Create coordinator mock
-        self.coordinator = MagicMock()
-        self.coordinator.weather_manager = MagicMock()
-        
-        # Load services module
-        self.services = load_component_module("services")
-    
-    # Helper for async tests
-    def async_test(coro):
-        def wrapper(*args, **kwargs):
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(coro(*args, **kwargs))
-        return wrapper
-    
-    @async_test
-    async def test_register_services(self):
-        """Test service registration without actual execution."""
-        # Call the register function
-        result = await self.services.register_services(self.hass, self.coordinator)
-        
-        # Check it returns true
-        self.assertTrue(result)
-        
-        # Verify services were registered
-        self.assertTrue(self.hass.services.async_register.called)
-        
-        # Check minimum number of calls
-        self.assertGreaterEqual(self.hass.services.async_register.call_count, 2)
-
-
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -4,10 +4,10 @@ import unittest
 import os
 import asyncio
 from unittest.mock import MagicMock, AsyncMock, patch
-import importlib.util
 
 # Import test helpers
-from test_helpers import setup_test_env, load_component_module
+from fakes import FakeHass, FakeState
+from test_helpers import setup_test_env, load_component_module, async_return, async_test
 
 # Setup the test environment
 setup_test_env()
@@ -25,16 +25,9 @@ class TestControllerImplementation(unittest.TestCase):
         # Access the SprinklersController class
         self.SprinklersController = self.controller_module.SprinklersController
         
-        # Create mock hass
-        self.hass = MagicMock()
-        self.hass.states = MagicMock()
-        
-        # Mock state get method
-        self.hass.states.get = MagicMock()
-        
-        # Configure service calls
-        self.hass.services = MagicMock()
-        self.hass.services.async_call = AsyncMock()
+        # Fake hass: states are seeded through hass.states._store and
+        # service calls are recorded in hass.services.calls
+        self.hass = FakeHass()
         
         # Create test zone configuration
         self.zones_conf = [
@@ -70,12 +63,6 @@ class TestControllerImplementation(unittest.TestCase):
             forecast_hours=24
         )
     
-    # Helper for async tests
-    def async_test(coro):
-        def wrapper(*args, **kwargs):
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(coro(*args, **kwargs))
-        return wrapper
     
     def test_initialization(self):
         """Test controller initialization."""
@@ -98,28 +85,18 @@ class TestControllerImplementation(unittest.TestCase):
     @async_test
     async def test_update_moisture(self):
         """Test update_moisture method."""
-        # Mock weather state
-        weather_state = MagicMock()
-        weather_state.attributes = {
+        # Seed the weather state; sensor.rain (rain sensor) has no state
+        self.hass.states._store["weather.home"] = FakeState(attributes={
             "temperature": 25,
             "humidity": 60
-        }
-        
-        # Setup the states.get to return the weather_state for weather.home
-        # and None for sensor.rain (rain sensor)
-        def mock_get(entity_id):
-            if entity_id == "weather.home":
-                return weather_state
-            return None
-            
-        self.hass.states.get.side_effect = mock_get
+        })
         
         # Call the method
         await self.controller.update_moisture()
         
         # Verify both entities were accessed (removed the assertion about call order)
-        self.hass.states.get.assert_any_call("weather.home")
-        self.hass.states.get.assert_any_call("sensor.rain")
+        self.assertIn("weather.home", self.hass.states.lookups)
+        self.assertIn("sensor.rain", self.hass.states.lookups)
         
         # Check that moisture deficit was updated for both zones
         self.assertGreater(self.controller.zones[0].moisture_deficit, 0)
@@ -143,9 +120,8 @@ class TestControllerImplementation(unittest.TestCase):
     async def test_should_skip_for_weather(self):
         """Test should_skip_for_weather method."""
         # Test case 1: No rain forecasted
-        weather_state = MagicMock()
-        weather_state.attributes = {"forecast": []}
-        self.hass.states.get.return_value = weather_state
+        weather_state = FakeState(attributes={"forecast": []})
+        self.hass.states._store["weather.home"] = weather_state
         
         result = await self.controller.should_skip_for_weather()
         self.assertFalse(result)
@@ -164,16 +140,13 @@ class TestControllerImplementation(unittest.TestCase):
         # Setup zones that need water
         for zone in self.controller.zones:
             zone.needed_time = 300  # 5 minutes
-            
-        # Mock the service calls
-        self.hass.services.async_call = AsyncMock()
         
         # Patch sleep to avoid waiting
         with patch('asyncio.sleep', AsyncMock()):
             await self.controller.execute_watering()
         
         # Verify switch calls - should be at least one on/off pair for each zone
-        self.assertGreaterEqual(self.hass.services.async_call.call_count, 4)
+        self.assertGreaterEqual(len(self.hass.services.calls), 4)
     
     @async_test
     async def test_cancel_watering(self):
@@ -257,9 +230,8 @@ class TestCoordinatorStructure(unittest.TestCase):
         # Create coordinator
         self.coordinator = MockCoordinator(self.hass, self.config_entry)
         
-        # Make sure services.async_call is an AsyncMock
-        self.hass.services.async_call = AsyncMock()
-        self.coordinator.hass.services.async_call = AsyncMock()
+        # Only the source is inspected here, so service calls need no recording
+        self.hass.services.async_call = async_return()
         
         # Read the coordinator source code
         coordinator_path = os.path.join(ROOT_DIR, "coordinator.py")
@@ -297,13 +269,13 @@ class TestCoordinatorStructure(unittest.TestCase):
         """Test weather integration functionality."""
         self.assertIn("from .weather import WeatherManager", self.coordinator_source)
         self.assertIn("self.weather_manager = WeatherManager", self.coordinator_source)
-        self.assertIn("await self.weather_manager.async_update_forecast", self.coordinator_source)
+        self.assertIn("self.weather_manager.async_update_forecast()", self.coordinator_source)
     
     def test_zone_controller_integration(self):
         """Test zone controller integration."""
         self.assertIn("from .zone_control import ZoneController", self.coordinator_source)
         self.assertIn("self.zone_controller = ZoneController", self.coordinator_source)
-        self.assertIn("await self.zone_controller.setup_zones", self.coordinator_source)
+        self.assertIn("self.zone_controller.setup_zones(self.config_entry.data)", self.coordinator_source)
     
     def test_scheduling_functionality(self):
         """Test scheduling functionality."""
@@ -318,8 +290,8 @@ class TestCoordinatorStructure(unittest.TestCase):
     def test_cycle_and_soak_implementation(self):
         """Test cycle and soak config handling."""
         # Check initialization of cycle and soak times from config
-        self.assertIn("self.cycle_time = config_entry.data.get(CONF_CYCLE_TIME", self.coordinator_source)
-        self.assertIn("self.soak_time = config_entry.data.get(CONF_SOAK_TIME", self.coordinator_source)
+        self.assertIn("self.cycle_time = cfg.get(CONF_CYCLE_TIME", self.coordinator_source)
+        self.assertIn("self.soak_time = cfg.get(CONF_SOAK_TIME", self.coordinator_source)
     
     def test_error_handling(self):
         """Test error handling in coordinator."""
@@ -333,8 +305,8 @@ class TestCoordinatorStructure(unittest.TestCase):
     def test_watering_execution(self):
         """Test watering program execution."""
         # Check for watering zone looping code
-        self.assertIn("for zone_id in self.zones", self.coordinator_source)
-        self.assertIn("await self.zone_controller.process_zone", self.coordinator_source)
+        self.assertIn("zone_ids = tuple(self.zones)", self.coordinator_source)
+        self.assertIn("process_zone = self.zone_controller.process_zone", self.coordinator_source)
         
         # Check for skipping if already active
         self.assertIn("if self._operation_lock.locked()", self.coordinator_source)
@@ -344,7 +316,7 @@ class TestCoordinatorStructure(unittest.TestCase):
         self.assertIn("self._system_enabled = True", self.coordinator_source)
         self.assertIn("self._sprinklers_active = False", self.coordinator_source)
         self.assertIn("self._queue_processing_active = False", self.coordinator_source)
-        self.assertIn("self._shutdown_requested = False", self.coordinator_source)
+        self.assertIn("self._shutdown_event = asyncio.Event()", self.coordinator_source)
 
 
 class MockCoordinator:
@@ -371,15 +343,16 @@ class MockCoordinator:
         self.zone_controller.process_zone = AsyncMock()
         self.zone_controller.unload = AsyncMock(return_value=True)
         self.zone_controller.scheduler = MagicMock()
-        self.zone_controller.scheduler.check_schedule = AsyncMock()
-        self.zone_controller.scheduler.setup_schedule_monitoring = AsyncMock()
-        self.zone_controller.scheduler.is_in_schedule = MagicMock(return_value=True)
-        self.zone_controller.scheduler.get_schedule_remaining_time = MagicMock(return_value=60)
+        # Stubs that no test asserts on are plain callables, not mocks
+        self.zone_controller.scheduler.check_schedule = async_return()
+        self.zone_controller.scheduler.setup_schedule_monitoring = async_return()
+        self.zone_controller.scheduler.is_in_schedule = lambda *args, **kwargs: True
+        self.zone_controller.scheduler.get_schedule_remaining_time = lambda *args, **kwargs: 60
         self.zone_controller.active_zone = None
         self.zone_controller.soaking_zones = {}
         self.zone_controller.zone_queue = []
-        self.zone_controller.enable_system = AsyncMock()
-        self.zone_controller.disable_system = AsyncMock()
+        self.zone_controller.enable_system = async_return()
+        self.zone_controller.disable_system = async_return()
         
         # Set up state and configuration
         self._system_enabled = True
@@ -497,14 +470,6 @@ class TestCoordinatorFunctionality(unittest.TestCase):
         # Create coordinator
         self.coordinator = MockCoordinator(self.hass, self.config_entry)
     
-    # Helper for async tests
-    def async_test(coro):
-        """Turn a coroutine into a test case."""
-        def wrapper(*args, **kwargs):
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(coro(*args, **kwargs))
-        return wrapper
-    
     def test_system_enabled_property(self):
         """Test system_enabled property."""
         # Test getter
@@ -1,77 +1,129 @@
 #!/usr/bin/env python3
-"""Test using a simplified coordinator mock."""
-import unittest
+"""Test the coordinator, through a simplified copy and the real class."""
 import asyncio
+from types import MappingProxyType, SimpleNamespace
+
+import pytest
 from unittest.mock import MagicMock, AsyncMock
 
+# Import test helpers
+from fakes import FakeServices, FakeStates
+from test_helpers import load_component_module, load_package_module
+
 class MockHomeAssistant:
     """Mock Home Assistant instance."""
+    __slots__ = ("data", "services", "bus", "helpers")
+    
     def __init__(self):
         self.data = {}
         self.services = AsyncMock()
         self.services.async_call = AsyncMock()
         self.bus = MagicMock()
-        self.loop = asyncio.get_event_loop()
         self.helpers = MagicMock()
         self.helpers.event = MagicMock()
-        self.helpers.event.async_track_time_interval = MagicMock(return_value=lambda: None)
+        self.helpers.event.async_track_time_interval = lambda *args, **kwargs: (lambda: None)
 
 class MockConfigEntry:
     """Mock config entry."""
+    __slots__ = ("data", "entry_id")
+    
     def __init__(self, data=None, entry_id='test_entry_id'):
         self.data = data or {}
         self.entry_id = entry_id
 
+class _AsyncCounter:
+    """Awaitable stand-in for AsyncMock that only records its calls."""
+    __slots__ = ("calls", "_return")
+    
+    def __init__(self, return_value=None):
+        self.calls = []
+        self._return = return_value
+    
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self._return
+    
+    @property
+    def call_count(self):
+        return len(self.calls)
+    
+    def assert_called_once(self):
+        assert len(self.calls) == 1, self.calls
+    
+    def assert_called_once_with(self, *args, **kwargs):
+        assert self.calls == [(args, kwargs)], self.calls
+    
+    def assert_not_called(self):
+        assert not self.calls, self.calls
+
 class MockZoneController:
     """Mock zone controller."""
     def __init__(self, coordinator):
         self.coordinator = coordinator
-        self.setup_zones = AsyncMock()
-        self.stop_all_watering = AsyncMock()
-        self.process_zone = AsyncMock()
-        self.unload = AsyncMock(return_value=True)
+        self.setup_zones = _AsyncCounter()
+        self.stop_all_watering = _AsyncCounter()
+        self.process_zone = _AsyncCounter()
+        self.unload = _AsyncCounter(return_value=True)
         self.scheduler = MagicMock()
-        self.scheduler.check_schedule = AsyncMock()
-        self.scheduler.setup_schedule_monitoring = AsyncMock()
-        self.scheduler.is_in_schedule = MagicMock(return_value=True)
-        self.scheduler.get_schedule_remaining_time = MagicMock(return_value=60)
+        self.scheduler.check_schedule = _AsyncCounter()
+        self.scheduler.setup_schedule_monitoring = _AsyncCounter()
+        self.scheduler.is_in_schedule = lambda *args, **kwargs: True
+        self.scheduler.get_schedule_remaining_time = lambda *args, **kwargs: 60
         self.active_zone = None
         self.soaking_zones = {}
         self.zone_queue = []
-        self.enable_system = AsyncMock()
-        self.disable_system = AsyncMock()
+        self.enable_system = _AsyncCounter()
+        self.disable_system = _AsyncCounter()
 
 class MockWeatherManager:
     """Mock weather manager."""
     def __init__(self, coordinator):
         self.coordinator = coordinator
-        self.setup = AsyncMock()
-        self.async_daily_update = AsyncMock()
-        self.async_update_forecast = AsyncMock()
+        self.setup = _AsyncCounter()
+        self.async_daily_update = _AsyncCounter()
+        self.async_update_forecast = _AsyncCounter()
+        self.check_and_update_forecast = _AsyncCounter()
         self.is_rain_forecasted = MagicMock(return_value=False)
         self.is_freezing_forecasted = MagicMock(return_value=False)
 
 class MockAbsorptionLearner:
-    """Mock absorption learner."""
-    def __init__(self):
-        self.get_rate = MagicMock(return_value=0.5)
-        self.add_data_point = MagicMock()
-        self.reset = MagicMock()
+    """Mock absorption learner with a fixed rate."""
+    __slots__ = ()
+    
+    def get_rate(self):
+        return 0.5
+    
+    def add_data_point(self, *args):
+        pass
+    
+    def reset(self):
+        pass
 
 # Create a simplified version of the SprinklersCoordinator class for testing
 class SprinklersCoordinator:
     """Simplified coordinator for testing."""
     
+    __slots__ = (
+        "hass", "config_entry", "cycle_time", "soak_time", "zones",
+        "absorption_learners", "daily_et", "daily_precipitation",
+        "weather_manager", "zone_controller", "_system_enabled",
+        "_system_lock", "_operation_lock", "_sprinklers_active",
+        "_queue_processing_active", "_manual_operation_requested",
+        "_shutdown_event", "_pending_tasks", "freeze_threshold",
+        "rain_threshold", "weather_entity",
+    )
+    
     def __init__(self, hass, config_entry):
         """Initialize the coordinator."""
         self.hass = hass
         self.config_entry = config_entry
         
         # Get configuration
-        weather_entity = config_entry.data.get('weather_entity')
-        freeze_threshold = config_entry.data.get('freeze_threshold', 36.0)
-        self.cycle_time = config_entry.data.get('cycle_time', 15)
-        self.soak_time = config_entry.data.get('soak_time', 30)
+        cfg = config_entry.data
+        self.weather_entity = cfg.get('weather_entity')
+        self.freeze_threshold = cfg.get('freeze_threshold', 36.0)
+        self.cycle_time = cfg.get('cycle_time', 15)
+        self.soak_time = cfg.get('soak_time', 30)
         
         # State data
         self.zones = {}  # Maps zone_id to zone data
@@ -90,13 +142,11 @@ class SprinklersCoordinator:
         self._sprinklers_active = False
         self._queue_processing_active = False
         self._manual_operation_requested = False
-        self._shutdown_requested = False  # Flag for shutdown
+        self._shutdown_event = asyncio.Event()  # Set once shutdown is requested
         self._pending_tasks = []
         
         # Configuration values
-        self.freeze_threshold = freeze_threshold
         self.rain_threshold = 3.0  # Default
-        self.weather_entity = weather_entity
         
     @property
     def system_enabled(self):
@@ -108,20 +158,26 @@ class SprinklersCoordinator:
         """Set the system enabled state."""
         self._system_enabled = value
         
+    @property
+    def shutdown_requested(self):
+        """Return True once an emergency shutdown has been requested."""
+        return self._shutdown_event.is_set()
+        
     async def async_initialize(self):
         """Initialize the coordinator."""
         try:
-            # Set up weather manager
-            await self.weather_manager.setup(self.config_entry.data)
-            
-            # Set up zones
-            await self.zone_controller.setup_zones(self.config_entry.data)
-            
-            # Set up daily update for weather data
-            await self.weather_manager.async_daily_update()
+            # Weather and zone setup are independent, run them together
+            await asyncio.gather(
+                self.weather_manager.setup(self.config_entry.data),
+                self.zone_controller.setup_zones(self.config_entry.data),
+            )
             
-            # Update weather data
-            await self.weather_manager.async_update_forecast()
+            # Daily update needs the zones; forecast only needs the weather
+            # setup, and is skipped if a saved forecast is still fresh
+            await asyncio.gather(
+                self.weather_manager.async_daily_update(),
+                self.weather_manager.check_and_update_forecast(),
+            )
             
             # Schedule regular checks is mocked for testing
             
@@ -133,30 +189,25 @@ class SprinklersCoordinator:
         
     async def emergency_shutdown(self, reason="Emergency shutdown"):
         """Perform emergency shutdown of all sprinkler zones."""
-        self._shutdown_requested = True
+        self._shutdown_event.set()
         await self.zone_controller.stop_all_watering(reason)
     
-    async def async_send_notification(self, message):
-        """Send a notification."""
-        try:
-            await self.hass.services.async_call(
-                "persistent_notification",
-                "create",
-                {"title": "Smart Sprinklers", "message": message},
-            )
-        except Exception as e:
-            pass
-
     async def execute_watering_program(self, mode="scheduled"):
         """Execute a watering program."""
+        if self.shutdown_requested:
+            return False
+            
         async with self._operation_lock:
-            if self._shutdown_requested:
+            if self.shutdown_requested:
                 return False
                 
             try:
                 if not self._queue_processing_active and self.system_enabled:
-                    for zone_id in self.zones:
-                        await self.zone_controller.process_zone(zone_id)
+                    # Snapshot the ids since zones may change while we await
+                    zone_ids = tuple(self.zones)
+                    process_zone = self.zone_controller.process_zone
+                    for zone_id in zone_ids:
+                        await process_zone(zone_id)
                 return True
             except Exception as e:
                 await self.zone_controller.stop_all_watering(f"Error in {mode} program")
@@ -178,160 +229,243 @@ class SprinklersCoordinator:
         """Disable the system."""
         await self.zone_controller.disable_system()
 
-# Helper for async tests
-def async_test(coro):
-    def wrapper(*args, **kwargs):
-        loop = asyncio.get_event_loop()
-        return loop.run_until_complete(coro(*args, **kwargs))
-    return wrapper
-
-class TestCoordinator(unittest.TestCase):
-    """Test the coordinator."""
-
-    def setUp(self):
-        """Set up for each test."""
-        self.hass = MockHomeAssistant()
-        self.config_entry = MockConfigEntry(data={
-            'weather_entity': 'weather.test',
-            'freeze_threshold': 36.0,
-            'cycle_time': 15,
-            'soak_time': 30,
-            'zones': []
-        })
-        
-        # Create coordinator instance
-        self.coordinator = SprinklersCoordinator(self.hass, self.config_entry)
-        
-    def test_init_properties(self):
-        """Test initialization of the coordinator."""
-        self.assertEqual(self.coordinator.hass, self.hass)
-        self.assertEqual(self.coordinator.config_entry, self.config_entry)
-        self.assertEqual(self.coordinator.cycle_time, 15)
-        self.assertEqual(self.coordinator.soak_time, 30)
-        self.assertEqual(self.coordinator.zones, {})
-        self.assertTrue(self.coordinator.system_enabled)
-        self.assertEqual(self.coordinator.freeze_threshold, 36.0)
-        self.assertFalse(self.coordinator._sprinklers_active)
-        self.assertFalse(self.coordinator._queue_processing_active)
-    
-    def test_property_accessors(self):
-        """Test property accessors."""
-        # Test system_enabled property
-        self.assertTrue(self.coordinator.system_enabled)
-        
-        # Test setting it
-        self.coordinator.system_enabled = False
-        self.assertFalse(self.coordinator.system_enabled)
-        
-        # Set it back for other tests
-        self.coordinator.system_enabled = True
-    
-    def test_is_rain_forecasted(self):
-        """Test is_rain_forecasted method."""
-        # Test when rain is not forecasted
-        self.assertFalse(self.coordinator.is_rain_forecasted())
-        self.coordinator.weather_manager.is_rain_forecasted.assert_called_once()
-        
-        # Reset the mock
-        self.coordinator.weather_manager.is_rain_forecasted.reset_mock()
-        
-        # Test when rain is forecasted
-        self.coordinator.weather_manager.is_rain_forecasted.return_value = True
-        self.assertTrue(self.coordinator.is_rain_forecasted())
-        self.coordinator.weather_manager.is_rain_forecasted.assert_called_once()
-    
-    def test_is_freezing_forecasted(self):
-        """Test is_freezing_forecasted method."""
-        # Test when freezing is not forecasted 
-        self.assertFalse(self.coordinator.is_freezing_forecasted())
-        self.coordinator.weather_manager.is_freezing_forecasted.assert_called_once()
-        
-        # Reset the mock
-        self.coordinator.weather_manager.is_freezing_forecasted.reset_mock()
-        
-        # Test when freezing is forecasted
-        self.coordinator.weather_manager.is_freezing_forecasted.return_value = True
-        self.assertTrue(self.coordinator.is_freezing_forecasted())
-        self.coordinator.weather_manager.is_freezing_forecasted.assert_called_once()
-    
-    @async_test
-    async def test_async_send_notification(self):
-        """Test sending notifications."""
-        await self.coordinator.async_send_notification("Test message")
-        
-        self.hass.services.async_call.assert_called_once_with(
-            "persistent_notification", 
-            "create",
-            {"title": "Smart Sprinklers", "message": "Test message"},
+@pytest.fixture
+def hass():
+    """Return a mock Home Assistant instance."""
+    return MockHomeAssistant()
+
+@pytest.fixture
+def config_entry():
+    """Return a mock config entry."""
+    return MockConfigEntry(data={
+        'weather_entity': 'weather.test',
+        'freeze_threshold': 36.0,
+        'cycle_time': 15,
+        'soak_time': 30,
+        'zones': []
+    })
+
+# Zones shared by tests that only read them; read-only so no test can leak
+# changes into another
+ZONES = MappingProxyType({
+    'zone1': {'name': 'Zone 1', 'switch': 'switch.zone1', 'state': 'idle'},
+    'zone2': {'name': 'Zone 2', 'switch': 'switch.zone2', 'state': 'idle'},
+})
+
+@pytest.fixture
+def coordinator(hass, config_entry):
+    """Return a coordinator instance."""
+    return SprinklersCoordinator(hass, config_entry)
+
+def test_init_properties(coordinator, hass, config_entry):
+    """Test initialization of the coordinator."""
+    assert coordinator.hass is hass
+    assert coordinator.config_entry is config_entry
+    assert coordinator.cycle_time == 15
+    assert coordinator.soak_time == 30
+    assert coordinator.zones == {}
+    assert coordinator.system_enabled
+    assert coordinator.freeze_threshold == 36.0
+    assert not coordinator._sprinklers_active
+    assert not coordinator._queue_processing_active
+
+def test_property_accessors(coordinator):
+    """Test property accessors."""
+    # Test system_enabled property
+    assert coordinator.system_enabled
+    
+    # Test setting it
+    coordinator.system_enabled = False
+    assert not coordinator.system_enabled
+
+def test_is_rain_forecasted(coordinator):
+    """Test is_rain_forecasted method."""
+    weather_manager = coordinator.weather_manager
+    
+    # Test when rain is not forecasted
+    assert not coordinator.is_rain_forecasted()
+    weather_manager.is_rain_forecasted.assert_called_once()
+    
+    # Reset the mock
+    weather_manager.is_rain_forecasted.reset_mock()
+    
+    # Test when rain is forecasted
+    weather_manager.is_rain_forecasted.return_value = True
+    assert coordinator.is_rain_forecasted()
+    weather_manager.is_rain_forecasted.assert_called_once()
+
+def test_is_freezing_forecasted(coordinator):
+    """Test is_freezing_forecasted method."""
+    weather_manager = coordinator.weather_manager
+    
+    # Test when freezing is not forecasted 
+    assert not coordinator.is_freezing_forecasted()
+    weather_manager.is_freezing_forecasted.assert_called_once()
+    
+    # Reset the mock
+    weather_manager.is_freezing_forecasted.reset_mock()
+    
+    # Test when freezing is forecasted
+    weather_manager.is_freezing_forecasted.return_value = True
+    assert coordinator.is_freezing_forecasted()
+    weather_manager.is_freezing_forecasted.assert_called_once()
+
+async def test_emergency_shutdown(coordinator):
+    """Test emergency shutdown."""
+    coordinator.zones = ZONES
+    
+    await coordinator.emergency_shutdown("Test shutdown")
+    
+    assert coordinator.shutdown_requested
+    coordinator.zone_controller.stop_all_watering.assert_called_once_with("Test shutdown")
+
+async def test_emergency_shutdown_wins_over_concurrent_program(coordinator):
+    """Test a program racing an emergency shutdown never processes zones."""
+    coordinator.zones = ZONES
+    
+    for _ in range(10):
+        _, result = await asyncio.gather(
+            coordinator.emergency_shutdown("Test shutdown"),
+            coordinator.execute_watering_program(),
         )
+        assert result is False
     
-    @async_test
-    async def test_emergency_shutdown(self):
-        """Test emergency shutdown."""
-        self.coordinator.zones = {
-            'zone1': {'name': 'Zone 1', 'switch': 'switch.zone1'},
-            'zone2': {'name': 'Zone 2', 'switch': 'switch.zone2'}
-        }
-        
-        await self.coordinator.emergency_shutdown("Test shutdown")
-        
-        self.assertTrue(self.coordinator._shutdown_requested)
-        self.coordinator.zone_controller.stop_all_watering.assert_called_once_with("Test shutdown")
-        
-        # Reset shutdown flag
-        self.coordinator._shutdown_requested = False
+    coordinator.zone_controller.process_zone.assert_not_called()
+
+async def test_async_initialize(coordinator, config_entry):
+    """Test initialization."""
+    result = await coordinator.async_initialize()
     
-    @async_test
-    async def test_async_initialize(self):
-        """Test initialization."""
-        result = await self.coordinator.async_initialize()
-        
-        self.assertTrue(result)
-        self.coordinator.weather_manager.setup.assert_called_once_with(self.config_entry.data)
-        self.coordinator.zone_controller.setup_zones.assert_called_once_with(self.config_entry.data)
-        self.coordinator.weather_manager.async_daily_update.assert_called_once()
-        self.coordinator.weather_manager.async_update_forecast.assert_called_once()
-    
-    @async_test
-    async def test_execute_watering_program(self):
-        """Test execute_watering_program method."""
-        self.coordinator.zones = {
-            'zone1': {'name': 'Zone 1', 'state': 'idle'},
-            'zone2': {'name': 'Zone 2', 'state': 'idle'}
-        }
-        
-        result = await self.coordinator.execute_watering_program()
-        
-        self.assertTrue(result)
-        self.assertEqual(self.coordinator.zone_controller.process_zone.call_count, 2)
+    assert result
+    coordinator.weather_manager.setup.assert_called_once_with(config_entry.data)
+    coordinator.zone_controller.setup_zones.assert_called_once_with(config_entry.data)
+    coordinator.weather_manager.async_daily_update.assert_called_once()
+    coordinator.weather_manager.check_and_update_forecast.assert_called_once()
+    coordinator.weather_manager.async_update_forecast.assert_not_called()
+
+async def test_execute_watering_program(coordinator):
+    """Test execute_watering_program method."""
+    coordinator.zones = ZONES
     
-    @async_test
-    async def test_execute_watering_program_system_disabled(self):
-        """Test execute_watering_program when system is disabled."""
-        self.coordinator.system_enabled = False
-        
-        self.coordinator.zones = {
-            'zone1': {'name': 'Zone 1', 'state': 'idle'}
-        }
-        
-        result = await self.coordinator.execute_watering_program()
-        
-        self.assertTrue(result)
-        self.coordinator.zone_controller.process_zone.assert_not_called()
-        
-        self.coordinator.system_enabled = True
-    
-    @async_test
-    async def test_async_enable_system(self):
-        """Test enabling the system."""
-        await self.coordinator.async_enable_system()
-        self.coordinator.zone_controller.enable_system.assert_called_once()
-    
-    @async_test
-    async def test_async_disable_system(self):
-        """Test disabling the system."""
-        await self.coordinator.async_disable_system()
-        self.coordinator.zone_controller.disable_system.assert_called_once()
-        
+    result = await coordinator.execute_watering_program()
+    
+    assert result
+    assert coordinator.zone_controller.process_zone.call_count == 2
+
+async def test_execute_watering_program_system_disabled(coordinator):
+    """Test execute_watering_program when system is disabled."""
+    coordinator.system_enabled = False
+    
+    coordinator.zones = ZONES
+    
+    result = await coordinator.execute_watering_program()
+    
+    assert result
+    coordinator.zone_controller.process_zone.assert_not_called()
+
+async def test_async_enable_system(coordinator):
+    """Test enabling the system."""
+    await coordinator.async_enable_system()
+    coordinator.zone_controller.enable_system.assert_called_once()
+
+async def test_async_disable_system(coordinator):
+    """Test disabling the system."""
+    await coordinator.async_disable_system()
+    coordinator.zone_controller.disable_system.assert_called_once()
+
+@pytest.fixture(scope="module")
+def coordinator_module():
+    """Load the real coordinator module once for the whole file."""
+    return load_package_module("coordinator")
+
+def _real_coordinator(coordinator_module, config_entry):
+    """Build the real SprinklersCoordinator on the stubbed Home Assistant."""
+    loop = asyncio.get_running_loop()
+    hass = MagicMock()
+    hass.loop = loop
+    hass.services = FakeServices()
+    hass.states = FakeStates()
+    hass.async_create_task = loop.create_task
+    return coordinator_module.SprinklersCoordinator(hass, config_entry)
+
+@pytest.fixture
+async def real_coordinator(coordinator_module, config_entry):
+    """Return the real SprinklersCoordinator on the stubbed Home Assistant."""
+    coordinator = _real_coordinator(coordinator_module, config_entry)
+    yield coordinator
+    await coordinator.async_unload()
+
+async def test_send_notification_tracks_task_until_done(real_coordinator):
+    """A notification runs as a tracked task that is forgotten once delivered."""
+    await real_coordinator.async_send_notification("Test message")
+    assert len(real_coordinator._notification_tasks) == 1
+    
+    await asyncio.gather(*real_coordinator._notification_tasks)
+    await asyncio.sleep(0)
+    
+    assert real_coordinator.hass.services.calls == [(
+        "persistent_notification",
+        "create",
+        {"title": "Smart Sprinklers", "message": "Test message"},
+        {},
+    )]
+    assert real_coordinator._notification_tasks == set()
+
+async def test_send_notification_logs_delivery_failure(real_coordinator, caplog):
+    """A failed delivery is logged by the done callback, not raised."""
+    real_coordinator.hass.services = FakeServices(error=RuntimeError("service down"))
+    
+    await real_coordinator.async_send_notification("Test message")
+    await asyncio.gather(*real_coordinator._notification_tasks, return_exceptions=True)
+    await asyncio.sleep(0)
+    
+    assert "Failed to send notification: service down" in caplog.text
+    assert real_coordinator._notification_tasks == set()
+
+async def test_unload_cancels_notifications_in_flight(real_coordinator):
+    """Unloading cancels notifications that have not been delivered yet."""
+    never = asyncio.Event()
+    async def _stuck_call(*args, **kwargs):
+        await never.wait()
+    real_coordinator.hass.services = SimpleNamespace(async_call=_stuck_call)
+    
+    await real_coordinator.async_send_notification("Test message")
+    task, = real_coordinator._notification_tasks
+    await asyncio.sleep(0)
+    
+    await real_coordinator.async_unload()
+    
+    assert task.cancelled()
+    assert real_coordinator._notification_tasks == set()
+
+async def _initialize_counting_fetches(coordinator_module, weather_entity):
+    """Initialize a real coordinator and return how often it fetched the forecast."""
+    coordinator = _real_coordinator(
+        coordinator_module, MockConfigEntry(data={"weather_entity": weather_entity, "zones": []})
+    )
+    fetches = _AsyncCounter()
+    coordinator.weather_manager.async_update_forecast = fetches
+    try:
+        assert await coordinator.async_initialize()
+    finally:
+        await coordinator.async_unload()
+    return fetches.call_count
+
+async def test_real_initialize_fetches_forecast_on_cold_start(coordinator_module):
+    """Without a saved forecast, startup fetches one."""
+    assert await _initialize_counting_fetches(coordinator_module, "weather.cold_start") == 1
+
+async def test_real_initialize_skips_fetch_with_fresh_saved_forecast(coordinator_module):
+    """A saved forecast still within its TTL is used instead of fetching."""
+    weather = load_component_module("weather")
+    now = weather.dt_util.now().isoformat()
+    store = weather.Store(None, 1, f"{weather.DOMAIN}_weather_weather.warm_start")
+    await store.async_save({
+        "forecast": [{"datetime": now, "precipitation": 0}],
+        "updated": now,
+    })
+    
+    assert await _initialize_counting_fetches(coordinator_module, "weather.warm_start") == 0
+
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__])
@@ -1,69 +1,71 @@
 """Helper functions for testing."""
+import asyncio
+import atexit
 import os
 import sys
+import types
+import importlib
 import importlib.util
-from unittest.mock import MagicMock
 
 # Constants for testing
 TEST_DIR = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR = os.path.dirname(TEST_DIR)
+STUBS_DIR = os.path.join(TEST_DIR, "stubs")
 
 def setup_test_env():
-    """Set up the test environment with proper imports."""
+    """Set up the test environment with proper imports.
+
+    Safe to call any number of times; only missing path entries are added.
+    """
     # Add the parent directory to Python path
     if ROOT_DIR not in sys.path:
         sys.path.insert(0, ROOT_DIR)
 
-    # Create mock classes
-    class MockSensorStateClass:
-        MEASUREMENT = "measurement"
-        TOTAL = "total"
-        TOTAL_INCREASING = "total_increasing"
-        
-    class MockSensorDeviceClass:
-        TEMPERATURE = "temperature"
-        HUMIDITY = "humidity"
-        TIMESTAMP = "timestamp"
-        
-    class MockEntityCategory:
-        CONFIG = "config"
-        DIAGNOSTIC = "diagnostic"
+    # Resolve homeassistant and voluptuous to the static stubs in tests/stubs
+    if STUBS_DIR not in sys.path:
+        sys.path.insert(0, STUBS_DIR)
 
-    # Setup mock modules
-    modules_to_mock = {
-        'homeassistant': MagicMock(),
-        'homeassistant.core': MagicMock(),
-        'homeassistant.config_entries': MagicMock(),
-        'homeassistant.helpers': MagicMock(),
-        'homeassistant.helpers.entity': MagicMock(),
-        'homeassistant.helpers.entity_platform': MagicMock(),
-        'homeassistant.helpers.event': MagicMock(),
-        'homeassistant.components': MagicMock(),
-        'homeassistant.components.switch': MagicMock(),
-        'homeassistant.components.sensor': MagicMock(),
-        'homeassistant.util': MagicMock(),
-        'homeassistant.util.dt': MagicMock(),
-        'homeassistant.const': MagicMock(),
-        'voluptuous': MagicMock(),
-    }
-    
-    # Apply mocks
-    for name, mock in modules_to_mock.items():
-        sys.modules[name] = mock
-    
-    # Set up specific mock attributes
-    sys.modules['homeassistant.components.sensor'].SensorStateClass = MockSensorStateClass
-    sys.modules['homeassistant.components.sensor'].SensorDeviceClass = MockSensorDeviceClass
-    sys.modules['homeassistant.helpers.entity'].EntityCategory = MockEntityCategory
+# Loaded modules keyed by (module name, file mtime) so repeated loads from
+# setUp methods reuse the module instead of re-executing its body
+_MODULE_CACHE = {}
 
 def import_module_from_file(module_name, file_path):
     """Import a module from a file path."""
+    key = (module_name, os.path.getmtime(file_path))
+    module = _MODULE_CACHE.get(key)
+    if module is not None:
+        sys.modules[module_name] = module
+        return module
+    
     spec = importlib.util.spec_from_file_location(module_name, file_path)
     module = importlib.util.module_from_spec(spec)
     sys.modules[module_name] = module
     spec.loader.exec_module(module)
+    _MODULE_CACHE[key] = module
     return module
 
+# One event loop shared by every async test, closed when the interpreter exits
+_LOOP = asyncio.new_event_loop()
+atexit.register(_LOOP.close)
+
+def async_test(coro):
+    """Run an async test method to completion on the shared event loop."""
+    def wrapper(self, *args, **kwargs):
+        return _LOOP.run_until_complete(coro(self, *args, **kwargs))
+    return wrapper
+
+def async_return(value=None):
+    """Return an async callable that always resolves to value."""
+    async def _async_return(*args, **kwargs):
+        return value
+    return _async_return
+
+def async_raise(exc):
+    """Return an async callable that always raises exc."""
+    async def _async_raise(*args, **kwargs):
+        raise exc
+    return _async_raise
+
 def load_component_module(name):
     """Load a component module while handling relative imports."""
     module_path = os.path.join(ROOT_DIR, f"{name}.py")
@@ -76,4 +78,38 @@ def load_component_module(name):
         if os.path.exists(const_path):
             import_module_from_file("smart_sprinklers.const", const_path)
     
-    return import_module_from_file(f"smart_sprinklers.{name}", module_path)
\ No newline at end of file
+    return import_module_from_file(f"smart_sprinklers.{name}", module_path)
+
+def load_package_module(name):
+    """Load a subpackage module such as "zone_control.processor".
+
+    The smart_sprinklers package is registered without running its
+    __init__, so subpackages and their relative imports resolve from ROOT_DIR.
+    """
+    if "smart_sprinklers" not in sys.modules:
+        package = types.ModuleType("smart_sprinklers")
+        package.__path__ = [ROOT_DIR]
+        sys.modules["smart_sprinklers"] = package
+    if "smart_sprinklers.const" not in sys.modules:
+        load_component_module("const")
+    return importlib.import_module(f"smart_sprinklers.{name}")
+
+# Components loadable through load_component_module, warmed up by conftest
+# so each is compiled and cached once per session
+COMPONENT_MODULES = (
+    "const",
+    "util",
+    "services",
+    "config_flow",
+    "switch",
+    "sensor",
+    "weather",
+    "algorithms/absorption",
+    "algorithms/watering",
+    "zone_control/tracker",
+)
+
+def warm_component_modules():
+    """Load every standalone component into the module cache."""
+    for name in COMPONENT_MODULES:
+        load_component_module(name)
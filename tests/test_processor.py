@@ -1,47 +1,174 @@
 #!/usr/bin/env python3
 """Test zone processor."""
-import unittest
+import asyncio
 import os
 from unittest.mock import MagicMock
 
+import pytest
+
 # Import test helpers
 from test_helpers import setup_test_env
 
 # Setup the test environment
 setup_test_env()
 
-class TestZoneProcessor(unittest.TestCase):
-    """Test the ZoneProcessor class."""
-    
-    def setUp(self):
-        """Set up test environment."""
-        # We'll use direct file path access instead of importing
-        self.zone_control_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "zone_control")
-        self.processor_file = os.path.join(self.zone_control_dir, "processor.py")
-        
-        # Create mocks
-        self.controller = MagicMock()
-        self.controller.coordinator = MagicMock()
-        self.controller.coordinator.hass = MagicMock()
-    
-    def test_processor_file_structure(self):
-        """Test processor file structure."""
-        # Check that file exists
-        self.assertTrue(os.path.isfile(self.processor_file),
-                       f"processor.py file not found at {self.processor_file}")
-        
-        # Check source for key methods
-        with open(self.processor_file, 'r') as f:
-            source = f.read()
-            
-            # Check for ZoneProcessor class
-            self.assertIn("class ZoneProcessor", source)
-            
-            # Check for important methods
-            self.assertIn("async def turn_on_zone", source)
-            self.assertIn("async def turn_off_zone", source)
-            self.assertIn("async def start_zone_cycle", source)
+ZONE_CONTROL_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "zone_control")
+
+@pytest.fixture
+def processor_source():
+    """Return the source of processor.py."""
+    processor_file = os.path.join(ZONE_CONTROL_DIR, "processor.py")
+    assert os.path.isfile(processor_file), f"processor.py file not found at {processor_file}"
+    with open(processor_file, 'r') as f:
+        return f.read()
+
+def test_processor_file_structure(processor_source):
+    """Test processor file structure."""
+    # Check for ZoneProcessor class
+    assert "class ZoneProcessor" in processor_source
+    
+    # Check for important methods
+    assert "async def turn_on_zone" in processor_source
+    assert "async def turn_off_zone" in processor_source
+    assert "async def start_zone_cycle" in processor_source
+
+async def test_final_measurement_failure_resets_zone_and_queue(controller):
+    """A failure while recording the measurement must not stall the queue."""
+    coordinator = controller.coordinator
+    zone = coordinator.zones["front_lawn"]
+    zone.state = "measuring"
+    zone.cycle_count = 2
+    zone.pre_watering_moisture = 20.0
+    zone.last_moisture = 30.0
+    zone.learner = MagicMock()
+    zone.learner.add_data_point.side_effect = RuntimeError("learner failed")
+    coordinator._queue_processing_active = True
+    coordinator._sprinklers_active = True
+    
+    await controller.processor.handle_final_measurement(None, "front_lawn")
+    
+    assert zone.state == "idle"
+    assert coordinator._queue_processing_active is False
+    assert coordinator._sprinklers_active is False
+
+async def test_final_measurement_uses_coordinator_learner_for_unbound_zone(controller):
+    """A record built outside setup_zones learns into the coordinator's learner."""
+    coordinator = controller.coordinator
+    zone = coordinator.zones["front_lawn"]
+    learner = MagicMock()
+    coordinator.absorption_learners["front_lawn"] = learner
+    zone.state = "measuring"
+    zone.cycle_count = 2
+    zone.pre_watering_moisture = 20.0
+    zone.last_moisture = 30.0
+    
+    await controller.processor.handle_final_measurement(None, "front_lawn")
+    
+    learner.add_data_point.assert_called_once_with(20.0, 30.0, 30)
+    assert zone.learner is learner
+    assert zone.state == "idle"
 
+async def test_wake_queue_coalesces_pending_wakeups(controller):
+    """Wakeups before the pending pass starts share that one pass."""
+    loop = asyncio.get_running_loop()
+    tasks = []
+    def _create_background_task(coro, name):
+        tasks.append(loop.create_task(coro, name=name))
+    controller.hass.async_create_background_task = _create_background_task
+    passes = []
+    async def _process_queue():
+        passes.append(len(passes))
+    controller.queue_manager.process_queue = _process_queue
+    
+    for _ in range(3):
+        controller.processor.wake_queue()
+    await asyncio.gather(*tasks)
+    assert len(tasks) == 1
+    assert passes == [0]
+    
+    # Once that pass has started, the next wakeup schedules a new one
+    controller.processor.wake_queue()
+    await asyncio.gather(*tasks)
+    assert len(tasks) == 2
+    assert passes == [0, 1]
+
+async def test_timer_registry_keyed_by_zone_and_kind(controller, zone_control):
+    """Each zone holds at most one timer per kind; rescheduling replaces it."""
+    processor = controller.processor
+    processor_module = zone_control.processor
+    soak_end = processor_module.CALLBACK_SOAK_END
+    cycle_end = processor_module.CALLBACK_CYCLE_END
+    
+    first = processor._schedule(soak_end, "front_lawn", 60)
+    second = processor._schedule(soak_end, "front_lawn", 90)
+    processor._schedule(cycle_end, "front_lawn", 60)
+    
+    # The replaced soak timer is cancelled, the other kind is untouched
+    assert first.__self__.cancelled()
+    assert not second.__self__.cancelled()
+    assert set(processor._callback_handles) == {
+        ("front_lawn", soak_end),
+        ("front_lawn", cycle_end),
+    }
+    
+    # Entries are the loop timer handles, due at their absolute loop time
+    loop = asyncio.get_running_loop()
+    due = processor._callback_handles[("front_lawn", soak_end)].when()
+    assert due - loop.time() == pytest.approx(90, abs=0.5)
+    
+    processor.cancel_callback("front_lawn", soak_end)
+    assert second.__self__.cancelled()
+    assert set(processor._callback_handles) == {("front_lawn", cycle_end)}
+
+async def test_timer_runs_handler_for_its_kind(controller, zone_control):
+    """A due timer runs the handler registered for its kind with the zone id."""
+    processor = controller.processor
+    fired = []
+    async def _handle_soak_end(_now, zone_id):
+        fired.append(zone_id)
+    processor.handle_soak_end = _handle_soak_end
+    
+    processor._schedule(zone_control.processor.CALLBACK_SOAK_END, "front_lawn", 0)
+    await asyncio.sleep(0.01)
+    
+    assert fired == ["front_lawn"]
+
+@pytest.fixture
+def failing_timers(controller):
+    """Make every timer the processor arms fail to schedule."""
+    loop = MagicMock()
+    loop.time.return_value = 0.0
+    loop.call_at.side_effect = RuntimeError("loop closed")
+    controller.hass.loop = loop
+    controller.coordinator.soak_time = 30
+    controller.coordinator.soak_seconds = 30 * 60
+    zone = controller.coordinator.zones["front_lawn"]
+    zone.state = "watering"
+    zone.cycle_count = 2
+    zone.current_cycle = 1
+    return zone
+
+async def test_soak_timer_failure_leaves_zone_untouched(controller, failing_timers):
+    """The soak timer is armed before the zone is marked soaking."""
+    zone = failing_timers
+    
+    with pytest.raises(RuntimeError):
+        await controller.processor.start_soak_cycle("front_lawn")
+    
+    assert zone.state == "watering"
+    assert zone.current_cycle == 1
+    assert controller.soaking_zones == {}
+
+async def test_cycle_end_recovers_from_soak_timer_failure(controller, failing_timers):
+    """A cycle end whose soak cannot be scheduled leaves the zone idle."""
+    zone = failing_timers
+    controller.active_zone = "front_lawn"
+    
+    await controller.processor.handle_cycle_end(None, "front_lawn")
+    
+    assert zone.state == "idle"
+    assert controller.soaking_zones == {}
+    assert controller.processor._callback_handles == {}
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__])
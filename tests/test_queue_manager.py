@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """Test queue manager."""
-import unittest
+import asyncio
 import os
-from unittest.mock import MagicMock
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
 
 # Import test helpers
 from test_helpers import setup_test_env
@@ -10,38 +13,185 @@ from test_helpers import setup_test_env
 # Setup the test environment
 setup_test_env()
 
-class TestQueueManager(unittest.TestCase):
-    """Test the QueueManager class."""
-    
-    def setUp(self):
-        """Set up test environment."""
-        # We'll use direct file path access instead of importing
-        self.zone_control_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "zone_control")
-        self.queue_manager_file = os.path.join(self.zone_control_dir, "queue_manager.py")
-        
-        # Create mocks
-        self.controller = MagicMock()
-        self.controller.coordinator = MagicMock()
-        self.controller.coordinator.hass = MagicMock()
-    
-    def test_queue_manager_file_structure(self):
-        """Test QueueManager file structure."""
-        # Check that file exists
-        self.assertTrue(os.path.isfile(self.queue_manager_file),
-                       f"queue_manager.py file not found at {self.queue_manager_file}")
-        
-        # Check source for key methods
-        with open(self.queue_manager_file, 'r') as f:
-            source = f.read()
-            
-            # Check for QueueManager class
-            self.assertIn("class QueueManager", source)
-            
-            # Check for important methods
-            self.assertIn("async def evaluate_zone", source)
-            self.assertIn("async def process_queue", source)
-            self.assertIn("async def clear_queue", source)
+ZONE_CONTROL_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "zone_control")
+
+@pytest.fixture
+def queue_manager_source():
+    """Return the source of queue_manager.py."""
+    queue_manager_file = os.path.join(ZONE_CONTROL_DIR, "queue_manager.py")
+    assert os.path.isfile(queue_manager_file), f"queue_manager.py file not found at {queue_manager_file}"
+    with open(queue_manager_file, 'r') as f:
+        return f.read()
+
+def test_queue_manager_file_structure(queue_manager_source):
+    """Test queue_manager file structure."""
+    # Check for QueueManager class
+    assert "class QueueManager" in queue_manager_source
+    
+    # Check for important methods
+    assert "async def evaluate_zone" in queue_manager_source
+    assert "async def process_queue" in queue_manager_source
+    assert "async def clear_queue" in queue_manager_source
+
+@pytest.fixture
+def queue_manager_module(zone_control):
+    """Return the queue_manager module."""
+    return zone_control.queue_manager
+
+@pytest.fixture
+def clock(queue_manager_module, monkeypatch):
+    """Drive the monotonic clock the notification rate limit reads."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        queue_manager_module, "time", SimpleNamespace(monotonic=lambda: clock.now)
+    )
+    return clock
+
+@pytest.fixture
+def notifications(controller):
+    """Collect the messages sent through the coordinator."""
+    messages = []
+    async def _send(message):
+        messages.append(message)
+    controller.coordinator.async_send_notification = _send
+    return messages
+
+async def test_queue_notices_batched_within_interval(controller, clock, notifications):
+    """Zones queued inside the interval go out together when it elapses."""
+    queue_manager = controller.queue_manager
+    loop = asyncio.get_running_loop()
+    
+    await queue_manager._notify_queued("Front Lawn", "(a)")
+    assert notifications == ["Zone Front Lawn added to watering queue (a)"]
+    
+    clock.now += 10
+    await queue_manager._notify_queued("Back Yard", "(b)")
+    await queue_manager._notify_queued("Side Bed", "(c)")
+    assert len(notifications) == 1
+    
+    # One flush, due when the 30 s interval since the first notice is up
+    flush = queue_manager._queue_notify_flush
+    assert flush.when() - loop.time() == pytest.approx(20, abs=0.5)
+    
+    # Fire it now instead of waiting out the delay
+    flush.cancel()
+    queue_manager._flush_queue_notices()
+    await asyncio.sleep(0)
+    assert notifications[1] == (
+        "Zones added to watering queue:\n- Back Yard (b)\n- Side Bed (c)"
+    )
+    assert queue_manager._queue_notify_flush is None
 
+async def test_queue_notice_sent_at_once_after_interval(controller, clock, notifications):
+    """A zone queued once the interval has passed is reported immediately."""
+    queue_manager = controller.queue_manager
+    
+    await queue_manager._notify_queued("Front Lawn", "(a)")
+    clock.now += 30
+    await queue_manager._notify_queued("Back Yard", "(b)")
+    
+    assert notifications == [
+        "Zone Front Lawn added to watering queue (a)",
+        "Zone Back Yard added to watering queue (b)",
+    ]
+    assert queue_manager._queue_notify_flush is None
+
+@pytest.mark.parametrize(
+    "stop",
+    [
+        lambda controller: controller.queue_manager.clear_queue(),
+        lambda controller: controller.stop_all_watering(),
+        lambda controller: controller.unload(),
+    ],
+    ids=["clear_queue", "stop_all_watering", "unload"],
+)
+async def test_held_back_notices_dropped_on_stop(controller, clock, notifications, stop):
+    """Clearing the queue cancels the pending flush and its notices."""
+    queue_manager = controller.queue_manager
+    await queue_manager._notify_queued("Front Lawn", "(a)")
+    clock.now += 10
+    await queue_manager._notify_queued("Back Yard", "(b)")
+    flush = queue_manager._queue_notify_flush
+    
+    await stop(controller)
+    
+    assert flush.cancelled()
+    assert queue_manager._queue_notify_flush is None
+    assert queue_manager._pending_queue_notices == []
+    # A flush task that was already created finds nothing left to send
+    await queue_manager._send_queue_notices()
+    assert notifications == ["Zone Front Lawn added to watering queue (a)"]
+
+SOAK_START = datetime(2023, 10, 1, 6, 0)
+
+@pytest.fixture
+def soak_clock(queue_manager_module, monkeypatch):
+    """Drive the datetime.now() the soak check reads."""
+    clock = SimpleNamespace(now=SOAK_START)
+    
+    class _ClockDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return clock.now
+    
+    monkeypatch.setattr(queue_manager_module, "datetime", _ClockDatetime)
+    return clock
+
+def _soak(controller, zone_control, zone_id, minutes):
+    """Start tracking a soak the way start_soak_cycle does."""
+    ready_at = SOAK_START + timedelta(minutes=minutes)
+    controller.soaking_zones[zone_id] = zone_control.processor._SoakState(ready_at, 20.0)
+    controller.queue_manager.track_soak(zone_id, ready_at)
+
+@pytest.fixture
+def two_zones(controller, zone_control):
+    """Add a second zone to the controller."""
+    controller.coordinator.zones["back_yard"] = zone_control.ZoneRecord(
+        name="Back Yard",
+        switch="switch.back_yard",
+        temp_sensor="sensor.back_yard_temp",
+        moisture_sensor="sensor.back_yard_moisture",
+    )
+    return controller
+
+async def test_resoak_ignores_earlier_ready_time(controller, zone_control, soak_clock):
+    """A restarted soak is only released at its new ready time."""
+    _soak(controller, zone_control, "front_lawn", 10)
+    _soak(controller, zone_control, "front_lawn", 20)
+    
+    soak_clock.now = SOAK_START + timedelta(minutes=15)
+    await controller.queue_manager._check_soaking_zones()
+    assert list(controller.zone_queue) == []
+    assert "front_lawn" in controller.soaking_zones
+    
+    soak_clock.now = SOAK_START + timedelta(minutes=20)
+    await controller.queue_manager._check_soaking_zones()
+    assert list(controller.zone_queue) == ["front_lawn"]
+    assert controller.soaking_zones == {}
+    assert controller.queue_manager._soak_heap == []
+
+async def test_stop_then_resoak_releases_in_ready_order(two_zones, zone_control, soak_clock):
+    """Soaks started after a stop come out earliest first, ahead of the queue."""
+    controller = two_zones
+    _soak(controller, zone_control, "front_lawn", 10)
+    _soak(controller, zone_control, "back_yard", 10)
+    
+    await controller.stop_all_watering()
+    assert controller.queue_manager._soak_heap == []
+    
+    _soak(controller, zone_control, "front_lawn", 30)
+    _soak(controller, zone_control, "back_yard", 20)
+    controller.enqueue_zone("side_bed")
+    
+    # Past the cancelled soaks' ready time, nothing is released
+    soak_clock.now = SOAK_START + timedelta(minutes=10)
+    await controller.queue_manager._check_soaking_zones()
+    assert list(controller.zone_queue) == ["side_bed"]
+    
+    soak_clock.now = SOAK_START + timedelta(minutes=30)
+    await controller.queue_manager._check_soaking_zones()
+    assert list(controller.zone_queue) == ["back_yard", "front_lawn", "side_bed"]
+    assert controller.soaking_zones == {}
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__])
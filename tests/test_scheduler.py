@@ -1,47 +1,109 @@
 #!/usr/bin/env python3
 """Test zone scheduler."""
-import unittest
+import asyncio
 import os
-from unittest.mock import MagicMock
+from datetime import datetime, timedelta, timezone
+
+import pytest
 
 # Import test helpers
+from fakes import FakeState
 from test_helpers import setup_test_env
 
 # Setup the test environment
 setup_test_env()
 
-class TestScheduler(unittest.TestCase):
-    """Test the Scheduler class."""
+ZONE_CONTROL_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "zone_control")
+
+@pytest.fixture
+def scheduler_source():
+    """Return the source of scheduler.py."""
+    scheduler_file = os.path.join(ZONE_CONTROL_DIR, "scheduler.py")
+    assert os.path.isfile(scheduler_file), f"scheduler.py file not found at {scheduler_file}"
+    with open(scheduler_file, 'r') as f:
+        return f.read()
+
+def test_scheduler_file_structure(scheduler_source):
+    """Test scheduler file structure."""
+    # Check for Scheduler class
+    assert "class Scheduler" in scheduler_source
     
-    def setUp(self):
-        """Set up test environment."""
-        # We'll use direct file path access instead of importing
-        self.zone_control_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "zone_control")
-        self.scheduler_file = os.path.join(self.zone_control_dir, "scheduler.py")
-        
-        # Create mocks
-        self.controller = MagicMock()
-        self.controller.coordinator = MagicMock()
-        self.controller.coordinator.hass = MagicMock()
+    # Check for important methods
+    assert "def is_in_schedule" in scheduler_source
+    assert "def get_schedule_remaining_time" in scheduler_source
+    assert "async def check_schedule" in scheduler_source
+
+@pytest.fixture
+def scheduler_module(zone_control):
+    """Return the scheduler module."""
+    return zone_control.scheduler
+
+@pytest.fixture
+def scheduler(controller, scheduler_module, monkeypatch):
+    """Return a Scheduler watching a schedule entity, with a short debounce."""
+    monkeypatch.setattr(scheduler_module, "SCHEDULE_DEBOUNCE_SECONDS", 0.01)
+    controller.coordinator.config_entry.data = {
+        scheduler_module.CONF_SCHEDULE_ENTITY: "schedule.lawn"
+    }
+    scheduler = scheduler_module.Scheduler(controller)
+    scheduler.sweeps = 0
+    async def _count_sweep():
+        scheduler.sweeps += 1
+    scheduler._process_all_zones = _count_sweep
+    yield scheduler
+    scheduler.unload()
+
+async def test_repeated_activations_collapse_into_one_sweep(scheduler):
+    """A burst of on-transitions checks the zones once, after it settles."""
+    for _ in range(3):
+        await scheduler._handle_schedule_change(
+            "schedule.lawn", FakeState("off"), FakeState("on")
+        )
+    assert scheduler.sweeps == 0
     
-    def test_scheduler_file_structure(self):
-        """Test Scheduler file structure."""
-        # Check that file exists
-        self.assertTrue(os.path.isfile(self.scheduler_file),
-                       f"scheduler.py file not found at {self.scheduler_file}")
-        
-        # Check source for key methods
-        with open(self.scheduler_file, 'r') as f:
-            source = f.read()
-            
-            # Check for Scheduler class
-            self.assertIn("class Scheduler", source)
-            
-            # Check for important methods
-            self.assertIn("def is_in_schedule", source)
-            self.assertIn("def get_schedule_remaining_time", source)
-            self.assertIn("async def check_schedule", source)
+    await asyncio.sleep(0.05)
+    assert scheduler.sweeps == 1
+    assert scheduler._schedule_check_debounce is None
 
+async def test_deactivation_cancels_pending_sweep(scheduler):
+    """The window closing before the debounce fires drops the sweep."""
+    await scheduler._handle_schedule_change("schedule.lawn", FakeState("off"), FakeState("on"))
+    await scheduler._handle_schedule_change("schedule.lawn", FakeState("on"), FakeState("off"))
+    
+    await asyncio.sleep(0.05)
+    assert scheduler.sweeps == 0
+
+async def test_unload_cancels_pending_sweep(scheduler):
+    """Unloading drops a sweep that has not started yet."""
+    await scheduler._handle_schedule_change("schedule.lawn", None, FakeState("on"))
+    assert scheduler._schedule_check_debounce is not None
+    
+    scheduler.unload()
+    
+    assert scheduler._schedule_check_debounce is None
+    await asyncio.sleep(0.05)
+    assert scheduler.sweeps == 0
+
+def test_schedule_end_time_parsed_once_per_attributes(scheduler):
+    """The window end is only re-parsed when its attributes or the day change."""
+    parse = scheduler._parse_schedule_end
+    parsed = []
+    def _counting_parse(*key):
+        parsed.append(key)
+        return parse(*key)
+    scheduler._parse_schedule_end = _counting_parse
+    now = datetime(2023, 10, 1, 6, 0, tzinfo=timezone.utc)
+    
+    end = scheduler._schedule_end_time({"end_time": "08:30"}, now)
+    assert end == datetime(2023, 10, 1, 8, 30, tzinfo=timezone.utc)
+    assert scheduler._schedule_end_time({"end_time": "08:30"}, now + timedelta(minutes=5)) is end
+    assert len(parsed) == 1
+    
+    # A new end time and a new day each invalidate the cached value
+    assert scheduler._schedule_end_time({"end_time": "09:00"}, now).hour == 9
+    tomorrow = scheduler._schedule_end_time({"end_time": "09:00"}, now + timedelta(days=1))
+    assert tomorrow == datetime(2023, 10, 2, 9, 0, tzinfo=timezone.utc)
+    assert len(parsed) == 3
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__])
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 """Test sensor.py using direct mocking."""
-import unittest
-import os
-import sys
-from unittest.mock import MagicMock, patch
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+# Import test helpers
+from test_helpers import load_component_module
 
 # Define constants from const.py
 DOMAIN = "smart_sprinklers"
@@ -23,15 +28,46 @@ ATTR_ESTIMATED_WATERING_DURATION = "estimated_watering_duration"
 ATTR_EFFICIENCY_FACTOR = "efficiency_factor"
 ATTR_MOISTURE_DEFICIT = "moisture_deficit"
 
+# Minimal copy of the ZoneRecord fields the sensors read
+@dataclass(slots=True)
+class ZoneRecord:
+    """Runtime state of a single sprinkler zone."""
+    name: str
+    state: str = ZONE_STATE_IDLE
+    last_watered: Optional[str] = None
+    next_watering: Optional[str] = None
+    cycle_count: int = 0
+    current_cycle: int = 0
+    moisture_history: list = field(default_factory=list)
+    soaking_efficiency: float = 0
+    moisture_deficit: float = 0.0
+    efficiency_factor: float = 1.0
+
+class _FakeLearner:
+    """Absorption learner stub with a fixed rate."""
+    __slots__ = ()
+    
+    def get_rate(self):
+        return 0.25
+
+_FAKE_LEARNER = _FakeLearner()
+
 # Create a minimal implementation of ZoneStatusSensor for testing
 class ZoneStatusSensor:
     """Sensor showing the status of a sprinklers zone."""
 
+    _ICONS = {
+        ZONE_STATE_IDLE: "mdi:water-off",
+        ZONE_STATE_WATERING: "mdi:water",
+        ZONE_STATE_SOAKING: "mdi:water-percent",
+        ZONE_STATE_MEASURING: "mdi:gauge",
+    }
+
     def __init__(self, coordinator, zone_id):
         """Initialize the zone status sensor."""
         self.coordinator = coordinator
         self.zone_id = zone_id
-        zone_name = coordinator.zones[zone_id]["name"]
+        zone_name = coordinator.zones[zone_id].name
         
         self._attr_name = f"{zone_name} Status"
         self._attr_unique_id = f"{DOMAIN}_{zone_id}_status"
@@ -43,21 +79,13 @@ class ZoneStatusSensor:
     @property
     def icon(self):
         """Return the icon for the sensor."""
-        state = self.coordinator.zones[self.zone_id]["state"]
-        
-        icons = {
-            ZONE_STATE_IDLE: "mdi:water-off",
-            ZONE_STATE_WATERING: "mdi:water",
-            ZONE_STATE_SOAKING: "mdi:water-percent",
-            ZONE_STATE_MEASURING: "mdi:gauge",
-        }
-        
-        return icons.get(state, "mdi:water-alert")
+        state = self.coordinator.zones[self.zone_id].state
+        return self._ICONS.get(state, "mdi:water-alert")
         
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        return self.coordinator.zones[self.zone_id]["state"]
+        return self.coordinator.zones[self.zone_id].state
     
     @property
     def extra_state_attributes(self):
@@ -65,107 +93,131 @@ class ZoneStatusSensor:
         zone = self.coordinator.zones[self.zone_id]
         
         return {
-            ATTR_ZONE: zone["name"],
-            ATTR_LAST_WATERED: zone.get("last_watered"),
-            ATTR_NEXT_WATERING: zone.get("next_watering"),
-            ATTR_CYCLE_COUNT: zone.get("cycle_count", 0),
-            ATTR_CURRENT_CYCLE: zone.get("current_cycle", 0),
-            ATTR_ESTIMATED_WATERING_DURATION: (
-                zone.get("cycle_count", 0) * self.coordinator.cycle_time
-                if zone.get("cycle_count", 0) > 0 else 0
-            ),
+            ATTR_ZONE: zone.name,
+            ATTR_LAST_WATERED: zone.last_watered,
+            ATTR_NEXT_WATERING: zone.next_watering,
+            ATTR_CYCLE_COUNT: zone.cycle_count,
+            ATTR_CURRENT_CYCLE: zone.current_cycle,
+            ATTR_ESTIMATED_WATERING_DURATION: zone.cycle_count * self.coordinator.cycle_time,
             # Add moisture deficit as an attribute
-            ATTR_MOISTURE_DEFICIT: zone.get("moisture_deficit", 0.0),
+            ATTR_MOISTURE_DEFICIT: zone.moisture_deficit,
         }
 
 
-class TestSensors(unittest.TestCase):
-    """Test the sensor entities."""
+@pytest.fixture
+def coordinator():
+    """Return a mock coordinator with a single zone."""
+    coordinator = MagicMock()
     
-    def setUp(self):
-        """Set up for each test."""
-        # Create a mock coordinator
-        self.coordinator = MagicMock()
-        
-        # Sample zone data
-        self.coordinator.zones = {
-            "zone1": {
-                "name": "Front Lawn",
-                "state": ZONE_STATE_IDLE,
-                "last_watered": "2023-06-01T08:00:00",
-                "next_watering": "2023-06-02T08:00:00",
-                "cycle_count": 3,
-                "current_cycle": 1,
-                "moisture_history": [],
-                "soaking_efficiency": 0.5,
-                "moisture_deficit": 5.0,
-                "efficiency_factor": 0.85
-            }
-        }
-        
-        # Mock absorption learners
-        self.coordinator.absorption_learners = {
-            "zone1": MagicMock(get_rate=MagicMock(return_value=0.25))
-        }
-        
-        # Weather data
-        self.coordinator.daily_precipitation = 2.5
-        self.coordinator.daily_et = {"zone1": 3.0}
-        self.coordinator.rain_threshold = 3.0
-        self.coordinator.freeze_threshold = 36.0
-        
-        # Cycle time
-        self.coordinator.cycle_time = 15
+    # Sample zone data
+    coordinator.zones = {
+        "zone1": ZoneRecord(
+            name="Front Lawn",
+            state=ZONE_STATE_IDLE,
+            last_watered="2023-06-01T08:00:00",
+            next_watering="2023-06-02T08:00:00",
+            cycle_count=3,
+            current_cycle=1,
+            moisture_history=[],
+            soaking_efficiency=0.5,
+            moisture_deficit=5.0,
+            efficiency_factor=0.85,
+        )
+    }
     
-    def test_zone_status_sensor(self):
-        """Test the ZoneStatusSensor class."""
-        # Create an instance of the sensor
-        sensor = ZoneStatusSensor(self.coordinator, "zone1")
-        
-        # Test initialization
-        self.assertEqual(sensor._attr_name, "Front Lawn Status")
-        self.assertEqual(sensor._attr_unique_id, f"{DOMAIN}_zone1_status")
-        self.assertTrue(sensor._attr_has_entity_name)
-        
-        # Test properties
-        self.assertEqual(sensor.native_value, ZONE_STATE_IDLE)
-        
-        # Change zone state and verify sensor updates
-        self.coordinator.zones["zone1"]["state"] = ZONE_STATE_WATERING
-        self.assertEqual(sensor.native_value, ZONE_STATE_WATERING)
-        
-        # Test icons
-        self.coordinator.zones["zone1"]["state"] = ZONE_STATE_IDLE
-        self.assertEqual(sensor.icon, "mdi:water-off")
-        
-        self.coordinator.zones["zone1"]["state"] = ZONE_STATE_WATERING
-        self.assertEqual(sensor.icon, "mdi:water")
-        
-        self.coordinator.zones["zone1"]["state"] = ZONE_STATE_SOAKING
-        self.assertEqual(sensor.icon, "mdi:water-percent")
-        
-        self.coordinator.zones["zone1"]["state"] = ZONE_STATE_MEASURING
-        self.assertEqual(sensor.icon, "mdi:gauge")
-        
-        # Test extra attributes
-        attrs = sensor.extra_state_attributes
-        self.assertEqual(attrs.get(ATTR_ZONE), "Front Lawn")
-        self.assertEqual(attrs.get(ATTR_LAST_WATERED), "2023-06-01T08:00:00")
-        self.assertEqual(attrs.get(ATTR_CYCLE_COUNT), 3)
-        self.assertEqual(attrs.get(ATTR_CURRENT_CYCLE), 1)
-        self.assertEqual(attrs.get(ATTR_ESTIMATED_WATERING_DURATION), 45)  # 3 cycles * 15 min
-        self.assertEqual(attrs.get(ATTR_MOISTURE_DEFICIT), 5.0)
-        
-        # Test with missing data
-        self.coordinator.zones["zone1"] = {
-            "name": "Front Lawn",
-            "state": ZONE_STATE_IDLE,
-        }
-        attrs = sensor.extra_state_attributes
-        self.assertEqual(attrs.get(ATTR_CYCLE_COUNT), 0)
-        self.assertEqual(attrs.get(ATTR_CURRENT_CYCLE), 0)
-        self.assertEqual(attrs.get(ATTR_ESTIMATED_WATERING_DURATION), 0)
-        
-        
+    # Mock absorption learners
+    coordinator.absorption_learners = {"zone1": _FAKE_LEARNER}
+    
+    # Weather data
+    coordinator.daily_precipitation = 2.5
+    coordinator.daily_et = {"zone1": 3.0}
+    coordinator.rain_threshold = 3.0
+    coordinator.freeze_threshold = 36.0
+    
+    # Cycle time
+    coordinator.cycle_time = 15
+    return coordinator
+
+def test_zone_status_sensor(coordinator):
+    """Test the ZoneStatusSensor class."""
+    # Create an instance of the sensor
+    sensor = ZoneStatusSensor(coordinator, "zone1")
+    zone = coordinator.zones["zone1"]
+    
+    # Test initialization
+    assert sensor._attr_name == "Front Lawn Status"
+    assert sensor._attr_unique_id == f"{DOMAIN}_zone1_status"
+    assert sensor._attr_has_entity_name
+    
+    # Test properties
+    assert sensor.native_value == ZONE_STATE_IDLE
+    
+    # Change zone state and verify sensor updates
+    zone.state = ZONE_STATE_WATERING
+    assert sensor.native_value == ZONE_STATE_WATERING
+    
+    # Test icons
+    zone.state = ZONE_STATE_IDLE
+    assert sensor.icon == "mdi:water-off"
+    
+    zone.state = ZONE_STATE_WATERING
+    assert sensor.icon == "mdi:water"
+    
+    zone.state = ZONE_STATE_SOAKING
+    assert sensor.icon == "mdi:water-percent"
+    
+    zone.state = "unknown"
+    assert sensor.icon == "mdi:water-alert"
+    
+    zone.state = ZONE_STATE_MEASURING
+    assert sensor.icon == "mdi:gauge"
+    
+    # Test extra attributes
+    attrs = sensor.extra_state_attributes
+    assert attrs.get(ATTR_ZONE) == "Front Lawn"
+    assert attrs.get(ATTR_LAST_WATERED) == "2023-06-01T08:00:00"
+    assert attrs.get(ATTR_CYCLE_COUNT) == 3
+    assert attrs.get(ATTR_CURRENT_CYCLE) == 1
+    assert attrs.get(ATTR_ESTIMATED_WATERING_DURATION) == 45  # 3 cycles * 15 min
+    assert attrs.get(ATTR_MOISTURE_DEFICIT) == 5.0
+    
+    # Test with default data
+    coordinator.zones["zone1"] = ZoneRecord(name="Front Lawn")
+    attrs = sensor.extra_state_attributes
+    assert attrs.get(ATTR_CYCLE_COUNT) == 0
+    assert attrs.get(ATTR_CURRENT_CYCLE) == 0
+    assert attrs.get(ATTR_ESTIMATED_WATERING_DURATION) == 0
+
+
+def test_efficiency_sensor_reexports_history_on_revision_change(zone_control):
+    """The real sensor rebuilds its history export only when the history changes."""
+    sensor_module = load_component_module("sensor")
+    zone = zone_control.ZoneRecord(
+        name="Front Lawn",
+        switch="switch.front_lawn",
+        temp_sensor="sensor.front_lawn_temp",
+        moisture_sensor="sensor.front_lawn_moisture",
+    )
+    coordinator = MagicMock()
+    coordinator.zones = {"zone1": zone}
+    sensor = sensor_module.ZoneEfficiencySensor(coordinator, "zone1")
+    
+    zone.moisture_history.append(1696150800.0, 25.0)
+    first = sensor.extra_state_attributes[ATTR_MOISTURE_HISTORY]
+    assert first == [
+        {"timestamp": datetime.fromtimestamp(1696150800.0).isoformat(), "value": 25.0}
+    ]
+    # Unchanged history: the previous export is returned as is
+    assert sensor.extra_state_attributes[ATTR_MOISTURE_HISTORY] is first
+    
+    zone.moisture_history.append(1696151100.0, 27.5)
+    second = sensor.extra_state_attributes[ATTR_MOISTURE_HISTORY]
+    assert second is not first
+    assert [entry["value"] for entry in second] == [25.0, 27.5]
+    
+    zone.moisture_history.clear()
+    assert sensor.extra_state_attributes[ATTR_MOISTURE_HISTORY] == []
+
+
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__])
@@ -1,86 +1,91 @@
 #!/usr/bin/env python3
 """Test switch.py using direct testing."""
-import unittest
-import asyncio
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import MagicMock
+
+import pytest
 
 # Import test helpers
-from test_helpers import setup_test_env, load_component_module
+from test_helpers import setup_test_env
 
 # Setup the test environment
 setup_test_env()
 
-class TestSystemEnableSwitch(unittest.TestCase):
-    """Test the SystemEnableSwitch class."""
+@pytest.fixture
+def calls():
+    """Record enable/disable calls made on the coordinator."""
+    return []
+
+@pytest.fixture
+def coordinator(calls):
+    """Return a mock coordinator with plain enable/disable coroutines."""
+    coordinator = MagicMock()
+    coordinator.system_enabled = True
+    
+    # Count enable/disable calls with plain coroutines instead of AsyncMocks
+    async def _enable(*args, **kwargs):
+        calls.append("enable")
+    
+    async def _disable(*args, **kwargs):
+        calls.append("disable")
+    
+    coordinator.async_enable_system = _enable
+    coordinator.async_disable_system = _disable
+    return coordinator
+
+def test_switch_properties(coordinator):
+    """Test basic properties of the switch class."""
+    # Instead of mocking the switch, let's create a minimal implementation
+    class TestSwitch:
+        def __init__(self, coordinator):
+            self.coordinator = coordinator
+            self._attr_name = "Smart Sprinklers System"
+            
+        @property
+        def is_on(self):
+            """Return if the switch is on."""
+            return self.coordinator.system_enabled
     
-    def setUp(self):
-        """Set up for each test."""
-        self.coordinator = MagicMock()
-        self.coordinator.system_enabled = True
-        self.coordinator.async_enable_system = AsyncMock()
-        self.coordinator.async_disable_system = AsyncMock()
-        
-    # Helper for async tests
-    def async_test(coro):
-        def wrapper(*args, **kwargs):
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(coro(*args, **kwargs))
-        return wrapper
+    # Create an instance
+    switch = TestSwitch(coordinator)
+    
+    # Test properties
+    assert switch.coordinator is coordinator
+    assert switch._attr_name == "Smart Sprinklers System"
+    
+    # Test is_on property
+    coordinator.system_enabled = True
+    assert switch.is_on
+    
+    coordinator.system_enabled = False
+    assert not switch.is_on
 
-    def test_switch_properties(self):
-        """Test basic properties of the switch class."""
-        # Instead of mocking the switch, let's create a minimal implementation
-        class TestSwitch:
-            def __init__(self, coordinator):
-                self.coordinator = coordinator
-                self._attr_name = "Smart Sprinklers System"
-                
-            @property
-            def is_on(self):
-                """Return if the switch is on."""
-                return self.coordinator.system_enabled
-        
-        # Create an instance
-        switch = TestSwitch(self.coordinator)
-        
-        # Test properties
-        self.assertIs(switch.coordinator, self.coordinator)
-        self.assertEqual(switch._attr_name, "Smart Sprinklers System")
-        
-        # Test is_on property
-        self.coordinator.system_enabled = True
-        self.assertTrue(switch.is_on)
-        
-        self.coordinator.system_enabled = False
-        self.assertFalse(switch.is_on)
+async def test_switch_methods(coordinator, calls):
+    """Test the switch methods."""
+    # Define a minimal test implementation with async methods
+    class TestSwitch:
+        def __init__(self, coordinator):
+            self.coordinator = coordinator
+            self._attr_name = "Smart Sprinklers System"
+            
+        async def async_turn_on(self, **kwargs):
+            """Turn on the switch."""
+            await self.coordinator.async_enable_system()
+            
+        async def async_turn_off(self, **kwargs):
+            """Turn off the switch."""
+            await self.coordinator.async_disable_system()
+    
+    # Create an instance
+    switch = TestSwitch(coordinator)
+    
+    # Test turn_on method
+    await switch.async_turn_on()
+    assert calls == ["enable"]
+    
+    # Test turn_off method
+    await switch.async_turn_off()
+    assert calls == ["enable", "disable"]
 
-    @async_test
-    async def test_switch_methods(self):
-        """Test the switch methods."""
-        # Define a minimal test implementation with async methods
-        class TestSwitch:
-            def __init__(self, coordinator):
-                self.coordinator = coordinator
-                self._attr_name = "Smart Sprinklers System"
-                
-            async def async_turn_on(self, **kwargs):
-                """Turn on the switch."""
-                await self.coordinator.async_enable_system()
-                
-            async def async_turn_off(self, **kwargs):
-                """Turn off the switch."""
-                await self.coordinator.async_disable_system()
-        
-        # Create an instance
-        switch = TestSwitch(self.coordinator)
-        
-        # Test turn_on method
-        await switch.async_turn_on()
-        self.coordinator.async_enable_system.assert_called_once()
-        
-        # Test turn_off method
-        await switch.async_turn_off()
-        self.coordinator.async_disable_system.assert_called_once()
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__])
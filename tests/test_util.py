@@ -1,10 +1,9 @@
 #!/usr/bin/env python3
 """Test util.py using direct mocking."""
-import unittest
-import asyncio
-from unittest.mock import MagicMock, AsyncMock
+import pytest
 
 # Import test helpers
+from fakes import FakeHass
 from test_helpers import load_component_module, setup_test_env
 setup_test_env()
 
@@ -12,52 +11,29 @@ setup_test_env()
 util = load_component_module("util")
 fetch_forecast = util.fetch_forecast
 
-class TestUtil(unittest.TestCase):
-    """Test the utility functions."""
-    
-    # Helper for async tests
-    def async_test(coro):
-        def wrapper(*args, **kwargs):
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(coro(*args, **kwargs))
-        return wrapper
-    
-    @async_test
-    async def test_fetch_forecast_success(self):
-        """Test successful forecast fetch."""
-        # Setup mock Home Assistant
-        hass = MagicMock()
-        forecast_data = [{'datetime': '2023-10-01T12:00:00', 'temperature': 25, 'precipitation': 0}]
-        
-        # Setup the async_call response
-        service_response = {'weather.test_entity': {'forecast': forecast_data}}
-        hass.services.async_call = AsyncMock(return_value=service_response)
-        
-        # Call the function under test
-        result = await fetch_forecast(hass, 'weather.test_entity')
-        
-        # Verify results
-        hass.services.async_call.assert_called_once()
-        self.assertEqual(result, forecast_data)
-    
-    @async_test
-    async def test_fetch_forecast_no_data(self):
-        """Test when no forecast data is returned."""
-        hass = MagicMock()
-        hass.services.async_call = AsyncMock(return_value={})
-        
-        result = await fetch_forecast(hass, 'weather.test_entity')
-        self.assertEqual(result, [])
+FORECAST_DATA = [{'datetime': '2023-10-01T12:00:00', 'temperature': 25, 'precipitation': 0}]
+
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        ({'weather.test_entity': {'forecast': FORECAST_DATA}}, FORECAST_DATA),
+        ({}, []),
+        (Exception("Service call failed"), []),
+    ],
+    ids=["success", "no data", "exception"],
+)
+async def test_fetch_forecast(response, expected):
+    """Test forecast fetch for success, empty and failing service calls."""
+    hass = FakeHass()
+    if isinstance(response, Exception):
+        hass.services._error = response
+    else:
+        hass.services._response = response
     
-    @async_test
-    async def test_fetch_forecast_exception(self):
-        """Test handling exceptions during forecast fetch."""
-        hass = MagicMock()
-        hass.services.async_call = AsyncMock(side_effect=Exception("Service call failed"))
-        
-        result = await fetch_forecast(hass, 'weather.test_entity')
-        self.assertEqual(result, [])
+    result = await fetch_forecast(hass, 'weather.test_entity')
+    assert len(hass.services.calls) == 1
+    assert result == expected
 
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__])
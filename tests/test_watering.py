@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 """Test watering calculation algorithms."""
 import unittest
-import math
-from unittest.mock import MagicMock
 
 # Import test helpers
 from test_helpers import setup_test_env, load_component_module
@@ -13,11 +11,11 @@ setup_test_env()
 class TestWateringCalculations(unittest.TestCase):
     """Test the watering calculation functions."""
     
-    def setUp(self):
-        """Set up test environment."""
-        # Load the module
-        self.watering = load_component_module("algorithms/watering")
-        self.calculate_watering_duration = self.watering.calculate_watering_duration
+    @classmethod
+    def setUpClass(cls):
+        """Load the module once for the whole class."""
+        cls.watering = load_component_module("algorithms/watering")
+        cls.calculate_watering_duration = staticmethod(cls.watering.calculate_watering_duration)
     
     def test_calculate_watering_duration(self):
         """Test calculate_watering_duration function."""
@@ -1,79 +1,334 @@
 #!/usr/bin/env python3
 """Test weather.py using direct testing."""
-import unittest
 import asyncio
-from unittest.mock import MagicMock, AsyncMock
+import inspect
+import math
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
 
 # Import test helpers
-from test_helpers import setup_test_env, load_component_module
+from fakes import FakeHass, FakeState
+from test_helpers import setup_test_env, load_component_module, async_return
 
 # Setup the test environment
 setup_test_env()
 
-class TestWeatherFunctions(unittest.TestCase):
-    """Test basic weather module functionality."""
-    
-    def setUp(self):
-        """Set up test environment."""
-        # Load the module
-        self.weather = load_component_module("weather")
-        
-        # Create mocks
-        self.coordinator = MagicMock()
-        self.coordinator.hass = MagicMock()
-        self.coordinator.freeze_threshold = 36.0
-        self.coordinator.async_send_notification = MagicMock()
-    
-    def test_weather_module_structure(self):
-        """Test the structure of the weather module."""
-        # Check that WeatherManager class exists
-        self.assertTrue(hasattr(self.weather, "WeatherManager"))
-        
-        # Check source for key methods
-        with open(self.weather.__file__, 'r') as f:
-            source = f.read()
-            
-            # Check for important methods
-            self.assertIn("def is_rain_forecasted", source)
-            self.assertIn("def is_freezing_forecasted", source)
-            self.assertIn("async def async_update_forecast", source)
-            self.assertIn("async def async_calculate_et", source)
-    
-    def test_weather_manager_initialization(self):
-        """Test WeatherManager initialization."""
-        # Create a basic instance
-        weather_manager = self.weather.WeatherManager(self.coordinator)
-        
-        # Check initial properties
-        self.assertEqual(weather_manager.coordinator, self.coordinator)
-        self.assertIsNone(weather_manager.weather_entity)
-        self.assertIsNone(weather_manager.rain_sensor)
-        self.assertIsNotNone(weather_manager.rain_threshold)
-        self.assertFalse(weather_manager.forecast_valid)
-    
-    # Helper for async tests
-    def async_test(coro):
-        def wrapper(*args, **kwargs):
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(coro(*args, **kwargs))
-        return wrapper
-    
-    @async_test
-    async def test_forecast_with_empty_data(self):
-        """Test forecast handling with empty data."""
-        weather_manager = self.weather.WeatherManager(self.coordinator)
-        
-        # Test with empty forecast data
-        weather_manager.forecast_data = []
-        weather_manager.forecast_valid = False
-        
-        # This should not raise exceptions
-        result = weather_manager.is_rain_forecasted()
-        self.assertFalse(result)
-        
-        result = weather_manager.is_freezing_forecasted()
-        self.assertFalse(result)
+@pytest.fixture(scope="module")
+def weather():
+    """Load the weather module once for the whole file."""
+    return load_component_module("weather")
+
+# Fixed clock for every test in this file, in the same spirit as freezegun
+FROZEN_NOW = datetime(2023, 10, 1, 12, 0, tzinfo=timezone.utc)
+SOON = "2023-10-01T14:00:00+00:00"
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns FROZEN_NOW."""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW if tz else FROZEN_NOW.replace(tzinfo=None)
+
+@pytest.fixture(autouse=True)
+def frozen_time(weather, monkeypatch):
+    """Freeze both clocks the weather module reads."""
+    monkeypatch.setattr(weather.dt_util, "now", lambda time_zone=None: FROZEN_NOW)
+    monkeypatch.setattr(weather, "datetime", _FrozenDatetime)
+
+@pytest.fixture
+def coordinator():
+    """Return a mock coordinator."""
+    coordinator = MagicMock()
+    coordinator.hass = MagicMock()
+    coordinator.async_send_notification = async_return()
+    coordinator.freeze_threshold = 36.0
+    return coordinator
+
+def _push_weather(weather_manager, attributes):
+    """Deliver a weather entity state change to the manager."""
+    weather_manager._on_weather_changed(
+        SimpleNamespace(data={"new_state": FakeState(attributes=attributes)})
+    )
+
+@pytest.fixture
+def forecast_manager(weather, coordinator):
+    """Return a factory for WeatherManagers holding a valid forecast."""
+    def _forecast_manager(forecast):
+        weather_manager = weather.WeatherManager(coordinator)
+        weather_manager.hass = FakeHass()
+        weather_manager.weather_entity = "weather.home"
+        weather_manager.weather_available = True
+        weather_manager.forecast_valid = True
+        weather_manager.forecast_data = forecast
+        return weather_manager
+    return _forecast_manager
+
+def test_weather_module_structure(weather):
+    """Test the structure of the weather module."""
+    # Check that WeatherManager class exists
+    WeatherManager = getattr(weather, "WeatherManager", None)
+    assert WeatherManager is not None
+    
+    # Check for important methods
+    assert callable(getattr(WeatherManager, "is_rain_forecasted", None))
+    assert callable(getattr(WeatherManager, "is_freezing_forecasted", None))
+    assert inspect.iscoroutinefunction(getattr(WeatherManager, "async_update_forecast", None))
+    assert inspect.iscoroutinefunction(getattr(WeatherManager, "async_calculate_et", None))
+
+def test_weather_manager_initialization(weather, coordinator):
+    """Test WeatherManager initialization."""
+    # Create a basic instance
+    weather_manager = weather.WeatherManager(coordinator)
+    
+    # Check initial properties
+    assert weather_manager.coordinator is coordinator
+    assert weather_manager.weather_entity is None
+    assert weather_manager.rain_sensor is None
+    assert weather_manager.rain_threshold is not None
+    assert not weather_manager.forecast_valid
+
+@pytest.mark.parametrize("method", ["is_rain_forecasted", "is_freezing_forecasted"])
+def test_early_return_no_forecast(weather, coordinator, method):
+    """Test both checks return False without a valid forecast."""
+    weather_manager = weather.WeatherManager(coordinator)
+    
+    # Test with empty forecast data
+    weather_manager.forecast_data = []
+    weather_manager.forecast_valid = False
+    
+    # This should not raise exceptions
+    assert getattr(weather_manager, method)() is False
+
+def test_freeze_fallback_month_read_once_per_hour(weather, coordinator, monkeypatch):
+    """Test the winter fallback reuses the month within the same hour."""
+    reads = []
+    
+    class _January(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            reads.append(1)
+            return datetime(2024, 1, 15, 12, 0)
+    
+    monkeypatch.setattr(weather, "datetime", _January)
+    weather_manager = weather.WeatherManager(coordinator)
+    
+    assert weather_manager.is_freezing_forecasted()
+    assert weather_manager.is_freezing_forecasted()
+    assert len(reads) == 1
+
+def test_is_rain_forecasted_with_rain(forecast_manager):
+    """Test rain detection within the forecast window."""
+    weather_manager = forecast_manager([{"datetime": SOON, "precipitation": 10.0}])
+    assert weather_manager.is_rain_forecasted()
+    
+    weather_manager.forecast_data = [{"datetime": SOON, "precipitation": 0.0}]
+    assert not weather_manager.is_rain_forecasted()
+
+def test_is_rain_forecasted_sums_exactly(forecast_manager):
+    """Test many small amounts adding up to the threshold count as rain."""
+    weather_manager = forecast_manager([{"datetime": SOON, "precipitation": 0.1}] * 10)
+    weather_manager.rain_threshold = 1.0
+    assert weather_manager.is_rain_forecasted()
+
+def test_forecast_columns_skip_unusable_entries(forecast_manager):
+    """Test entries are validated and coerced once at ingest."""
+    weather_manager = forecast_manager([
+        {"precipitation": 10.0},
+        {"datetime": "not a date", "precipitation": 10.0},
+        {"datetime": SOON, "precipitation": "n/a", "temperature": 60.0},
+        {"datetime": SOON, "precipitation": "2.5", "temperature": "n/a"},
+    ])
+    
+    assert len(weather_manager._forecast_times) == 2
+    assert weather_manager._forecast_precip == (0.0, 2.5)
+    assert weather_manager._forecast_temps[0] == 60.0
+    assert math.isnan(weather_manager._forecast_temps[1])
+    
+    weather_manager.rain_threshold = 2.5
+    assert weather_manager.is_rain_forecasted()
+    assert not weather_manager.is_freezing_forecasted()
+
+def test_is_freezing_forecasted_with_freezing(forecast_manager):
+    """Test freeze detection within the forecast window."""
+    weather_manager = forecast_manager([{"datetime": SOON, "temperature": 30.0}])
+    assert weather_manager.is_freezing_forecasted()
+    
+    weather_manager.forecast_data = [{"datetime": SOON, "temperature": 60.0}]
+    assert not weather_manager.is_freezing_forecasted()
+
+
+def test_rain_result_cached_until_window_changes(weather, forecast_manager, monkeypatch):
+    """Test the rain check is reused until an entry leaves or enters the window."""
+    weather_manager = forecast_manager([{"datetime": SOON, "precipitation": 10.0}])
+    assert weather_manager.is_rain_forecasted()
+    
+    # Same window contents: the cached answer is returned without rescanning
+    weather_manager._forecast_precip = (0.0,)
+    assert weather_manager.is_rain_forecasted()
+    
+    # Once the clock passes the entry it drops out and the check is redone
+    later = FROZEN_NOW + timedelta(hours=3)
+    monkeypatch.setattr(weather.dt_util, "now", lambda time_zone=None: later)
+    assert not weather_manager.is_rain_forecasted()
+    
+    # Replacing the forecast clears the cache
+    weather_manager.forecast_data = [{"datetime": later.isoformat(), "precipitation": 10.0}]
+    assert weather_manager.is_rain_forecasted()
+
+async def test_async_calculate_et_sets_every_zone(forecast_manager, coordinator):
+    """Test the adjusted ET is applied to each zone."""
+    coordinator.zones = {"zone1": object(), "zone2": object()}
+    coordinator.daily_et = {}
+    weather_manager = forecast_manager([])
+    _push_weather(weather_manager, {"temperature": 30, "humidity": 30})
+    
+    await weather_manager.async_calculate_et()
+    
+    # Hot and dry: 5.0mm reference * 1.3 * 1.2
+    assert coordinator.daily_et == {"zone1": pytest.approx(7.8), "zone2": pytest.approx(7.8)}
+
+async def test_async_daily_update_applies_et_and_rain(forecast_manager, coordinator):
+    """Test one daily update adds ET, subtracts rain and resets the counters."""
+    zone = MagicMock(moisture_deficit=1.0)
+    coordinator.zones = {"zone1": zone}
+    coordinator.daily_et = {"stale": 3.0}
+    weather_manager = forecast_manager([])
+    _push_weather(weather_manager, {"temperature": 30, "humidity": 30, "precipitation": 2.0})
+    
+    await weather_manager.async_daily_update()
+    
+    assert zone.moisture_deficit == pytest.approx(1.0 + 7.8 - 2.0)
+    assert coordinator.daily_et == {"zone1": 0.0}
+    assert coordinator.daily_precipitation == 0.0
 
+@pytest.mark.parametrize("temp,humidity,expected", [
+    (10, 40, 5.0),
+    (25, 70, 5.0),
+    (9.9, 70.1, 2.4),
+])
+async def test_async_calculate_et_band_edges(forecast_manager, coordinator, temp, humidity, expected):
+    """Test band boundaries stay neutral and values past them adjust ET."""
+    coordinator.zones = {"zone1": object()}
+    coordinator.daily_et = {}
+    weather_manager = forecast_manager([])
+    _push_weather(weather_manager, {"temperature": temp, "humidity": humidity})
+    
+    await weather_manager.async_calculate_et()
+    
+    assert coordinator.daily_et == {"zone1": pytest.approx(expected)}
+
+async def test_check_and_update_forecast_respects_ttl(weather, coordinator):
+    """Test the forecast is only refetched once its TTL has expired."""
+    weather_manager = weather.WeatherManager(coordinator)
+    updates = []
+    
+    async def _update():
+        updates.append(1)
+        weather_manager._last_update["forecast"] = weather.time.monotonic()
+    
+    weather_manager.async_update_forecast = _update
+    
+    await weather_manager.check_and_update_forecast()
+    await weather_manager.check_and_update_forecast()
+    assert len(updates) == 1
+    
+    weather_manager._ttls["forecast"] = -1
+    await weather_manager.check_and_update_forecast()
+    assert len(updates) == 2
+
+async def test_concurrent_forecast_updates_share_one_fetch(weather, forecast_manager, monkeypatch):
+    """Test concurrent update calls wait on the update already in flight."""
+    weather_manager = forecast_manager([])
+    _push_weather(weather_manager, {})
+    fetches = []
+    
+    async def _fetch_forecast(hass, weather_entity):
+        fetches.append(weather_entity)
+        await asyncio.sleep(0)
+        return [{"datetime": SOON, "precipitation": 10.0}]
+    
+    monkeypatch.setattr(weather, "fetch_forecast", _fetch_forecast)
+    
+    await asyncio.gather(*(weather_manager.async_update_forecast() for _ in range(3)))
+    assert fetches == ["weather.home"]
+    assert weather_manager.forecast_valid
+    assert weather_manager._inflight is None
+    
+    # The next update after the first completes fetches again
+    await weather_manager.async_update_forecast()
+    assert len(fetches) == 2
+
+async def test_weather_attributes_follow_state_changes(forecast_manager):
+    """Test the weather entity is read once at setup and then pushed."""
+    weather_manager = forecast_manager([{"datetime": SOON, "temperature": 60.0}])
+    states = weather_manager.hass.states
+    states._store["weather.home"] = FakeState(attributes={"temperature": 60.0})
+    
+    await weather_manager.setup({"weather_entity": "weather.home"})
+    assert weather_manager.weather_available
+    assert not weather_manager.is_freezing_forecasted()
+    
+    _push_weather(weather_manager, {"temperature": 30.0})
+    assert weather_manager.is_freezing_forecasted()
+    assert states.lookups.count("weather.home") == 1
+    
+    weather_manager._on_weather_changed(SimpleNamespace(data={"new_state": None}))
+    assert not weather_manager.weather_available
+
+async def test_daily_update_runs_at_midnight(weather, coordinator, monkeypatch):
+    """Test setup schedules the daily update at midnight and unload cancels it."""
+    tracked = []
+    cancelled = []
+    
+    def _track_time_change(hass, action, **time_fields):
+        tracked.append((action, time_fields))
+        return lambda: cancelled.append(action)
+    
+    monkeypatch.setattr(weather, "async_track_time_change", _track_time_change)
+    weather_manager = weather.WeatherManager(coordinator)
+    weather_manager.hass = FakeHass()
+    
+    await weather_manager.setup({})
+    assert tracked == [(weather_manager.async_daily_update, {"hour": 0, "minute": 0, "second": 0})]
+    
+    await weather_manager.async_unload()
+    assert cancelled == [weather_manager.async_daily_update]
+
+async def test_saved_forecast_restored_within_ttl(weather, coordinator, monkeypatch):
+    """Test a saved forecast is reused after a restart until its TTL expires."""
+    hass = FakeHass()
+    hass.states._store["weather.saved"] = FakeState()
+    fetches = []
+    
+    async def _fetch_forecast(hass, weather_entity):
+        fetches.append(weather_entity)
+        return [{"datetime": SOON, "precipitation": 10.0}]
+    
+    monkeypatch.setattr(weather, "fetch_forecast", _fetch_forecast)
+    
+    async def _start():
+        coordinator.hass = hass
+        weather_manager = weather.WeatherManager(coordinator)
+        await weather_manager.setup({"weather_entity": "weather.saved"})
+        await weather_manager.check_and_update_forecast()
+        return weather_manager
+    
+    first = await _start()
+    assert fetches == ["weather.saved"]
+    await first.async_unload()
+    
+    restored = await _start()
+    assert fetches == ["weather.saved"]
+    assert restored.forecast_valid
+    assert restored.is_rain_forecasted()
+    
+    later = FROZEN_NOW + timedelta(hours=2)
+    monkeypatch.setattr(weather.dt_util, "now", lambda time_zone=None: later)
+    await _start()
+    assert len(fetches) == 2
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    pytest.main([__file__])
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Test the zone record and its moisture history."""
+import pytest
+
+# Import test helpers
+from test_helpers import setup_test_env, load_package_module
+
+# Setup the test environment
+setup_test_env()
+
+@pytest.fixture(scope="module")
+def zone():
+    """Load the zone module once for the whole file."""
+    return load_package_module("zone_control.zone")
+
+def _fill(history, count, start=0):
+    """Append count readings with timestamp i and value 10 * i."""
+    for i in range(start, start + count):
+        history.append(float(i), 10.0 * i)
+
+def test_history_defaults_to_max_moisture_history(zone):
+    """The default capacity comes from MAX_MOISTURE_HISTORY."""
+    assert zone.MoistureHistory().maxlen == zone.MAX_MOISTURE_HISTORY
+
+def test_history_wraps_past_capacity(zone):
+    """Once full, each append overwrites the oldest reading."""
+    history = zone.MoistureHistory()
+    maxlen = zone.MAX_MOISTURE_HISTORY
+    _fill(history, maxlen + 5)
+    
+    assert len(history) == maxlen
+    assert history[0] == (5.0, 50.0)
+    assert history[-1] == (maxlen + 4.0, 10.0 * (maxlen + 4))
+    readings = list(history)
+    assert len(readings) == maxlen
+    assert readings[0] == (5.0, 50.0)
+    assert [ts for ts, _ in readings] == [float(i) for i in range(5, maxlen + 5)]
+
+def test_history_negative_index_when_full(zone):
+    """history[-2] is the reading before the latest once the buffer is full."""
+    history = zone.MoistureHistory(maxlen=3)
+    _fill(history, 3)
+    assert history[-2] == (1.0, 10.0)
+    
+    _fill(history, 2, start=3)
+    assert list(history) == [(2.0, 20.0), (3.0, 30.0), (4.0, 40.0)]
+    assert history[-2] == (3.0, 30.0)
+    assert history[-3] == (2.0, 20.0)
+    with pytest.raises(IndexError):
+        history[-4]
+    with pytest.raises(IndexError):
+        history[3]
+
+def test_history_clear_resets_length_and_bumps_revision(zone):
+    """clear() empties the buffer and still counts as a change."""
+    history = zone.MoistureHistory(maxlen=3)
+    _fill(history, 5)
+    revision = history.revision
+    
+    history.clear()
+    
+    assert len(history) == 0
+    assert list(history) == []
+    assert history.revision == revision + 1
+    
+    history.append(7.0, 70.0)
+    assert list(history) == [(7.0, 70.0)]
+    assert history[-1] == (7.0, 70.0)
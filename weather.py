@@ -1,20 +1,52 @@
 """Weather-related functionality for Smart Sprinklers."""
+import asyncio
+import bisect
+import functools
 import logging
+import math
+import time
 from datetime import datetime, timedelta
 
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_state_change_event, async_track_time_change
+from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    DOMAIN,
     CONF_WEATHER_ENTITY,
     CONF_RAIN_SENSOR,
     CONF_RAIN_THRESHOLD,
+    CONF_FORECAST_TTL,
     DEFAULT_RAIN_THRESHOLD,
+    DEFAULT_FORECAST_TTL,
 )
 
 from .util import fetch_forecast
 
 _LOGGER = logging.getLogger(__name__)
 
+# Version of the persisted forecast snapshot
+_STORAGE_VERSION = 1
+
+# ET adjustment bands, looked up with bisect_right. Low temperature (<10)
+# reduces ET, high (>25) increases it; high humidity (>70) reduces ET, low
+# (<40) increases it. The upper edges are nudged up so the band boundaries
+# themselves (25 and 70) stay in the neutral middle band.
+_TEMP_EDGES = (10.0, math.nextafter(25.0, math.inf))
+_TEMP_FACTORS = (0.6, 1.0, 1.3)
+_HUMIDITY_EDGES = (40.0, math.nextafter(70.0, math.inf))
+_HUMIDITY_FACTORS = (1.2, 1.0, 0.8)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_dt(dt_str):
+    """Parse a forecast timestamp, reusing the result for repeated strings.
+
+    Hourly refetches return mostly the same slots, so the cache is kept
+    across forecasts; its bound keeps memory flat.
+    """
+    return dt_util.parse_datetime(dt_str)
+
 class WeatherManager:
     """Manage weather-related functionality for Smart Sprinklers."""
     
@@ -24,13 +56,106 @@ class WeatherManager:
         self.weather_entity = None
         self.rain_sensor = None
         self.rain_threshold = DEFAULT_RAIN_THRESHOLD
+        self._forecast_times = ()
+        self._forecast_precip = ()
+        self._forecast_temps = ()
+        # Predicate results for the current forecast, keyed by (hours, threshold)
+        self._rain_cache = {}
+        self._freeze_cache = {}
         self.forecast_data = None
-        self.last_forecast_update = None
+        # Wall-clock time of the last forecast, for logs only; staleness is
+        # decided on the monotonic clock in _last_update
+        self.last_forecast_update_wall = None
         self.forecast_valid = False
+        
+        # Per-field freshness: TTL in seconds and monotonic time of last refresh
+        self._ttls = {"forecast": DEFAULT_FORECAST_TTL}
+        self._last_update = {}
+        # Weather entity attributes, kept current by a state-change listener
+        self._weather_attrs = None
+        self._unsub_weather = None
+        self._unsub_daily_update = None
         self.weather_available = False
+        # Snapshot of the last forecast, restored on startup
+        self._store = None
         self.hass = coordinator.hass
-        self._update_lock = coordinator.hass.loop.create_lock()
+        # Future of the forecast update in progress, shared by concurrent callers
+        self._inflight = None
+        # Current month, re-read at most once per hour of the epoch
+        self._month_hour = None
+        self._month = None
+        
+    @property
+    def forecast_data(self):
+        """Return the raw forecast entries."""
+        return self._forecast_data
+
+    @forecast_data.setter
+    def forecast_data(self, forecast_data):
+        """Store the forecast and index it into parallel columns.
+
+        Entries without a usable datetime are dropped and the rest coerced to
+        floats once here: missing or invalid precipitation becomes 0.0 and
+        temperature NaN, which never compares below the freeze threshold. The
+        rain and freeze checks then walk the prepared columns without any
+        per-entry validation.
+        """
+        self._forecast_data = forecast_data
+        times = []
+        precip = []
+        temps = []
+        for forecast in forecast_data or ():
+            if "datetime" not in forecast:
+                continue
+            try:
+                forecast_time = _parse_dt(forecast["datetime"])
+            except (TypeError, ValueError):
+                forecast_time = None
+            if not forecast_time:
+                continue
+            
+            try:
+                precipitation = float(forecast["precipitation"])
+            except (KeyError, ValueError, TypeError):
+                precipitation = 0.0
+            try:
+                temperature = float(forecast["temperature"])
+            except (KeyError, ValueError, TypeError):
+                temperature = math.nan
+            
+            times.append(forecast_time)
+            precip.append(precipitation)
+            temps.append(temperature)
         
+        self._forecast_times = tuple(times)
+        self._forecast_precip = tuple(precip)
+        self._forecast_temps = tuple(temps)
+        self._rain_cache.clear()
+        self._freeze_cache.clear()
+    
+    def _window_bounds(self, now, forecast_window):
+        """Return when the set of entries inside [now, forecast_window] next changes.
+
+        The first value is the earliest entry inside the window (it drops out
+        once now passes it), the second the earliest entry after the window
+        (it moves in once the window end reaches it). Either may be None.
+        """
+        leaves = enters = None
+        for forecast_time in self._forecast_times:
+            if forecast_time < now:
+                continue
+            if forecast_time <= forecast_window:
+                if leaves is None or forecast_time < leaves:
+                    leaves = forecast_time
+            elif enters is None or forecast_time < enters:
+                enters = forecast_time
+        return leaves, enters
+    
+    @staticmethod
+    def _window_unchanged(leaves, enters, now, forecast_window):
+        """Return True if no entry has left or entered the window since it was cached."""
+        return (leaves is None or now <= leaves) and (enters is None or forecast_window < enters)
+
     async def setup(self, config):
         """Set up the weather manager with configuration."""
         # Get weather entity
@@ -41,70 +166,177 @@ class WeatherManager:
         # Get rain sensor and threshold configuration
         self.rain_sensor = config.get(CONF_RAIN_SENSOR)
         self.rain_threshold = config.get(CONF_RAIN_THRESHOLD, DEFAULT_RAIN_THRESHOLD)
+        self._ttls["forecast"] = config.get(CONF_FORECAST_TTL, DEFAULT_FORECAST_TTL)
         
         # Log the configuration
         _LOGGER.info("Smart Sprinklers weather configured with: Weather=%s, Rain Sensor=%s, Rain Threshold=%.1fmm",
                     self.weather_entity, self.rain_sensor, self.rain_threshold)
                     
+        # Drop the listeners from any previous setup before subscribing again
+        self._stop_listening()
+        
+        # Run the daily ET and deficit update at every local midnight
+        self._unsub_daily_update = async_track_time_change(
+            self.hass, self.async_daily_update, hour=0, minute=0, second=0
+        )
+        
         # Check if weather entity exists
         if self.weather_entity:
-            weather_state = self.hass.states.get(self.weather_entity)
-            self.weather_available = weather_state is not None
+            self._set_weather_state(self.hass.states.get(self.weather_entity))
             if not self.weather_available:
                 _LOGGER.warning("Weather entity %s not found - will check again later", self.weather_entity)
+            
+            # Follow the entity's state changes rather than looking it up
+            # again in every calculation
+            self._unsub_weather = async_track_state_change_event(
+                self.hass, [self.weather_entity], self._on_weather_changed
+            )
+            
+            self._store = Store(self.hass, _STORAGE_VERSION, f"{DOMAIN}_weather_{self.weather_entity}")
+            await self._async_restore_forecast()
+    
+    async def async_unload(self):
+        """Stop the daily update and weather listener and save the forecast."""
+        self._stop_listening()
+        await self._async_save_forecast()
+    
+    def _stop_listening(self):
+        """Stop the daily update and weather entity state listeners."""
+        if self._unsub_daily_update is not None:
+            self._unsub_daily_update()
+            self._unsub_daily_update = None
+        if self._unsub_weather is not None:
+            self._unsub_weather()
+            self._unsub_weather = None
+    
+    async def _async_restore_forecast(self):
+        """Load the saved forecast if it is still within its TTL."""
+        try:
+            data = await self._store.async_load()
+            if not data or not data.get("forecast") or not data.get("updated"):
+                return
+            
+            updated = _parse_dt(data.get("updated"))
+            if updated is None:
+                return
+            
+            age = (dt_util.now() - updated).total_seconds()
+            if not 0 <= age <= self._ttls["forecast"]:
+                _LOGGER.debug("Saved forecast from %s has expired", updated)
+                return
+            
+            self.forecast_data = data["forecast"]
+            self.last_forecast_update_wall = updated
+            # Carry the snapshot's age over to the monotonic clock so the TTL
+            # runs out when it would have without the restart
+            self._last_update["forecast"] = time.monotonic() - age
+            self.forecast_valid = True
+            _LOGGER.debug(
+                "Restored %d forecast entries from %s", len(self.forecast_data), updated
+            )
+        except Exception as e:
+            _LOGGER.error("Error restoring saved forecast: %s", e)
+    
+    async def _async_save_forecast(self):
+        """Save the current forecast so it survives a restart."""
+        if self._store is None or not self.forecast_valid or self.last_forecast_update_wall is None:
+            return
+        try:
+            await self._store.async_save({
+                "forecast": self.forecast_data,
+                "updated": self.last_forecast_update_wall.isoformat(),
+            })
+        except Exception as e:
+            _LOGGER.error("Error saving forecast: %s", e)
+    
+    def _set_weather_state(self, weather_state):
+        """Cache a copy of the weather entity's attributes."""
+        self.weather_available = weather_state is not None
+        self._weather_attrs = dict(weather_state.attributes) if weather_state is not None else None
+    
+    @callback
+    def _on_weather_changed(self, event):
+        """Handle a state change of the weather entity."""
+        self._set_weather_state(event.data.get("new_state"))
+    
+    def _is_stale(self, field):
+        """Return True if field has never been refreshed or its TTL has expired."""
+        last_update = self._last_update.get(field)
+        return last_update is None or time.monotonic() - last_update > self._ttls[field]
+    
+    def _current_month(self):
+        """Return the current month, re-reading the clock once per hour."""
+        hour = int(time.time() // 3600)
+        if hour != self._month_hour:
+            self._month = datetime.now().month
+            self._month_hour = hour
+        return self._month
     
     async def check_and_update_forecast(self):
         """Check if forecast needs updating and update if needed."""
-        # Update forecast if needed
-        forecast_age = (
-            datetime.now() - self.last_forecast_update
-            if self.last_forecast_update else timedelta(hours=1)
-        )
-        
-        if forecast_age > timedelta(hours=1):
+        # Only the forecast is refetched here; the current conditions are
+        # pushed by the weather entity's state-change listener
+        if self._is_stale("forecast"):
             await self.async_update_forecast()
     
     async def async_update_forecast(self, _=None):
         """Update weather forecast data."""
-        # Use lock to prevent multiple concurrent updates
-        async with self._update_lock:
-            try:
-                if not self.weather_entity:
-                    _LOGGER.warning("No weather entity configured, forecast data unavailable")
-                    self.forecast_valid = False
-                    return
-                
-                weather_state = self.hass.states.get(self.weather_entity)
-                if not weather_state:
-                    _LOGGER.warning("Weather entity %s not available", self.weather_entity)
-                    self.weather_available = False
-                    self.forecast_valid = False
-                    return
-                
-                self.weather_available = True
-                
-                # Try new API method first
-                forecast_data = await fetch_forecast(self.hass, self.weather_entity)
-                
-                # If new method fails, try legacy method as fallback
-                if not forecast_data:
-                    _LOGGER.debug("Using legacy method to get forecast data")
-                    forecast_data = weather_state.attributes.get("forecast", [])
-                
-                self.forecast_data = forecast_data
-                self.last_forecast_update = datetime.now()
-                
-                if not self.forecast_data:
-                    _LOGGER.warning("Weather entity %s has no forecast data", self.weather_entity)
-                    self.forecast_valid = False
-                else:
-                    _LOGGER.debug("Updated forecast data with %d entries", len(self.forecast_data))
-                    self.forecast_valid = True
-                
-            except Exception as e:
-                _LOGGER.error("Error updating forecast: %s", e)
-                self.forecast_valid = False
+        # Callers arriving while an update is running wait for that update
+        # instead of fetching the same forecast again
+        if self._inflight is not None:
+            return await asyncio.shield(self._inflight)
+        
+        self._inflight = asyncio.get_running_loop().create_future()
+        try:
+            await self._async_update_forecast()
+        finally:
+            inflight, self._inflight = self._inflight, None
+            inflight.set_result(None)
     
+    async def _async_update_forecast(self):
+        """Fetch the forecast and store it."""
+        try:
+            if not self.weather_entity:
+                _LOGGER.warning("No weather entity configured, forecast data unavailable")
+                self.forecast_valid = False
+                return
+            
+            attrs = self._weather_attrs
+            if attrs is None:
+                _LOGGER.warning("Weather entity %s not available", self.weather_entity)
+                self.weather_available = False
+                self.forecast_valid = False
+                return
+            
+            self.weather_available = True
+            
+            # Try new API method first
+            forecast_data = await fetch_forecast(self.hass, self.weather_entity)
+            
+            # If new method fails, try legacy method as fallback
+            if not forecast_data:
+                _LOGGER.debug("Using legacy method to get forecast data")
+                forecast_data = attrs.get("forecast", [])
+            
+            self.forecast_data = forecast_data
+            self.last_forecast_update_wall = dt_util.now()
+            self._last_update["forecast"] = time.monotonic()
+            
+            if not self.forecast_data:
+                _LOGGER.warning("Weather entity %s has no forecast data", self.weather_entity)
+                self.forecast_valid = False
+            else:
+                _LOGGER.debug(
+                    "Updated forecast data with %d entries at %s",
+                    len(self.forecast_data), self.last_forecast_update_wall
+                )
+                self.forecast_valid = True
+                await self._async_save_forecast()
+            
+        except Exception as e:
+            _LOGGER.error("Error updating forecast: %s", e)
+            self.forecast_valid = False
+
     def is_rain_forecasted(self, hours=24):
         """Check if rain is forecasted in the next n hours."""
         # If no forecast data or entity not available, default to False
@@ -119,29 +351,32 @@ class WeatherManager:
         try:
             now = dt_util.now()
             forecast_window = now + timedelta(hours=hours)
-            total_forecast_rain = 0.0
+            key = (hours, self.rain_threshold)
+            cached = self._rain_cache.get(key)
+            if cached is not None and self._window_unchanged(cached[2], cached[3], now, forecast_window):
+                exceeds_threshold, total_forecast_rain = cached[0], cached[1]
+                if exceeds_threshold:
+                    _LOGGER.info(
+                        "Total forecasted rain (%.2fmm) exceeds threshold (%.2fmm)",
+                        total_forecast_rain, self.rain_threshold
+                    )
+                return exceeds_threshold
             
-            for forecast in self.forecast_data:
-                if "datetime" not in forecast:
-                    continue
-                
-                forecast_time = dt_util.parse_datetime(forecast["datetime"])
-                if not forecast_time:
-                    continue
-                
-                if now <= forecast_time <= forecast_window:
-                    # Check if precipitation is forecasted
-                    if forecast.get("precipitation") is not None:
-                        try:
-                            precipitation = float(forecast["precipitation"])
-                            total_forecast_rain += precipitation
-                            if precipitation > 0:
-                                _LOGGER.debug(
-                                    "Rain forecasted at %s: %.2fmm", 
-                                    forecast_time.isoformat(), precipitation
-                                )
-                        except (ValueError, TypeError):
-                            pass
+            in_window = [
+                (forecast_time, precipitation)
+                for forecast_time, precipitation in zip(self._forecast_times, self._forecast_precip)
+                if now <= forecast_time <= forecast_window
+            ]
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                for forecast_time, precipitation in in_window:
+                    if precipitation > 0:
+                        _LOGGER.debug(
+                            "Rain forecasted at %s: %.2fmm", 
+                            forecast_time.isoformat(), precipitation
+                        )
+            
+            # fsum keeps many small amounts from drifting below the threshold
+            total_forecast_rain = math.fsum(precipitation for _, precipitation in in_window)
             
             # Return True if the total forecasted rain exceeds the threshold
             exceeds_threshold = total_forecast_rain >= self.rain_threshold
@@ -150,6 +385,9 @@ class WeatherManager:
                     "Total forecasted rain (%.2fmm) exceeds threshold (%.2fmm)",
                     total_forecast_rain, self.rain_threshold
                 )
+            self._rain_cache[key] = (
+                exceeds_threshold, total_forecast_rain, *self._window_bounds(now, forecast_window)
+            )
             return exceeds_threshold
         except Exception as e:
             _LOGGER.error("Error checking rain forecast: %s", e)
@@ -162,7 +400,7 @@ class WeatherManager:
         if not self.forecast_valid or not self.weather_available:
             # Check if we're in winter (Northern Hemisphere assumption)
             # For a more robust solution, this should be made configurable
-            month = datetime.now().month
+            month = self._current_month()
             if month in [11, 12, 1, 2, 3]:  # Nov-Mar
                 _LOGGER.info("No valid forecast in winter month - assuming freezing risk")
                 return True
@@ -177,35 +415,36 @@ class WeatherManager:
             forecast_window = now + timedelta(hours=hours)
             
             # Check current temperature
-            weather_state = self.hass.states.get(self.weather_entity)
-            if weather_state:
-                try:
-                    current_temp = weather_state.attributes.get("temperature")
-                    if current_temp is not None and current_temp <= self.coordinator.freeze_threshold:
-                        _LOGGER.info(
-                            "Current temperature %.1f°F is below freeze threshold %.1f°F",
-                            current_temp, self.coordinator.freeze_threshold
-                        )
-                        return True
-                except (TypeError, ValueError):
-                    pass  # Skip if current temperature isn't available
+            try:
+                current_temp = (self._weather_attrs or {}).get("temperature")
+                if current_temp is not None and current_temp <= self.coordinator.freeze_threshold:
+                    _LOGGER.info(
+                        "Current temperature %.1f°F is below freeze threshold %.1f°F",
+                        current_temp, self.coordinator.freeze_threshold
+                    )
+                    return True
+            except (TypeError, ValueError):
+                pass  # Skip if current temperature isn't available
             
-            for forecast in self.forecast_data:
-                if "datetime" not in forecast or "temperature" not in forecast:
-                    continue
-                
-                forecast_time = dt_util.parse_datetime(forecast["datetime"])
-                if not forecast_time:
-                    continue
-                
-                if now <= forecast_time <= forecast_window:
-                    temp = forecast["temperature"]
-                    if temp <= self.coordinator.freeze_threshold:
-                        _LOGGER.info(
-                            "Freezing forecast at %s: %.1f°F (threshold: %.1f°F)",
-                            forecast_time.isoformat(), temp, self.coordinator.freeze_threshold
-                        )
-                        return True
+            key = (hours, self.coordinator.freeze_threshold)
+            cached = self._freeze_cache.get(key)
+            if cached is None or not self._window_unchanged(cached[2], cached[3], now, forecast_window):
+                freezing = (None, None)
+                freeze_threshold = self.coordinator.freeze_threshold
+                for forecast_time, temp in zip(self._forecast_times, self._forecast_temps):
+                    if temp <= freeze_threshold and now <= forecast_time <= forecast_window:
+                        freezing = (forecast_time, temp)
+                        break
+                cached = (*freezing, *self._window_bounds(now, forecast_window))
+                self._freeze_cache[key] = cached
+            
+            forecast_time, temp = cached[0], cached[1]
+            if forecast_time is not None:
+                _LOGGER.info(
+                    "Freezing forecast at %s: %.1f°F (threshold: %.1f°F)",
+                    forecast_time.isoformat(), temp, self.coordinator.freeze_threshold
+                )
+                return True
         except Exception as e:
             _LOGGER.error("Error checking freezing forecast: %s", e)
             # Default to True (don't water) to be safe in case of error checking freezing
@@ -218,72 +457,58 @@ class WeatherManager:
         _LOGGER.info("Performing daily moisture deficit update")
         
         try:
-            # Calculate evapotranspiration and precipitation
-            await self.async_calculate_et()
-            await self.async_calculate_precipitation()
+            # Every zone shares one ET and one precipitation figure, so both
+            # are computed once and the deficits updated in a single pass
+            zone_et = self._compute_adjusted_et()
+            effective_rain = self._compute_precipitation()
             
-            # Update moisture deficits for each zone
+            # Update moisture deficits for each zone, resetting its daily
+            # ET counter as we go
+            daily_et = {}
             for zone_id, zone in self.coordinator.zones.items():
-                zone_et = self.coordinator.daily_et.get(zone_id, 0.0)
-                effective_rain = self.coordinator.daily_precipitation
-                
                 # Update moisture deficit
                 # ET increases deficit, precipitation decreases it
                 # Negative deficit means surplus moisture
-                old_deficit = zone.get("moisture_deficit", 0.0)
+                old_deficit = zone.moisture_deficit
                 new_deficit = old_deficit + zone_et - effective_rain
                 
                 # Ensure deficit isn't negative (would mean excess water beyond field capacity)
-                zone["moisture_deficit"] = max(0.0, new_deficit)
+                zone.moisture_deficit = max(0.0, new_deficit)
+                daily_et[zone_id] = 0.0
                 
                 _LOGGER.info(
                     "Zone %s: ET=%.2fmm, Rain=%.2fmm, Old deficit=%.2fmm, New deficit=%.2fmm",
-                    zone["name"], zone_et, effective_rain, old_deficit, zone["moisture_deficit"]
+                    zone.name, zone_et, effective_rain, old_deficit, zone.moisture_deficit
                 )
             
             # Reset daily counters
-            self.coordinator.daily_et = {zone_id: 0.0 for zone_id in self.coordinator.zones}
+            self.coordinator.daily_et = daily_et
             self.coordinator.daily_precipitation = 0.0
-            
-            # Schedule next daily update
-            next_midnight = (dt_util.now() + timedelta(days=1)).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            
-            _LOGGER.info("Next daily ET update scheduled for %s", next_midnight)
-            self.coordinator._unsub_daily_update = self.hass.helpers.event.async_call_later(
-                (next_midnight - dt_util.now()).total_seconds(),
-                self.async_daily_update
-            )
         except Exception as e:
+            # The next midnight trigger runs the update again
             _LOGGER.error("Error in daily update: %s", e)
-            # Schedule next retry in 1 hour
-            _LOGGER.info("Will retry daily update in 1 hour")
-            self.coordinator._unsub_daily_update = self.hass.helpers.event.async_call_later(
-                3600,  # 1 hour in seconds
-                self.async_daily_update
-            )
 
     async def async_calculate_et(self):
-        """Calculate evapotranspiration based on weather data."""
+        """Calculate evapotranspiration and apply it to every zone."""
+        self.coordinator.daily_et.update(
+            dict.fromkeys(self.coordinator.zones, self._compute_adjusted_et())
+        )
+
+    def _compute_adjusted_et(self):
+        """Return today's ET in mm, estimated from the weather data."""
         if not self.weather_entity or not self.weather_available:
             _LOGGER.warning("No weather entity or not available, using default ET values")
-            # Set default ET for each zone (5mm per day is a typical reference value)
-            for zone_id in self.coordinator.zones:
-                self.coordinator.daily_et[zone_id] = 5.0
-            return
+            # Default ET for each zone (5mm per day is a typical reference value)
+            return 5.0
             
         try:
             # Get weather data
-            weather_state = self.hass.states.get(self.weather_entity)
-            if not weather_state:
+            attrs = self._weather_attrs
+            if attrs is None:
                 _LOGGER.warning("Weather entity not found, using default ET values")
-                for zone_id in self.coordinator.zones:
-                    self.coordinator.daily_et[zone_id] = 5.0
-                return
+                return 5.0
                 
             # Use weather data to estimate ET
-            attrs = weather_state.attributes
             temp = attrs.get("temperature")
             humidity = attrs.get("humidity")
             
@@ -292,56 +517,45 @@ class WeatherManager:
             # Penman-Monteith equation or similar, but that requires more data
             reference_et = 5.0  # Default reference ET (mm/day)
             
-            if temp is not None and humidity is not None:
-                try:
-                    t = float(temp)
-                    h = float(humidity)
-                    
-                    # Adjust reference ET based on temperature and humidity
-                    # Higher temp -> more ET, higher humidity -> less ET
-                    temp_factor = 1.0
-                    if t < 10:
-                        temp_factor = 0.6  # Low temperature reduces ET
-                    elif t > 25:
-                        temp_factor = 1.3  # High temperature increases ET
-                        
-                    humidity_factor = 1.0
-                    if h > 70:
-                        humidity_factor = 0.8  # High humidity reduces ET
-                    elif h < 40:
-                        humidity_factor = 1.2  # Low humidity increases ET
-                        
-                    adjusted_et = reference_et * temp_factor * humidity_factor
-                    
-                    # Apply to each zone with crop coefficient
-                    for zone_id, zone in self.coordinator.zones.items():
-                        # Default crop coefficient of 1.0
-                        # Could be customized per zone type in the future
-                        crop_coefficient = 1.0  
-                        self.coordinator.daily_et[zone_id] = adjusted_et * crop_coefficient
-                        
-                    _LOGGER.info(
-                        "Calculated ET: %.2fmm (temp=%.1f°C, humidity=%.1f%%)",
-                        adjusted_et, t, h
-                    )
-                    
-                except (ValueError, TypeError) as e:
-                    _LOGGER.warning("Error calculating ET from weather data: %s", e)
-                    for zone_id in self.coordinator.zones:
-                        self.coordinator.daily_et[zone_id] = reference_et
-            else:
+            if temp is None or humidity is None:
                 _LOGGER.warning("Incomplete weather data, using default ET")
-                for zone_id in self.coordinator.zones:
-                    self.coordinator.daily_et[zone_id] = reference_et
+                return reference_et
+            
+            try:
+                t = float(temp)
+                h = float(humidity)
+            except (ValueError, TypeError) as e:
+                _LOGGER.warning("Error calculating ET from weather data: %s", e)
+                return reference_et
+            
+            # Adjust reference ET based on temperature and humidity
+            # Higher temp -> more ET, higher humidity -> less ET
+            temp_factor = _TEMP_FACTORS[bisect.bisect_right(_TEMP_EDGES, t)]
+            humidity_factor = _HUMIDITY_FACTORS[bisect.bisect_right(_HUMIDITY_EDGES, h)]
+            
+            adjusted_et = reference_et * temp_factor * humidity_factor
+            
+            _LOGGER.info(
+                "Calculated ET: %.2fmm (temp=%.1f°C, humidity=%.1f%%)",
+                adjusted_et, t, h
+            )
+            
+            # Default crop coefficient of 1.0 for every zone
+            # Could be customized per zone type in the future
+            crop_coefficient = 1.0
+            return adjusted_et * crop_coefficient
                     
         except Exception as e:
             _LOGGER.error("Error in ET calculation: %s", e)
             # Fallback to default
-            for zone_id in self.coordinator.zones:
-                self.coordinator.daily_et[zone_id] = 5.0
+            return 5.0
     
     async def async_calculate_precipitation(self):
         """Calculate precipitation from rain sensor and forecast."""
+        self.coordinator.daily_precipitation = self._compute_precipitation()
+    
+    def _compute_precipitation(self):
+        """Return today's precipitation in mm from the rain sensor or weather entity."""
         precipitation = 0.0
         
         # Check rain sensor if configured
@@ -363,12 +577,12 @@ class WeatherManager:
         # If no rain sensor or invalid reading, try to get precipitation from weather entity
         if precipitation <= 0 and self.weather_entity and self.weather_available:
             try:
-                weather_state = self.hass.states.get(self.weather_entity)
-                if weather_state:
+                attrs = self._weather_attrs
+                if attrs is not None:
                     # Some weather entities provide recent precipitation
-                    if "precipitation" in weather_state.attributes:
+                    if "precipitation" in attrs:
                         try:
-                            precip = weather_state.attributes.get("precipitation")
+                            precip = attrs.get("precipitation")
                             if precip is not None:
                                 precipitation = float(precip)
                                 _LOGGER.info(
@@ -381,7 +595,4 @@ class WeatherManager:
                 _LOGGER.error("Error getting precipitation from weather entity: %s", e)
                 
         # Safety bounds - precipitation shouldn't be negative
-        precipitation = max(0.0, precipitation)
-                
-        # Store the calculated precipitation
-        self.coordinator.daily_precipitation = precipitation
\ No newline at end of file
+        return max(0.0, precipitation)
\ No newline at end of file
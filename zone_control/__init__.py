@@ -1,7 +1,9 @@
 """Zone control functionality for Smart Sprinklers."""
 import asyncio
 import logging
-from datetime import datetime
+from collections import deque
+
+from homeassistant.util import dt as dt_util
 
 from ..const import (
     CONF_ZONES,
@@ -25,6 +27,7 @@ from .processor import ZoneProcessor
 from .scheduler import Scheduler
 from .queue_manager import QueueManager
 from .tracker import StateTracker
+from .zone import ZoneRecord
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,8 +41,11 @@ class ZoneController:
         
         # Modified zone tracking to support interleaving
         self.active_zone = None  # The zone that is currently watering
-        self.soaking_zones = {}  # Dict of zone_id -> {"ready_at": timestamp, "pre_soak_moisture": value, "cancel_callback": func}
-        self.zone_queue = []
+        self.soaking_zones = {}  # Dict of zone_id -> soak state (ready_at, pre_soak_moisture)
+        # Zones waiting to water, in order; _queued_ids mirrors its contents
+        # for constant-time membership checks
+        self.zone_queue = deque()
+        self._queued_ids = set()
         self._process_queue_lock = asyncio.Lock()  # Lock for queue processing
         self._stop_requested = False  # Flag to signal stopping was requested
         
@@ -49,6 +55,45 @@ class ZoneController:
         self.queue_manager = QueueManager(self)
         self.tracker = StateTracker(self)
         
+    def get_learner(self, zone_id, zone):
+        """Return the absorption learner for a zone.
+
+        Records not built by setup_zones are bound to the zone's entry in
+        coordinator.absorption_learners on first use.
+        """
+        learner = zone.learner
+        if learner is None:
+            learner = zone.learner = self.coordinator.absorption_learners[zone_id]
+        return learner
+    
+    def is_zone_queued(self, zone_id):
+        """Return True if zone_id is waiting in the watering queue."""
+        return zone_id in self._queued_ids
+    
+    def enqueue_zone(self, zone_id, front=False):
+        """Add zone_id to the back (or front) of the queue unless already queued."""
+        if zone_id in self._queued_ids:
+            return False
+        self._queued_ids.add(zone_id)
+        if front:
+            self.zone_queue.appendleft(zone_id)
+        else:
+            self.zone_queue.append(zone_id)
+        return True
+    
+    def pop_next_zone(self):
+        """Remove and return the zone at the front of the queue."""
+        zone_id = self.zone_queue.popleft()
+        self._queued_ids.discard(zone_id)
+        return zone_id
+    
+    def clear_zone_queue(self):
+        """Empty the watering queue."""
+        self.zone_queue.clear()
+        self._queued_ids.clear()
+        # Notices for the dropped zones must not go out after a stop or unload
+        self.queue_manager.cancel_queue_notices()
+        
     async def setup_zones(self, config):
         """Set up zones from configuration."""
         # Configure zones
@@ -61,41 +106,33 @@ class ZoneController:
             max_watering_time = max_watering_hours * 60 + max_watering_minutes
             
             # Configure the zone
-            self.coordinator.zones[zone_id] = {
-                "name": zone_config[CONF_ZONE_NAME],
-                "switch": zone_config[CONF_ZONE_SWITCH],
-                "temp_sensor": zone_config[CONF_ZONE_TEMP_SENSOR],
-                "moisture_sensor": zone_config[CONF_ZONE_MOISTURE_SENSOR],
-                "min_moisture": zone_config.get(
+            self.coordinator.zones[zone_id] = ZoneRecord(
+                name=zone_config[CONF_ZONE_NAME],
+                switch=zone_config[CONF_ZONE_SWITCH],
+                temp_sensor=zone_config[CONF_ZONE_TEMP_SENSOR],
+                moisture_sensor=zone_config[CONF_ZONE_MOISTURE_SENSOR],
+                min_moisture=zone_config.get(
                     CONF_ZONE_MIN_MOISTURE, DEFAULT_MIN_MOISTURE
                 ),
-                "max_moisture": zone_config.get(
+                max_moisture=zone_config.get(
                     CONF_ZONE_MAX_MOISTURE, DEFAULT_MAX_MOISTURE
                 ),
-                "max_watering_hours": max_watering_hours,
-                "max_watering_minutes": max_watering_minutes,
-                "max_watering_time": max_watering_time,
-                "state": ZONE_STATE_IDLE,
-                "last_watered": None,
-                "next_watering": None,
-                "cycle_count": 0,
-                "current_cycle": 0,
-                "moisture_history": [],
-                "soaking_efficiency": 0,
-                "moisture_deficit": 0.0,
-                "efficiency_factor": 1.0,  # Default efficiency factor
-                "watering_expected_increase": 0.0,
-                "last_check_time": datetime.now().isoformat(),  # Track last evaluation time
-            }
+                max_watering_hours=max_watering_hours,
+                max_watering_minutes=max_watering_minutes,
+                max_watering_time=max_watering_time,
+                last_check_time=dt_util.now().isoformat(),  # Track last evaluation time
+            )
             
             # Initialize daily ET for this zone
             self.coordinator.daily_et[zone_id] = 0.0
             
             # Initialize absorption learner for this zone
-            self.coordinator.absorption_learners[zone_id] = AbsorptionLearner()
+            learner = AbsorptionLearner()
+            self.coordinator.absorption_learners[zone_id] = learner
+            self.coordinator.zones[zone_id].learner = learner
             
-            # Set up moisture sensor state tracking for this zone
-            self.tracker.setup_moisture_tracking(zone_id)
+        # Set up moisture sensor state tracking for all zones with one listener
+        self.tracker.setup_moisture_tracking(*self.coordinator.zones)
             
         # Set up schedule monitoring if schedule entity is defined
         self.scheduler.setup_schedule_monitoring()
@@ -111,7 +148,7 @@ class ZoneController:
                 
                 # Restart processing if there's a queue and no active processing
                 if self.zone_queue and not self.coordinator._queue_processing_active:
-                    asyncio.create_task(self.queue_manager.process_queue())
+                    self.processor.wake_queue()
                     
                 _LOGGER.info("Sprinklers system enabled")
                 await self.coordinator.async_send_notification("Sprinklers system enabled")
@@ -148,7 +185,7 @@ class ZoneController:
                 # Set zone state to idle
                 if zone_id in self.coordinator.zones:
                     zone = self.coordinator.zones[zone_id]
-                    zone["state"] = ZONE_STATE_IDLE
+                    zone.state = ZONE_STATE_IDLE
                 
                 # Clear active zone
                 self.active_zone = None
@@ -157,21 +194,16 @@ class ZoneController:
                 # Still clear active zone to avoid getting stuck
                 self.active_zone = None
         
-        # Cancel all soaking timers and clean up soaking zones
-        for zone_id, data in list(self.soaking_zones.items()):
-            if "cancel_callback" in data and data["cancel_callback"] is not None:
-                try:
-                    data["cancel_callback"]()
-                except Exception as e:
-                    _LOGGER.error("Error cancelling callback for zone %s: %s", zone_id, e)
-                    
+        # Clean up soaking zones; their timers are cancelled with the rest below
+        for zone_id in self.soaking_zones:
             if zone_id in self.coordinator.zones:
-                self.coordinator.zones[zone_id]["state"] = ZONE_STATE_IDLE
+                self.coordinator.zones[zone_id].state = ZONE_STATE_IDLE
         
-        # Clear soaking zones dictionary
+        # Clear soaking zones dictionary and the queue manager's soak heap
         self.soaking_zones.clear()
+        self.queue_manager.clear_soak_tracking()
         
-        # Cancel all scheduled callbacks in processor
+        # Cancel all scheduled callbacks in processor, soak timers included
         try:
             await self.processor.cancel_all_callbacks()
         except Exception as e:
@@ -191,31 +223,39 @@ class ZoneController:
         # First set the stop flag
         self._stop_requested = True
         
-        # Try to turn off the active zone switch through the processor
-        if self.active_zone:
-            try:
-                await self.processor.turn_off_zone(self.active_zone)
-            except Exception as e:
-                _LOGGER.error("Error turning off active zone in emergency shutdown: %s", e)
-            
-        # As a failsafe, directly turn off all zone switches
-        for zone_id, zone in self.coordinator.zones.items():
-            try:
-                # Direct switch turn off bypassing processor
-                await self.hass.services.async_call(
-                    "switch", "turn_off", 
-                    {"entity_id": zone["switch"]},
-                    blocking=True
-                )
-                zone["state"] = ZONE_STATE_IDLE
-                _LOGGER.debug("Emergency turned off zone switch: %s", zone["name"])
-            except Exception as e:
-                _LOGGER.error("Failed to emergency turn off zone %s: %s", zone["name"], e)
+        # Turn off the active zone through the processor and, as a failsafe,
+        # every zone switch directly. All calls run concurrently so shutdown
+        # takes as long as the slowest switch rather than the sum of them.
+        active_zone = self.active_zone
+        zones = tuple(self.coordinator.zones.values())
+        calls = [
+            self.hass.services.async_call(
+                "switch", "turn_off",
+                {"entity_id": zone.switch},
+                blocking=True
+            )
+            for zone in zones
+        ]
+        if active_zone:
+            calls.insert(0, self.processor.turn_off_zone(active_zone))
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        
+        if active_zone:
+            active_result, *results = results
+            if isinstance(active_result, Exception):
+                _LOGGER.error("Error turning off active zone in emergency shutdown: %s", active_result)
+        for zone, result in zip(zones, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Failed to emergency turn off zone %s: %s", zone.name, result)
+            else:
+                zone.state = ZONE_STATE_IDLE
+                _LOGGER.debug("Emergency turned off zone switch: %s", zone.name)
         
         # Clear all state flags and tracking
         self.active_zone = None
         self.soaking_zones.clear()
-        self.zone_queue.clear()
+        self.queue_manager.clear_soak_tracking()
+        self.clear_zone_queue()
         self.coordinator._queue_processing_active = False
         self.coordinator._sprinklers_active = False
         self.coordinator._manual_operation_requested = False
@@ -233,21 +273,30 @@ class ZoneController:
         # Clean up tracker resources
         await self.tracker.unload()
         
+        # Stop schedule monitoring
+        self.scheduler.unload()
+        
         # Save learned data before unloading if needed
         # TODO: Implement persistent storage for learner data
         
         _LOGGER.debug("Zone controller unloaded successfully")
         return True
 
-    async def process_zone(self, zone_id):
-        """Process a zone to determine if it needs watering."""
+    def should_process_zone(self, zone_id):
+        """Return True if process_zone would actually evaluate the zone.
+
+        Synchronous, so callers can skip creating the coroutine at all.
+        """
         # Skip if stop requested
-        if self._stop_requested or self.coordinator._shutdown_requested:
+        if self._stop_requested or self.coordinator.shutdown_requested:
             _LOGGER.debug("Stop requested - not processing zone %s", zone_id)
-            return
-            
-        # Skip if system disabled
-        if not self.coordinator.system_enabled:
+            return False
+        
+        return not self.queue_manager.should_skip_zone(zone_id)
+
+    async def process_zone(self, zone_id):
+        """Process a zone to determine if it needs watering."""
+        if not self.should_process_zone(zone_id):
             return
         
         # Delegate to queue manager
@@ -1,9 +1,10 @@
 """Zone processing for Smart Sprinklers."""
-import asyncio
 import logging
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
-from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
 
 from ..const import (
     ZONE_STATE_IDLE,
@@ -21,6 +22,28 @@ MIN_EFFICIENCY_FACTOR = 0.5
 MAX_EFFICIENCY_FACTOR = 1.0
 EFFICIENCY_ADJUST_STEP = 0.05
 
+# Kinds of timers a zone can have pending
+CALLBACK_CYCLE_END = "cycle_end"
+CALLBACK_SOAK_END = "soak_end"
+CALLBACK_FINAL_MEASUREMENT = "final_measurement"
+
+# Handler method run when each kind of timer fires
+_CALLBACK_HANDLERS = {
+    CALLBACK_CYCLE_END: "handle_cycle_end",
+    CALLBACK_SOAK_END: "handle_soak_end",
+    CALLBACK_FINAL_MEASUREMENT: "handle_final_measurement",
+}
+
+# Delay between the last cycle ending and the final moisture measurement
+FINAL_MEASUREMENT_DELAY = 30 * 60  # seconds
+
+@dataclass(slots=True)
+class _SoakState:
+    """A zone waiting out its soak period between cycles."""
+
+    ready_at: datetime
+    pre_soak_moisture: float
+
 class ZoneProcessor:
     """Process zone watering cycles."""
     
@@ -30,8 +53,57 @@ class ZoneProcessor:
         self.coordinator = controller.coordinator
         self.hass = controller.hass
         
-        # Track callback handles for proper cleanup
-        self._callback_handles = []
+        # Pending loop timer handles keyed by (zone_id, kind), for cleanup
+        # when they fire or when everything is cancelled; each handle's
+        # when() is the loop time it is due
+        self._callback_handles = {}
+        # True while a process_queue pass is scheduled but has not started
+        self._queue_wakeup_pending = False
+    
+    def _schedule(self, kind, zone_id, seconds):
+        """Run the handler for kind after seconds and register the timer.
+
+        Returns the cancel function. Failures are logged here and re-raised
+        so the caller can recover the zone and the queue.
+        """
+        self.cancel_callback(zone_id, kind)
+        # A plain loop timer at an absolute loop time; a task is only created
+        # once the timer fires
+        try:
+            action = getattr(self, _CALLBACK_HANDLERS[kind])
+            loop = self.hass.loop
+            handle = loop.call_at(loop.time() + seconds, self._fire, action, zone_id)
+        except Exception as e:
+            _LOGGER.error("Failed to schedule %s for zone %s: %s", kind, zone_id, e)
+            raise
+        self._callback_handles[(zone_id, kind)] = handle
+        return handle.cancel
+    
+    def cancel_callback(self, zone_id, kind):
+        """Cancel and forget a zone's pending timer of the given kind, if any."""
+        handle = self._callback_handles.pop((zone_id, kind), None)
+        if handle is not None:
+            handle.cancel()
+    
+    def wake_queue(self):
+        """Schedule one pass over the queue unless one is already pending."""
+        if self._queue_wakeup_pending:
+            return
+        self._queue_wakeup_pending = True
+        # A named background task so the pump shows up in task dumps and
+        # does not hold up Home Assistant startup or shutdown
+        self.hass.async_create_background_task(
+            self._run_queue_once(), name="smart_sprinklers_queue"
+        )
+    
+    async def _run_queue_once(self):
+        """Process the queue for a pending wakeup."""
+        self._queue_wakeup_pending = False
+        await self.controller.queue_manager.process_queue()
+    
+    def _fire(self, action, zone_id):
+        """Run a scheduled handler as a task on the event loop."""
+        self.hass.async_create_task(action(dt_util.utcnow(), zone_id))
         
     async def turn_on_zone(self, zone_id):
         """Turn on a zone's switch."""
@@ -40,33 +112,33 @@ class ZoneProcessor:
             return False
             
         # Check for shutdown requested
-        if self.coordinator._shutdown_requested:
+        if self.coordinator.shutdown_requested:
             _LOGGER.warning("Shutdown requested - not turning on zone %s", zone_id)
             return False
             
         zone = self.coordinator.zones[zone_id]
         try:
-            # Store the timestamp before turning on to track watering duration
-            zone["watering_start_time"] = datetime.now().isoformat()
+            # Store the monotonic time before turning on to track watering duration
+            zone.watering_start_time = time.monotonic()
             
             await self.hass.services.async_call(
                 "switch", "turn_on", 
-                {"entity_id": zone["switch"]},
+                {"entity_id": zone.switch},
                 blocking=True
             )
             
             # Update state
-            zone["state"] = ZONE_STATE_WATERING
+            zone.state = ZONE_STATE_WATERING
             self.controller.active_zone = zone_id
             self.coordinator._sprinklers_active = True
             
             # Log the successful activation
-            _LOGGER.info("Zone %s turned ON successfully", zone["name"])
+            _LOGGER.info("Zone %s turned ON successfully", zone.name)
             return True
         except Exception as e:
-            _LOGGER.error("Failed to turn on zone %s: %s", zone["name"], e)
+            _LOGGER.error("Failed to turn on zone %s: %s", zone.name, e)
             # Reset zone state if we failed to turn on
-            zone["state"] = ZONE_STATE_IDLE
+            zone.state = ZONE_STATE_IDLE
             return False
 
     async def turn_off_zone(self, zone_id):
@@ -79,15 +151,14 @@ class ZoneProcessor:
         try:
             await self.hass.services.async_call(
                 "switch", "turn_off", 
-                {"entity_id": zone["switch"]},
+                {"entity_id": zone.switch},
                 blocking=True
             )
             
             # Log watering duration for analysis
-            if "watering_start_time" in zone:
-                start_time = datetime.fromisoformat(zone["watering_start_time"])
-                duration = (datetime.now() - start_time).total_seconds() / 60.0  # in minutes
-                _LOGGER.info("Zone %s watered for %.1f minutes", zone["name"], duration)
+            if zone.watering_start_time is not None and _LOGGER.isEnabledFor(logging.INFO):
+                duration = (time.monotonic() - zone.watering_start_time) / 60.0  # in minutes
+                _LOGGER.info("Zone %s watered for %.1f minutes", zone.name, duration)
             
             # If this was the active zone, clear it
             if self.controller.active_zone == zone_id:
@@ -98,7 +169,7 @@ class ZoneProcessor:
                     self.coordinator._sprinklers_active = False
             return True
         except Exception as e:
-            _LOGGER.error("Failed to turn off zone %s: %s", zone["name"], e)
+            _LOGGER.error("Failed to turn off zone %s: %s", zone.name, e)
             # Safety measure - set active_zone to None even if turn-off failed
             if self.controller.active_zone == zone_id:
                 self.controller.active_zone = None
@@ -106,177 +177,158 @@ class ZoneProcessor:
 
     async def start_zone_cycle(self, zone_id, current_moisture):
         """Start a watering cycle for a zone."""
-        # First check for shutdown 
-        if self.coordinator._shutdown_requested:
+        coordinator = self.coordinator
+        controller = self.controller
+        zone = coordinator.zones.get(zone_id)
+        
+        # First check for shutdown; the flag can only change while this
+        # coroutine is suspended, so it is re-checked only after an await
+        if coordinator.shutdown_requested:
             _LOGGER.warning("Shutdown requested - not starting zone cycle for %s", zone_id)
             # Continue with next zone in queue if appropriate
-            if not self.controller.zone_queue:
-                self.coordinator._queue_processing_active = False
+            if not controller.zone_queue:
+                coordinator._queue_processing_active = False
             return
             
-        if zone_id not in self.coordinator.zones:
+        if zone is None:
             _LOGGER.warning("Attempted to start cycle for non-existent zone: %s", zone_id)
             # Continue with next zone in queue
-            if self.controller.zone_queue and not self.coordinator._shutdown_requested:
-                asyncio.create_task(self.controller.queue_manager.process_queue())
+            if controller.zone_queue:
+                self.wake_queue()
             else:
-                self.coordinator._queue_processing_active = False
+                coordinator._queue_processing_active = False
             return
             
-        zone = self.coordinator.zones[zone_id]
-        
         # Calculate cycle time
-        cycle_minutes = self.coordinator.cycle_time
+        cycle_minutes = coordinator.cycle_time
         
         # Record pre-watering moisture level
-        zone["pre_watering_moisture"] = current_moisture
+        zone.pre_watering_moisture = current_moisture
         
         # Update expected moisture increase based on absorption rate and cycle time
-        absorption_rate = self.coordinator.absorption_learners[zone_id].get_rate()
+        absorption_rate = controller.get_learner(zone_id, zone).get_rate()
         expected_increase = absorption_rate * cycle_minutes
-        zone["watering_expected_increase"] = expected_increase
+        zone.watering_expected_increase = expected_increase
         
         # Update timestamps
-        now = datetime.now()
-        zone["last_watered"] = now.isoformat()
+        zone.last_watered = dt_util.utcnow().isoformat()
         
         # Turn on the zone
         success = await self.turn_on_zone(zone_id)
         if not success:
-            _LOGGER.error("Failed to start watering for zone %s", zone["name"])
+            _LOGGER.error("Failed to start watering for zone %s", zone.name)
             # Continue with next zone in queue
-            if self.controller.zone_queue and not self.coordinator._shutdown_requested:
-                asyncio.create_task(self.controller.queue_manager.process_queue())
+            if controller.zone_queue and not coordinator.shutdown_requested:
+                self.wake_queue()
             else:
-                self.coordinator._queue_processing_active = False
+                coordinator._queue_processing_active = False
             return
         
         _LOGGER.info(
             "Started watering zone %s (Cycle %d/%d, duration: %d minutes)",
-            zone["name"], zone["current_cycle"], zone["cycle_count"], cycle_minutes
+            zone.name, zone.current_cycle, zone.cycle_count, cycle_minutes
         )
         
         try:
             # Schedule the end of this cycle with a non-blocking timer
             # Store the callback so it can be cancelled if needed
-            callback = async_call_later(
-                self.hass,
-                cycle_minutes * 60,  # Convert to seconds
-                self.handle_cycle_end,
-                zone_id
-            )
-            self._callback_handles.append(callback)
-        except Exception as e:
-            _LOGGER.error("Failed to schedule cycle end for zone %s: %s", zone["name"], e)
+            self._schedule(CALLBACK_CYCLE_END, zone_id, coordinator.cycle_seconds)
+        except Exception:
             # Safety measure - turn off zone if we couldn't schedule the end
             await self.turn_off_zone(zone_id)
             
             # Continue with next zone
-            if self.controller.zone_queue and not self.coordinator._shutdown_requested:
-                asyncio.create_task(self.controller.queue_manager.process_queue())
+            if controller.zone_queue and not coordinator.shutdown_requested:
+                self.wake_queue()
             else:
-                self.coordinator._queue_processing_active = False
+                coordinator._queue_processing_active = False
 
     async def handle_cycle_end(self, _now, zone_id):
         """Handle the end of a watering cycle."""
-        try:
-            # Remove the callback from handles
-            self._callback_handles = [
-                handle for handle in self._callback_handles
-                if handle and handle.data != zone_id
-            ]
-                    
-            # Check if shutdown was requested
-            if self.coordinator._shutdown_requested:
-                _LOGGER.info("Shutdown requested during cycle - ending all watering")
-                await self.turn_off_zone(zone_id)
-                return
-                
-            if zone_id not in self.coordinator.zones:
-                _LOGGER.warning("Zone %s no longer exists, skipping cycle end", zone_id)
-                # Continue with next zone in queue
-                if self.controller.zone_queue and not self.coordinator._shutdown_requested:
-                    asyncio.create_task(self.controller.queue_manager.process_queue())
-                else:
-                    self.coordinator._queue_processing_active = False
-                return
+        coordinator = self.coordinator
+        controller = self.controller
+        zone = coordinator.zones.get(zone_id)
+        
+        # Remove the callback from handles
+        self._callback_handles.pop((zone_id, CALLBACK_CYCLE_END), None)
                 
-            zone = self.coordinator.zones[zone_id]
-            
-            # Turn off the zone
+        # Check if shutdown was requested; re-checked only after an await
+        if coordinator.shutdown_requested:
+            _LOGGER.info("Shutdown requested during cycle - ending all watering")
             await self.turn_off_zone(zone_id)
+            return
             
-            # If this was the last cycle, we're done with this zone
-            if zone["current_cycle"] >= zone["cycle_count"]:
-                _LOGGER.info(
-                    "Completed all watering cycles for zone %s",
-                    zone["name"]
-                )
-                
-                # Update zone state to measuring
-                zone["state"] = ZONE_STATE_MEASURING
-                
-                # Schedule moisture check after soaking
-                measure_callback = async_call_later(
-                    self.hass,
-                    30 * 60,  # 30 minutes in seconds
-                    self.handle_final_measurement,
-                    zone_id
-                )
-                self._callback_handles.append(measure_callback)
-                
-                # If there are other zones in the queue, process the next one
-                if self.controller.zone_queue and not self.coordinator._shutdown_requested:
-                    asyncio.create_task(self.controller.queue_manager.process_queue())
-                else:
-                    # No more zones in queue, check if all zones are done
-                    if not self.controller.active_zone and not self.controller.soaking_zones:
-                        self.coordinator._queue_processing_active = False
-                        self.coordinator._sprinklers_active = False
-                        _LOGGER.info("All zones watered, queue processing complete")
+        if zone is None:
+            _LOGGER.warning("Zone %s no longer exists, skipping cycle end", zone_id)
+            # Continue with next zone in queue
+            if controller.zone_queue:
+                self.wake_queue()
             else:
-                # We need to soak and then do another cycle
-                await self.start_soak_cycle(zone_id)
-        except Exception as e:
-            _LOGGER.error("Error handling cycle end for zone %s: %s", zone_id, e)
-            # Safety: try to turn off the zone if there was an error
+                coordinator._queue_processing_active = False
+            return
+            
+        # Turn off the zone; failures are logged and handled by turn_off_zone
+        await self.turn_off_zone(zone_id)
+        
+        # If this was the last cycle, we're done with this zone
+        if zone.current_cycle >= zone.cycle_count:
+            _LOGGER.info(
+                "Completed all watering cycles for zone %s",
+                zone.name
+            )
+            
+            # Update zone state to measuring
+            zone.state = ZONE_STATE_MEASURING
+            
+            # Schedule moisture check after soaking
             try:
-                await self.turn_off_zone(zone_id)
+                self._schedule(CALLBACK_FINAL_MEASUREMENT, zone_id, FINAL_MEASUREMENT_DELAY)
             except Exception:
-                pass
+                # Already logged by _schedule; measure nothing and move on
+                zone.state = ZONE_STATE_IDLE
             
-            # Try to recover by processing next zone
-            if self.controller.zone_queue and not self.coordinator._shutdown_requested:
-                asyncio.create_task(self.controller.queue_manager.process_queue())
+            # If there are other zones in the queue, process the next one
+            if controller.zone_queue and not coordinator.shutdown_requested:
+                self.wake_queue()
             else:
-                self.coordinator._queue_processing_active = False
+                # No more zones in queue, check if all zones are done
+                if not controller.active_zone and not controller.soaking_zones:
+                    coordinator._queue_processing_active = False
+                    coordinator._sprinklers_active = False
+                    _LOGGER.info("All zones watered, queue processing complete")
+            return
+            
+        # We need to soak and then do another cycle
+        try:
+            await self.start_soak_cycle(zone_id)
+        except Exception:
+            # The soak timer could not be scheduled (logged by _schedule);
+            # recover by processing the next zone
+            controller.soaking_zones.pop(zone_id, None)
+            zone.state = ZONE_STATE_IDLE
+            if controller.zone_queue and not coordinator.shutdown_requested:
+                self.wake_queue()
+            else:
+                coordinator._queue_processing_active = False
 
     async def start_soak_cycle(self, zone_id):
         """Start a soak cycle for a zone."""
-        # Check for shutdown
-        if self.coordinator._shutdown_requested:
+        # Check for shutdown; nothing below awaits, so it cannot change later
+        if self.coordinator.shutdown_requested:
             _LOGGER.warning("Shutdown requested - not starting soak cycle for %s", zone_id)
             return
             
         zone = self.coordinator.zones[zone_id]
         
-        # Move to soaking state
-        zone["state"] = ZONE_STATE_SOAKING
-        
-        # Increment cycle counter for next time
-        zone["current_cycle"] += 1
-        
-        # Get current moisture reading
+        # Get current moisture reading, as last reported to the tracker
         try:
-            moisture_state = self.hass.states.get(zone["moisture_sensor"])
-            if not moisture_state:
+            current_moisture = zone.last_moisture
+            if current_moisture is None:
                 _LOGGER.warning(
                     "Moisture sensor unavailable for zone %s after watering cycle", 
-                    zone["name"]
+                    zone.name
                 )
-                current_moisture = zone.get("pre_watering_moisture", 0)
-            else:
-                current_moisture = float(moisture_state.state)
+                current_moisture = zone.pre_watering_moisture or 0
             
             # Store pre-soak moisture level
             pre_soak_moisture = current_moisture
@@ -284,207 +336,209 @@ class ZoneProcessor:
             # Calculate when soaking will be done
             ready_at = datetime.now() + timedelta(minutes=self.coordinator.soak_time)
             
-            _LOGGER.info(
-                "Zone %s soaking until %s (cycle %d/%d)",
-                zone["name"], ready_at.strftime("%H:%M:%S"),
-                zone["current_cycle"], zone["cycle_count"]
-            )
+            # Schedule callback for when soaking is done; the timer is owned
+            # by the callback registry, not the soaking zones dict. It is
+            # armed before the zone changes state, so a failure here never
+            # leaves the zone soaking with nothing to end the soak
+            self._schedule(CALLBACK_SOAK_END, zone_id, self.coordinator.soak_seconds)
             
-            # Schedule callback for when soaking is done
-            soak_callback = async_call_later(
-                self.hass,
-                self.coordinator.soak_time * 60,  # Convert to seconds
-                self.handle_soak_end,
-                zone_id
-            )
-            self._callback_handles.append(soak_callback)
+            # Move to soaking state
+            zone.state = ZONE_STATE_SOAKING
+            
+            # Increment cycle counter for next time
+            zone.current_cycle += 1
+            
+            if _LOGGER.isEnabledFor(logging.INFO):
+                _LOGGER.info(
+                    "Zone %s soaking until %s (cycle %d/%d)",
+                    zone.name, ready_at.strftime("%H:%M:%S"),
+                    zone.current_cycle, zone.cycle_count
+                )
             
             # Add to soaking zones dict
-            self.controller.soaking_zones[zone_id] = {
-                "ready_at": ready_at,
-                "pre_soak_moisture": pre_soak_moisture,
-                "cancel_callback": soak_callback
-            }
+            self.controller.soaking_zones[zone_id] = _SoakState(ready_at, pre_soak_moisture)
+            self.controller.queue_manager.track_soak(zone_id, ready_at)
             
             # Process next zone in queue while this one soaks
-            if self.controller.zone_queue and not self.coordinator._shutdown_requested:
-                asyncio.create_task(self.controller.queue_manager.process_queue())
+            if self.controller.zone_queue:
+                self.wake_queue()
             
         except (ValueError, TypeError) as e:
-            _LOGGER.error("Error reading moisture for zone %s: %s", zone["name"], e)
+            _LOGGER.error("Error reading moisture for zone %s: %s", zone.name, e)
+            # No soak was started, so the zone is done for now
+            self.cancel_callback(zone_id, CALLBACK_SOAK_END)
+            zone.state = ZONE_STATE_IDLE
             # Move to next zone anyway
-            if self.controller.zone_queue and not self.coordinator._shutdown_requested:
-                asyncio.create_task(self.controller.queue_manager.process_queue())
+            if self.controller.zone_queue:
+                self.wake_queue()
 
     async def handle_soak_end(self, _now, zone_id):
         """Handle the end of a soaking period."""
-        try:
-            # Remove the callback from handles
-            self._callback_handles = [
-                handle for handle in self._callback_handles
-                if handle and handle.data != zone_id
-            ]
-            
-            # Check for shutdown
-            if self.coordinator._shutdown_requested:
-                _LOGGER.warning("Shutdown requested - not continuing after soak for %s", zone_id)
-                # Remove from soaking zones dict
-                if zone_id in self.controller.soaking_zones:
-                    del self.controller.soaking_zones[zone_id]
-                return
-                    
-            # Remove from soaking zones dict
-            if zone_id in self.controller.soaking_zones:
-                del self.controller.soaking_zones[zone_id]
-                
-            # Check if zone still exists
-            if zone_id not in self.coordinator.zones:
-                _LOGGER.warning("Zone %s no longer exists, skipping soak end", zone_id)
-                
-                # Process queue to continue with other zones
-                if not self.controller.active_zone and not self.coordinator._shutdown_requested:
-                    asyncio.create_task(self.controller.queue_manager.process_queue())
-                return
-                
-            zone = self.coordinator.zones[zone_id]
-            _LOGGER.info(
-                "Soak period ended for zone %s, continuing with cycle %d/%d",
-                zone["name"], zone["current_cycle"], zone["cycle_count"]
-            )
+        coordinator = self.coordinator
+        controller = self.controller
+        zone = coordinator.zones.get(zone_id)
+        
+        # Remove the callback from handles
+        self._callback_handles.pop((zone_id, CALLBACK_SOAK_END), None)
+        
+        # Remove from soaking zones dict
+        controller.soaking_zones.pop(zone_id, None)
+        
+        # Check for shutdown; nothing below awaits, so it cannot change later
+        if coordinator.shutdown_requested:
+            _LOGGER.warning("Shutdown requested - not continuing after soak for %s", zone_id)
+            return
             
-            # Add back to queue for next cycle, at the front of the line
-            self.controller.zone_queue.insert(0, zone_id)
+        # Check if zone still exists
+        if zone is None:
+            _LOGGER.warning("Zone %s no longer exists, skipping soak end", zone_id)
             
-            # Process queue to start next cycle
-            if not self.coordinator._shutdown_requested:
-                asyncio.create_task(self.controller.queue_manager.process_queue())
+            # Process queue to continue with other zones
+            if not controller.active_zone:
+                self.wake_queue()
+            return
             
-        except Exception as e:
-            _LOGGER.error("Error handling soak end for zone %s: %s", zone_id, e)
-            # Try to recover by processing queue
-            if not self.coordinator._shutdown_requested:
-                asyncio.create_task(self.controller.queue_manager.process_queue())
+        _LOGGER.info(
+            "Soak period ended for zone %s, continuing with cycle %d/%d",
+            zone.name, zone.current_cycle, zone.cycle_count
+        )
+        
+        # Add back to queue for next cycle, at the front of the line
+        controller.enqueue_zone(zone_id, front=True)
+        
+        # Process queue to start next cycle
+        self.wake_queue()
 
     async def handle_final_measurement(self, _now, zone_id):
         """Handle the final moisture measurement after watering and soaking."""
+        coordinator = self.coordinator
+        controller = self.controller
+        zone = coordinator.zones.get(zone_id)
+        
+        # Remove the callback from handles
+        self._callback_handles.pop((zone_id, CALLBACK_FINAL_MEASUREMENT), None)
+                
         try:
-            # Remove the callback from handles
-            self._callback_handles = [
-                handle for handle in self._callback_handles
-                if handle and handle.data != zone_id
-            ]
-                    
             # Check if zone still exists
-            if zone_id not in self.coordinator.zones:
+            if zone is None:
                 _LOGGER.warning("Zone %s no longer exists, skipping final measurement", zone_id)
-                return
-                
-            zone = self.coordinator.zones[zone_id]
-            
-            # Get current moisture reading
-            try:
-                moisture_state = self.hass.states.get(zone["moisture_sensor"])
-                if not moisture_state:
-                    _LOGGER.warning(
-                        "Moisture sensor unavailable for zone %s during final measurement", 
-                        zone["name"]
-                    )
-                    current_moisture = zone.get("pre_watering_moisture", 0)
-                else:
-                    current_moisture = float(moisture_state.state)
-                
-                # Calculate moisture increase
-                pre_moisture = zone.get("pre_watering_moisture", current_moisture)
-                moisture_increase = current_moisture - pre_moisture
-                
-                # Calculate efficiency
-                if zone.get("watering_expected_increase", 0) > 0:
-                    efficiency_ratio = moisture_increase / zone["watering_expected_increase"]
-                    self._update_efficiency_factor(zone, efficiency_ratio)
-                
-                # Update soaking efficiency in % per hour
-                hours = (zone["cycle_count"] * self.coordinator.cycle_time) / 60
-                if hours > 0:
-                    zone["soaking_efficiency"] = moisture_increase / hours
-                
-                # Add data point to absorption learner
-                cycles_run = zone["cycle_count"] 
-                if cycles_run > 0:
-                    watering_minutes = cycles_run * self.coordinator.cycle_time
-                    self.coordinator.absorption_learners[zone_id].add_data_point(
-                        pre_moisture, current_moisture, watering_minutes
-                    )
-                
-                # Update moisture deficit
-                self._update_moisture_deficit(zone, moisture_increase)
-                
-                # Reset zone state
-                zone["state"] = ZONE_STATE_IDLE
-                
-                # Send notification
-                await self.coordinator.async_send_notification(
-                    f"Zone {zone['name']} watering complete: "
-                    f"Moisture increased from {pre_moisture:.1f}% to {current_moisture:.1f}% "
-                    f"(efficiency: {zone.get('soaking_efficiency', 0):.2f}%/h)"
-                )
-                
-            except (ValueError, TypeError) as e:
-                _LOGGER.error("Error reading final moisture for zone %s: %s", zone["name"], e)
-                zone["state"] = ZONE_STATE_IDLE
+            else:
+                await self._record_final_measurement(zone_id, zone)
                 
         except Exception as e:
+            # This runs as a fire-and-forget task, so nothing else would see it
             _LOGGER.error("Error handling final measurement for zone %s: %s", zone_id, e)
             
         finally:
+            # Never leave the zone stuck measuring
+            if zone is not None and zone.state == ZONE_STATE_MEASURING:
+                zone.state = ZONE_STATE_IDLE
+                
             # Make sure flags are reset if this was the last zone
-            if not self.controller.active_zone and not self.controller.soaking_zones and not self.controller.zone_queue:
-                self.coordinator._queue_processing_active = False
-                self.coordinator._sprinklers_active = False
+            if not controller.active_zone and not controller.soaking_zones and not controller.zone_queue:
+                coordinator._queue_processing_active = False
+                coordinator._sprinklers_active = False
+
+    async def _record_final_measurement(self, zone_id, zone):
+        """Learn from a zone's final moisture reading and mark it idle."""
+        coordinator = self.coordinator
+        
+        # Get current moisture reading, as last reported to the tracker
+        current_moisture = zone.last_moisture
+        if current_moisture is None:
+            _LOGGER.warning(
+                "Moisture sensor unavailable for zone %s during final measurement", 
+                zone.name
+            )
+            current_moisture = zone.pre_watering_moisture or 0
+        
+        try:
+            # Read the watering figures once
+            pre_moisture = zone.pre_watering_moisture
+            if pre_moisture is None:
+                pre_moisture = current_moisture
+            expected_increase = zone.watering_expected_increase
+            cycles_run = zone.cycle_count
+            watering_minutes = cycles_run * coordinator.cycle_time
+            hours = watering_minutes / 60
+            moisture_increase = current_moisture - pre_moisture
+            
+            # Calculate efficiency
+            if expected_increase > 0:
+                self._update_efficiency_factor(zone, moisture_increase / expected_increase)
+            
+            # Update soaking efficiency in % per hour
+            if hours > 0:
+                zone.soaking_efficiency = moisture_increase / hours
+            
+            # Add data point to absorption learner
+            if cycles_run > 0:
+                self.controller.get_learner(zone_id, zone).add_data_point(
+                    pre_moisture, current_moisture, watering_minutes
+                )
+            
+            # Update moisture deficit
+            self._update_moisture_deficit(zone, moisture_increase)
+        except (ValueError, TypeError) as e:
+            _LOGGER.error("Error reading final moisture for zone %s: %s", zone.name, e)
+            zone.state = ZONE_STATE_IDLE
+            return
+            
+        # Reset zone state
+        zone.state = ZONE_STATE_IDLE
+        
+        # Send notification; delivery failures are handled by the coordinator
+        await coordinator.async_send_notification(
+            f"Zone {zone.name} watering complete: "
+            f"Moisture increased from {pre_moisture:.1f}% to {current_moisture:.1f}% "
+            f"(efficiency: {zone.soaking_efficiency:.2f}%/h)"
+        )
 
     def _update_efficiency_factor(self, zone, efficiency_ratio):
         """Update the efficiency factor based on watering results."""
-        old_factor = zone.get("efficiency_factor", DEFAULT_EFFICIENCY_FACTOR)
+        old_factor = zone.efficiency_factor
         
         if efficiency_ratio > 1:
             # Better than expected, increase factor
-            new_factor = min(MAX_EFFICIENCY_FACTOR, old_factor + EFFICIENCY_ADJUST_STEP)
+            delta = EFFICIENCY_ADJUST_STEP
         elif efficiency_ratio < 0.8:
             # Worse than expected, decrease factor
-            new_factor = max(MIN_EFFICIENCY_FACTOR, old_factor - EFFICIENCY_ADJUST_STEP)
+            delta = -EFFICIENCY_ADJUST_STEP
         else:
             # Close to expected, small adjustment
-            new_factor = old_factor + (EFFICIENCY_ADJUST_STEP/2) * (efficiency_ratio - 1)
+            delta = (EFFICIENCY_ADJUST_STEP / 2) * (efficiency_ratio - 1)
         
-        # Apply bounds
-        new_factor = max(MIN_EFFICIENCY_FACTOR, min(MAX_EFFICIENCY_FACTOR, new_factor))
-        zone["efficiency_factor"] = new_factor
+        # Apply bounds once
+        new_factor = min(MAX_EFFICIENCY_FACTOR, max(MIN_EFFICIENCY_FACTOR, old_factor + delta))
+        zone.efficiency_factor = new_factor
         
-        _LOGGER.info(
-            "Zone %s efficiency: Expected +%.1f%%, Actual +%.1f%%, Factor adjusted from %.2f to %.2f",
-            zone["name"], zone.get("watering_expected_increase", 0), efficiency_ratio * zone.get("watering_expected_increase", 0), 
-            old_factor, new_factor
-        )
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info(
+                "Zone %s efficiency: Expected +%.1f%%, Actual +%.1f%%, Factor adjusted from %.2f to %.2f",
+                zone.name, zone.watering_expected_increase, efficiency_ratio * zone.watering_expected_increase, 
+                old_factor, new_factor
+            )
 
     def _update_moisture_deficit(self, zone, moisture_increase):
         """Update the moisture deficit based on watering results."""
         if moisture_increase > 0:
             # Convert moisture percentage increase to mm equivalent
             mm_equivalent = moisture_increase * 1.0
-            old_deficit = zone.get("moisture_deficit", 0.0)
+            old_deficit = zone.moisture_deficit
             new_deficit = max(0.0, old_deficit - mm_equivalent)
-            zone["moisture_deficit"] = new_deficit
+            zone.moisture_deficit = new_deficit
             _LOGGER.info(
                 "Zone %s: Moisture increased by %.1f%% (%.1fmm), deficit reduced from %.1fmm to %.1fmm",
-                zone["name"], moisture_increase, mm_equivalent, old_deficit, new_deficit
+                zone.name, moisture_increase, mm_equivalent, old_deficit, new_deficit
             )
             
     async def cancel_all_callbacks(self):
         """Cancel all active callbacks."""
         # Cancel any active callbacks
-        for handle in self._callback_handles:
+        for handle in self._callback_handles.values():
             try:
-                handle()  # Cancel the callback
+                handle.cancel()  # Cancel the callback
             except Exception as e:
                 _LOGGER.error("Error cancelling callback: %s", e)
                 
-        self._callback_handles = []
\ No newline at end of file
+        self._callback_handles.clear()
\ No newline at end of file
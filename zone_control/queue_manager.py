@@ -1,11 +1,28 @@
 """Queue management for Smart Sprinklers."""
 import asyncio
+import heapq
 import logging
+import time
+from datetime import datetime
+
+from homeassistant.util import dt as dt_util
 
 from ..algorithms.watering import calculate_watering_duration
+from ..const import ZONE_STATE_SOAKING, ZONE_STATE_WATERING
+from .processor import CALLBACK_SOAK_END
 
 _LOGGER = logging.getLogger(__name__)
 
+# Zone states in which a zone is already being handled
+_ACTIVE_STATES = frozenset((ZONE_STATE_WATERING, ZONE_STATE_SOAKING))
+
+# Skip reason shown while outside the schedule window
+_REASON_OUTSIDE_SCHEDULE = "outside of schedule"
+
+# Minimum seconds between "added to watering queue" notifications; zones
+# queued in between are reported together in the next one
+QUEUE_NOTIFY_INTERVAL = 30
+
 class QueueManager:
     """Manage the zone queue processing."""
     
@@ -15,34 +32,52 @@ class QueueManager:
         self.coordinator = controller.coordinator
         self.hass = controller.hass
         self._queue_operation_lock = asyncio.Lock()  # Lock for queue processing operations
+        # Min-heap of (ready_at, zone_id) for soaking zones; entries that no
+        # longer match soaking_zones are dropped when they reach the top
+        self._soak_heap = []
+        # Queued-zone notices waiting for the next notification, when the last
+        # one was sent (monotonic), and the timer that will flush them
+        self._pending_queue_notices = []
+        self._last_queue_notify = float("-inf")
+        self._queue_notify_flush = None
         
-    async def evaluate_zone(self, zone_id):
-        """Evaluate if a zone needs watering and add to queue if needed."""
-        # Skip if system is disabled, shutdown requested, or if sprinklers are already active
-        if not self.coordinator.system_enabled or self.coordinator._shutdown_requested:
-            return
+    def should_skip_zone(self, zone_id):
+        """Return True if evaluating the zone would be a no-op right now."""
+        coordinator = self.coordinator
+        controller = self.controller
+        
+        # Skip if system is disabled or shutdown requested
+        if not coordinator.system_enabled or coordinator.shutdown_requested:
+            return True
             
         # Skip if the zone is already being processed (active or soaking)
-        if self.controller.active_zone == zone_id or zone_id in self.controller.soaking_zones:
-            return
+        if controller.active_zone == zone_id or zone_id in controller.soaking_zones:
+            return True
         
-        if zone_id not in self.coordinator.zones:
+        zone = coordinator.zones.get(zone_id)
+        if zone is None:
             _LOGGER.warning("Attempted to process non-existent zone: %s", zone_id)
-            return
-            
-        zone = self.coordinator.zones[zone_id]
+            return True
         
         # Skip if the zone is already in an active state
-        if zone["state"] in ["watering", "soaking"]:
+        return zone.state in _ACTIVE_STATES
+        
+    async def evaluate_zone(self, zone_id):
+        """Evaluate if a zone needs watering and add to queue if needed."""
+        if self.should_skip_zone(zone_id):
             return
         
+        zone = self.coordinator.zones[zone_id]
+        name = zone.name
+        
         # Get current sensor readings
         try:
-            moisture_state = self.hass.states.get(zone["moisture_sensor"])
-            temp_state = self.hass.states.get(zone["temp_sensor"])
+            states = self.hass.states
+            moisture_state = states.get(zone.moisture_sensor)
+            temp_state = states.get(zone.temp_sensor)
             
             if not moisture_state or not temp_state:
-                _LOGGER.warning("Sensors not found for zone %s", zone["name"])
+                _LOGGER.warning("Sensors not found for zone %s", name)
                 return
             
             # Ensure states are convertible to float
@@ -52,101 +87,146 @@ class QueueManager:
             except (ValueError, TypeError):
                 _LOGGER.warning(
                     "Invalid sensor readings for zone %s: moisture=%s, temp=%s",
-                    zone["name"], moisture_state.state, temp_state.state
+                    name, moisture_state.state, temp_state.state
                 )
                 return
             
             # Check if watering is needed - either based on moisture sensor or deficit
             watering_needed = False
+            min_moisture = zone.min_moisture
+            deficit = zone.moisture_deficit
             
             # Moisture sensor check
-            if current_moisture <= zone["min_moisture"]:
+            if current_moisture <= min_moisture:
                 watering_needed = True
                 _LOGGER.debug(
                     "Zone %s needs water due to moisture level (%.1f%% < %.1f%%)",
-                    zone["name"], current_moisture, zone["min_moisture"]
+                    name, current_moisture, min_moisture
                 )
                 
             # Moisture deficit check - if deficit exceeds threshold
-            elif zone.get("moisture_deficit", 0) >= 5.0:  # 5mm deficit threshold
+            elif deficit >= 5.0:  # 5mm deficit threshold
                 watering_needed = True
                 _LOGGER.debug(
                     "Zone %s needs water due to moisture deficit (%.1fmm)",
-                    zone["name"], zone.get("moisture_deficit", 0)
+                    name, deficit
                 )
                 
             if watering_needed:
                 await self._handle_watering_needed(zone_id, zone, current_moisture, current_temp)
                 
         except Exception as e:
-            _LOGGER.error("Error processing zone %s: %s", zone["name"], e)
+            _LOGGER.error("Error processing zone %s: %s", name, e)
+
+    def watering_skip_reason(self, current_temp=None):
+        """Return why watering can't start now, or None if it can.
+
+        Only synchronous checks, each run at most once; the temperature
+        check is skipped when no reading is given.
+        """
+        if not self.controller.scheduler.is_in_schedule():
+            return _REASON_OUTSIDE_SCHEDULE
+        weather = self.coordinator.weather_manager
+        if weather.is_rain_forecasted():
+            return "rain forecasted"
+        if weather.is_freezing_forecasted():
+            return "freezing temperatures forecasted"
+        freeze_threshold = self.coordinator.freeze_threshold
+        if current_temp is not None and current_temp <= freeze_threshold:
+            return f"current temperature below freeze threshold ({freeze_threshold}°F)"
+        return None
 
     async def _handle_watering_needed(self, zone_id, zone, current_moisture, current_temp):
         """Handle a zone that needs watering."""
+        coordinator = self.coordinator
+        controller = self.controller
+        name = zone.name
+        
         # Check if we can water based on weather and schedule
-        scheduler = self.controller.scheduler
-        if (
-            scheduler.is_in_schedule()
-            and not self.coordinator.weather_manager.is_rain_forecasted()
-            and not self.coordinator.weather_manager.is_freezing_forecasted()
-            and current_temp > self.coordinator.freeze_threshold
-        ):
-            # Add to queue if not already there
-            if zone_id not in self.controller.zone_queue and zone_id not in self.controller.soaking_zones:
-                async with self._queue_operation_lock:
-                    # Double check it's not in queue (could have been added while waiting for lock)
-                    if zone_id not in self.controller.zone_queue and zone_id not in self.controller.soaking_zones:
-                        self.controller.zone_queue.append(zone_id)
-                        _LOGGER.info(
-                            "Zone %s added to watering queue (moisture: %.1f%%, deficit: %.1fmm)", 
-                            zone["name"], current_moisture, zone.get("moisture_deficit", 0)
-                        )
-                        
-                        # Send notification if not too many waiting
-                        if len(self.controller.zone_queue) <= 3:  # Only notify for the first few zones
-                            await self.coordinator.async_send_notification(
-                                f"Zone {zone['name']} added to watering queue "
-                                f"(moisture: {current_moisture}%, deficit: {zone.get('moisture_deficit', 0):.1f}mm)"
-                            )
-                
-                # Start queue processing if not already active
-                if not self.controller.active_zone and not self.coordinator._queue_processing_active and not self.coordinator._shutdown_requested:
-                    asyncio.create_task(self.process_queue())
-        else:
-            # Log why watering is skipped
-            reason = "unknown"
-            if not scheduler.is_in_schedule():
-                reason = "outside of schedule"
-                _LOGGER.debug("Zone %s needs water but outside of schedule", zone["name"])
-            elif self.coordinator.weather_manager.is_rain_forecasted():
-                reason = "rain forecasted"
-                _LOGGER.info(
-                    "Zone %s needs water but rain is forecasted - skipping watering",
-                    zone["name"]
-                )
-            elif self.coordinator.weather_manager.is_freezing_forecasted():
-                reason = "freezing temperatures forecasted"
-                _LOGGER.info(
-                    "Zone %s needs water but freezing temperatures are forecasted - skipping watering",
-                    zone["name"]
-                )
-            elif current_temp <= self.coordinator.freeze_threshold:
-                reason = f"current temperature below freeze threshold ({self.coordinator.freeze_threshold}°F)"
-                _LOGGER.info(
-                    "Zone %s needs water but current temperature is below freeze threshold - skipping watering",
-                    zone["name"]
-                )
+        reason = self.watering_skip_reason(current_temp)
+        if reason is not None:
+            if reason == _REASON_OUTSIDE_SCHEDULE:
+                _LOGGER.debug("Zone %s needs water but outside of schedule", name)
+            else:
+                _LOGGER.info("Zone %s needs water but %s - skipping watering", name, reason)
             
             # Update skip reason in zone data for UI display
-            zone["watering_skipped_reason"] = reason
-            zone["last_check_time"] = self.hass.core.dt_util.now().isoformat()
+            self.mark_skipped(zone, reason)
+            return
+            
+        # Add to queue if not already there; nothing here awaits between the
+        # check and the enqueue, so no lock is needed
+        if not controller.is_zone_queued(zone_id) and zone_id not in controller.soaking_zones:
+            controller.enqueue_zone(zone_id)
+            deficit = zone.moisture_deficit
+            _LOGGER.info(
+                "Zone %s added to watering queue (moisture: %.1f%%, deficit: %.1fmm)", 
+                name, current_moisture, deficit
+            )
+            
+            # Send notification, batched with other zones queued close by
+            await self._notify_queued(
+                name, f"(moisture: {current_moisture}%, deficit: {deficit:.1f}mm)"
+            )
+            
+            # Start queue processing if not already active
+            if not controller.active_zone and not coordinator._queue_processing_active and not coordinator.shutdown_requested:
+                controller.processor.wake_queue()
+
+    def mark_skipped(self, zone, reason):
+        """Record why a zone that needs water is not being watered, for the UI."""
+        zone.watering_skipped_reason = reason
+        zone.last_check_time = dt_util.now().isoformat()
+
+    async def _notify_queued(self, name, detail):
+        """Report a queued zone, at most once per QUEUE_NOTIFY_INTERVAL."""
+        self._pending_queue_notices.append((name, detail))
+        if self._queue_notify_flush is not None:
+            return  # A flush is already scheduled and will include this zone
+            
+        delay = self._last_queue_notify + QUEUE_NOTIFY_INTERVAL - time.monotonic()
+        if delay <= 0:
+            await self._send_queue_notices()
+        else:
+            self._queue_notify_flush = self.hass.loop.call_later(
+                delay, self._flush_queue_notices
+            )
+            
+    def _flush_queue_notices(self):
+        """Send the notices held back by the rate limit."""
+        self._queue_notify_flush = None
+        self.hass.async_create_task(self._send_queue_notices())
+        
+    def cancel_queue_notices(self):
+        """Drop held-back queued-zone notices and their pending flush."""
+        if self._queue_notify_flush is not None:
+            self._queue_notify_flush.cancel()
+            self._queue_notify_flush = None
+        self._pending_queue_notices.clear()
+        
+    async def _send_queue_notices(self):
+        """Send every pending queued-zone notice as one notification."""
+        notices = self._pending_queue_notices
+        if not notices:
+            return
+        self._pending_queue_notices = []
+        self._last_queue_notify = time.monotonic()
+        
+        if len(notices) == 1:
+            name, detail = notices[0]
+            message = f"Zone {name} added to watering queue {detail}"
+        else:
+            message = "Zones added to watering queue:\n" + "\n".join(
+                f"- {name} {detail}" for name, detail in notices
+            )
+        await self.coordinator.async_send_notification(message)
 
     async def process_queue(self):
         """Process the zone queue in a non-blocking way."""
         # First check if shutdown requested
-        if self.coordinator._shutdown_requested:
+        if self.coordinator.shutdown_requested:
             _LOGGER.warning("Shutdown requested - clearing watering queue")
-            self.controller.zone_queue.clear()
+            self.controller.clear_zone_queue()
             self.coordinator._queue_processing_active = False
             return
             
@@ -165,16 +245,16 @@ class QueueManager:
                 # If no active zone and queue has entries, start next zone
                 while not self.controller.active_zone and self.controller.zone_queue:
                     # Check for shutdown requested inside loop
-                    if self.coordinator._shutdown_requested:
+                    if self.coordinator.shutdown_requested:
                         _LOGGER.warning("Shutdown requested during queue processing - clearing queue")
-                        self.controller.zone_queue.clear()
+                        self.controller.clear_zone_queue()
                         self.coordinator._queue_processing_active = False
                         return
                         
                     # Check if still in schedule
                     if not self.controller.scheduler.is_in_schedule():
                         _LOGGER.info("Queue processing stopped - outside of schedule window")
-                        self.controller.zone_queue.clear()
+                        self.controller.clear_zone_queue()
                         self.coordinator._queue_processing_active = False
                         return
                         
@@ -182,12 +262,12 @@ class QueueManager:
                     remaining_minutes = self.controller.scheduler.get_schedule_remaining_time()
                     if remaining_minutes is not None and remaining_minutes < 10:  # 10 minute safety margin
                         _LOGGER.info("Schedule window ending soon (%d minutes) - not starting new zones", remaining_minutes)
-                        self.controller.zone_queue.clear()
+                        self.controller.clear_zone_queue()
                         self.coordinator._queue_processing_active = False
                         return
                         
                     # Get next zone from queue
-                    zone_id = self.controller.zone_queue.pop(0)
+                    zone_id = self.controller.pop_next_zone()
                     if zone_id not in self.coordinator.zones:
                         _LOGGER.warning("Zone %s from queue no longer exists, skipping", zone_id)
                         # Continue with next iteration through loop
@@ -197,29 +277,31 @@ class QueueManager:
                     
                     # Get sensor readings
                     try:
-                        moisture_state = self.hass.states.get(zone["moisture_sensor"])
+                        moisture_state = self.hass.states.get(zone.moisture_sensor)
                         if not moisture_state:
-                            _LOGGER.warning("Moisture sensor not available for zone %s, skipping", zone["name"])
+                            _LOGGER.warning("Moisture sensor not available for zone %s, skipping", zone.name)
                             # Continue with next iteration of the loop
                             continue
                             
                         current_moisture = float(moisture_state.state)
                         
                         # Double-check if watering is still needed
-                        if current_moisture > zone["min_moisture"] and zone.get("moisture_deficit", 0) < 5.0:
+                        if current_moisture > zone.min_moisture and zone.moisture_deficit < 5.0:
                             _LOGGER.info(
                                 "Zone %s no longer needs water (moisture: %.1f%%, deficit: %.1fmm), skipping",
-                                zone["name"], current_moisture, zone.get("moisture_deficit", 0)
+                                zone.name, current_moisture, zone.moisture_deficit
                             )
                             # Continue with next iteration of the loop
                             continue
                         
-                        # Calculate watering duration
-                        await self._calculate_and_start_watering(zone_id, zone, current_moisture)
+                        # Calculate watering duration; move on to the next
+                        # zone in this same pass if this one needs none
+                        if not await self._calculate_and_start_watering(zone_id, zone, current_moisture):
+                            continue
                         # Break the loop since a zone has started
                         break
                     except Exception as e:
-                        _LOGGER.error("Error processing zone %s: %s", zone["name"], e)
+                        _LOGGER.error("Error processing zone %s: %s", zone.name, e)
                         # Continue with next iteration of the loop
                         continue
                 
@@ -237,22 +319,25 @@ class QueueManager:
                         _LOGGER.error("Error turning off active zone after processing error: %s", turn_off_error)
 
     async def _calculate_and_start_watering(self, zone_id, zone, current_moisture):
-        """Calculate watering time and start watering if needed."""
+        """Calculate watering time and start watering if needed.
+
+        Returns True if the zone was started, False to try the next zone.
+        """
         # Check for shutdown
-        if self.coordinator._shutdown_requested:
-            return
+        if self.coordinator.shutdown_requested:
+            return False
             
         # Calculate watering duration based on moisture levels and learned absorption rate
-        absorption_rate = self.coordinator.absorption_learners[zone_id].get_rate()
-        max_watering_time = zone["max_watering_time"]
+        absorption_rate = self.controller.get_learner(zone_id, zone).get_rate()
+        max_watering_time = zone.max_watering_time
         
         # Apply efficiency factor to absorption rate
-        efficiency_factor = zone.get("efficiency_factor", 1.0)
+        efficiency_factor = zone.efficiency_factor
         adjusted_absorption_rate = absorption_rate * efficiency_factor
         
         watering_duration = calculate_watering_duration(
             current_moisture=current_moisture,
-            target_moisture=zone["max_moisture"],
+            target_moisture=zone.max_moisture,
             absorption_rate=adjusted_absorption_rate,
             cycle_time=self.coordinator.cycle_time,
             max_watering_time=max_watering_time
@@ -261,56 +346,56 @@ class QueueManager:
         if watering_duration > 0:
             # Calculate how many cycles we need
             cycles_needed = max(1, int(watering_duration / self.coordinator.cycle_time))
-            zone["cycle_count"] = cycles_needed
-            zone["current_cycle"] = 1
+            zone.cycle_count = cycles_needed
+            zone.current_cycle = 1
             
             # Start watering the zone
             await self.controller.processor.start_zone_cycle(zone_id, current_moisture)
-        else:
-            _LOGGER.info("Zone %s doesn't need water, skipping", zone["name"])
-            # If queue has more entries, continue processing
-            if self.controller.zone_queue and not self.coordinator._shutdown_requested:
-                asyncio.create_task(self.process_queue())
-            else:
-                self.coordinator._queue_processing_active = False
+            return True
+        
+        _LOGGER.info("Zone %s doesn't need water, skipping", zone.name)
+        return False
+
+    def track_soak(self, zone_id, ready_at):
+        """Remember when a soaking zone will be ready to continue."""
+        heapq.heappush(self._soak_heap, (ready_at, zone_id))
+
+    def clear_soak_tracking(self):
+        """Forget every tracked soak, for when soaking_zones is emptied."""
+        self._soak_heap.clear()
 
     async def _check_soaking_zones(self):
         """Check if any soaking zones are ready to continue."""
-        now = asyncio.get_event_loop().time()
+        now = datetime.now()
         ready_zones = []
+        soaking_zones = self.controller.soaking_zones
+        soak_heap = self._soak_heap
         
-        # Find zones that have finished soaking
-        for zone_id, data in list(self.controller.soaking_zones.items()):
-            if zone_id not in self.coordinator.zones:
-                # Zone was deleted, remove from soaking zones
-                if "cancel_callback" in data:
-                    try:
-                        data["cancel_callback"]()
-                    except Exception as e:
-                        _LOGGER.error("Error canceling callback for deleted zone: %s", e)
-                del self.controller.soaking_zones[zone_id]
+        # Pop zones that have finished soaking, earliest first
+        while soak_heap and soak_heap[0][0] <= now:
+            ready_at, zone_id = heapq.heappop(soak_heap)
+            data = soaking_zones.get(zone_id)
+            if data is None or data.ready_at != ready_at:
+                # Stale entry: the soak already ended or was restarted
                 continue
                 
-            if data.get("ready_at", now) <= now:
-                ready_zones.append(zone_id)
+            # Drop its soak timer and remove from soaking zones dict
+            self.controller.processor.cancel_callback(zone_id, CALLBACK_SOAK_END)
+            del soaking_zones[zone_id]
+            
+            if zone_id not in self.coordinator.zones:
+                # Zone was deleted, nothing to continue
+                continue
                 
-                # Remove from soaking zones dict
-                if "cancel_callback" in data:
-                    try:
-                        data["cancel_callback"]()
-                    except Exception as e:
-                        _LOGGER.error("Error canceling callback for ready zone: %s", e)
-                    
-                del self.controller.soaking_zones[zone_id]
+            ready_zones.append(zone_id)
         
         # Add ready zones to the front of the queue
         if ready_zones:
             # Add them in reverse order to maintain original priority
-            async with self._queue_operation_lock:
-                for zone_id in reversed(ready_zones):
-                    self.controller.zone_queue.insert(0, zone_id)
+            for zone_id in reversed(ready_zones):
+                self.controller.enqueue_zone(zone_id, front=True)
                     
     async def clear_queue(self):
         """Clear the zone queue safely."""
         async with self._queue_operation_lock:
-            self.controller.zone_queue.clear()
\ No newline at end of file
+            self.controller.clear_zone_queue()
\ No newline at end of file
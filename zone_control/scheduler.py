@@ -1,6 +1,7 @@
 """Schedule management for Smart Sprinklers."""
+import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 
 from homeassistant.helpers.event import async_track_state_change
 from homeassistant.util import dt as dt_util
@@ -9,6 +10,10 @@ from ..const import CONF_SCHEDULE_ENTITY
 
 _LOGGER = logging.getLogger(__name__)
 
+# Quiet period after a schedule turns on before zones are checked, so a
+# burst of schedule changes triggers a single sweep
+SCHEDULE_DEBOUNCE_SECONDS = 0.5
+
 class Scheduler:
     """Schedule management for watering operations."""
     
@@ -18,12 +23,18 @@ class Scheduler:
         self.coordinator = controller.coordinator
         self.hass = controller.hass
         self._schedule_listener = None
-        self._schedule_check_debounce = None  # Debounce timer for schedule checks
+        self._schedule_check_debounce = None  # Cancels the pending debounced zone sweep
+        # The schedule entity is fixed for the life of the config entry
+        self._schedule_entity = self.coordinator.config_entry.data.get(CONF_SCHEDULE_ENTITY)
+        # Parsed end of the schedule window, keyed by the raw attributes it
+        # was parsed from so it is only re-parsed when they change
+        self._end_time_key = None
+        self._end_time = None
         
     def setup_schedule_monitoring(self):
         """Set up monitoring for schedule entity changes."""
         try:
-            schedule_entity = self.coordinator.config_entry.data.get(CONF_SCHEDULE_ENTITY)
+            schedule_entity = self._schedule_entity
             if not schedule_entity:
                 _LOGGER.debug("No schedule entity defined, all times allowed")
                 return
@@ -64,20 +75,20 @@ class Scheduler:
             if new_state.state == 'on' and (old_state is None or old_state.state != 'on'):
                 _LOGGER.info("Schedule activated - checking zones for watering needs")
                 
-                # Cancel any existing debounce timer
-                if self._schedule_check_debounce is not None:
-                    try:
-                        self._schedule_check_debounce()
-                    except Exception:
-                        pass
-                
-                # Schedule has turned on - check all zones for watering needs
-                for zone_id in self.coordinator.zones:
-                    await self.controller.process_zone(zone_id)
+                # Schedule has turned on - check all zones for watering needs,
+                # once a burst of schedule changes has settled
+                self._cancel_debounce()
+                handle = self.hass.loop.call_later(
+                    SCHEDULE_DEBOUNCE_SECONDS, self._run_debounced_check
+                )
+                self._schedule_check_debounce = handle.cancel
                     
             elif new_state.state == 'off' and (old_state is None or old_state.state != 'off'):
                 _LOGGER.info("Schedule deactivated - stopping active watering")
                 
+                # Don't start a zone sweep after the window has closed
+                self._cancel_debounce()
+                
                 # Schedule has turned off - stop any active watering
                 if self.controller.active_zone or self.controller.zone_queue or self.controller.soaking_zones:
                     _LOGGER.info("Stopping active watering due to schedule end")
@@ -85,104 +96,159 @@ class Scheduler:
         except Exception as e:
             _LOGGER.error("Error handling schedule change: %s", e)
             
+    def _cancel_debounce(self):
+        """Cancel the pending debounced zone sweep, if any."""
+        if self._schedule_check_debounce is not None:
+            self._schedule_check_debounce()
+            self._schedule_check_debounce = None
+            
+    def _run_debounced_check(self):
+        """Start the zone sweep once schedule changes have settled."""
+        self._schedule_check_debounce = None
+        self.hass.async_create_task(self._process_all_zones())
+            
+    async def _process_all_zones(self):
+        """Evaluate every zone for watering needs concurrently."""
+        controller = self.controller
+        zone_ids = [
+            zone_id for zone_id in self.coordinator.zones
+            if controller.should_process_zone(zone_id)
+        ]
+        results = await asyncio.gather(
+            *(controller.process_zone(zone_id) for zone_id in zone_ids),
+            return_exceptions=True
+        )
+        for zone_id, result in zip(zone_ids, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Error processing zone %s: %s", zone_id, result)
+            
+    def unload(self):
+        """Stop monitoring the schedule and drop any pending zone sweep."""
+        self._cancel_debounce()
+        if self._schedule_listener:
+            self._schedule_listener()
+            self._schedule_listener = None
+            
+    def _read_schedule_state(self):
+        """Return the schedule entity's current state, or None if unavailable."""
+        if not self._schedule_entity:
+            return None
+        try:
+            return self.hass.states.get(self._schedule_entity)
+        except Exception as e:
+            _LOGGER.error("Error reading schedule entity %s: %s", self._schedule_entity, e)
+            return None
+        
     def is_in_schedule(self):
         """Check if current time is within scheduled watering window."""
+        return self._in_schedule(self._read_schedule_state())
+        
+    def _in_schedule(self, schedule_state):
+        """Check a schedule state read by _read_schedule_state."""
         # If no schedule entity is defined, always return true (no schedule restriction)
-        schedule_entity = self.coordinator.config_entry.data.get(CONF_SCHEDULE_ENTITY)
-        if not schedule_entity:
+        if not self._schedule_entity:
             return True
         
-        try:
-            schedule_state = self.hass.states.get(schedule_entity)
-            if not schedule_state:
-                _LOGGER.warning("Schedule entity %s not available", schedule_entity)
-                # Default to NOT allowing watering if the schedule entity isn't available
-                # This is the safer approach - better to skip watering than water when not allowed
-                return False
-            
-            # Schedule helper's state is 'on' when the current time is within the schedule
-            return schedule_state.state == 'on'
-        except Exception as e:
-            _LOGGER.error("Error checking schedule: %s", e)
-            # Default to false (don't water) if there's an error
+        if not schedule_state:
+            _LOGGER.warning("Schedule entity %s not available", self._schedule_entity)
+            # Default to NOT allowing watering if the schedule entity isn't available
+            # This is the safer approach - better to skip watering than water when not allowed
             return False
         
+        # Schedule helper's state is 'on' when the current time is within the schedule
+        return schedule_state.state == 'on'
+        
     def get_schedule_remaining_time(self):
         """Get the remaining time in minutes for the current schedule window."""
-        schedule_entity = self.coordinator.config_entry.data.get(CONF_SCHEDULE_ENTITY)
-        if not schedule_entity:
+        return self._schedule_remaining_time(self._read_schedule_state())
+        
+    def _schedule_remaining_time(self, schedule_state):
+        """Decode the remaining window from a schedule state read by _read_schedule_state."""
+        if not self._schedule_entity:
             return None  # No schedule entity, so no time restriction
         
         try:
-            schedule_state = self.hass.states.get(schedule_entity)
             if not schedule_state or schedule_state.state != 'on':
                 return 0  # Not in schedule window
             
-            # Try to get next state change from attributes
-            if 'next_state_change' in schedule_state.attributes:
-                next_change = dt_util.parse_datetime(schedule_state.attributes['next_state_change'])
-                if next_change:
-                    now = dt_util.now()
-                    if next_change > now:
-                        # Return minutes until end of schedule
-                        return (next_change - now).total_seconds() / 60
-                    return 0  # Schedule about to end
-                    
-            # Alternative: If there's an end_time attribute
-            if 'end_time' in schedule_state.attributes:
-                end_time_str = schedule_state.attributes['end_time']
-                
-                # Parse end time - might be in various formats
-                try:
-                    # Try as full datetime first
-                    end_time = dt_util.parse_datetime(end_time_str)
-                    if not end_time:
-                        # Try as time string (without date)
-                        today = dt_util.now().date()
-                        time_parts = end_time_str.split(':')
-                        if len(time_parts) >= 2:
-                            hour = int(time_parts[0])
-                            minute = int(time_parts[1])
-                            end_time = dt_util.as_local(datetime.combine(today, datetime.time(hour, minute)))
-                    
-                    if end_time:
-                        now = dt_util.now()
-                        if end_time > now:
-                            return (end_time - now).total_seconds() / 60
-                        return 0  # Schedule ending now
-                except (ValueError, TypeError) as e:
-                    _LOGGER.error("Error parsing end time: %s", e)
+            now = dt_util.now()
+            end_time = self._schedule_end_time(schedule_state.attributes, now)
+            if end_time:
+                if end_time > now:
+                    # Return minutes until end of schedule
+                    return (end_time - now).total_seconds() / 60
+                return 0  # Schedule about to end
         except Exception as e:
             _LOGGER.error("Error getting schedule remaining time: %s", e)
             
         # Default to a small time if we can't determine
         return 10  # Default to 10 minutes if we can't determine
         
+    def _schedule_end_time(self, attributes, now):
+        """Return the end of the schedule window, parsing its attributes once."""
+        key = (attributes.get('next_state_change'), attributes.get('end_time'), now.date())
+        if key != self._end_time_key:
+            self._end_time = self._parse_schedule_end(*key)
+            self._end_time_key = key
+        return self._end_time
+        
+    @staticmethod
+    def _parse_schedule_end(next_state_change, end_time_str, today):
+        """Parse the end of the schedule window from the entity's attributes."""
+        # Try to get next state change from attributes
+        if next_state_change:
+            next_change = dt_util.parse_datetime(next_state_change)
+            if next_change:
+                return next_change
+                
+        # Alternative: If there's an end_time attribute
+        if not end_time_str:
+            return None
+            
+        # Parse end time - might be in various formats
+        try:
+            # Try as full datetime first
+            end_time = dt_util.parse_datetime(end_time_str)
+            if not end_time:
+                # Try as time string (without date)
+                time_parts = end_time_str.split(':')
+                if len(time_parts) >= 2:
+                    hour = int(time_parts[0])
+                    minute = int(time_parts[1])
+                    end_time = dt_util.as_local(datetime.combine(today, time(hour, minute)))
+            return end_time
+        except (ValueError, TypeError) as e:
+            _LOGGER.error("Error parsing end time: %s", e)
+            return None
+        
     async def check_schedule(self, now=None):
         """Check if the schedule state has changed."""
         try:
+            # Read the schedule state once for this check
+            schedule_state = self._read_schedule_state()
+            in_schedule = self._in_schedule(schedule_state)
+            
             # Check both: if we're in schedule AND if the system is enabled
-            if self.coordinator.system_enabled and self.is_in_schedule():
+            if self.coordinator.system_enabled and in_schedule:
                 # Check if any zone needs watering - but only if no active watering
                 if not self.controller.active_zone and not self.controller.zone_queue and not self.controller.soaking_zones:
                     _LOGGER.debug("Schedule check - looking for zones that need water")
-                    for zone_id in self.coordinator.zones:
-                        await self.controller.process_zone(zone_id)
+                    await self._process_all_zones()
             
             # If active watering but schedule has ended, stop immediately
-            if (self.controller.active_zone or self.controller.zone_queue or self.controller.soaking_zones) and not self.is_in_schedule():
+            if (self.controller.active_zone or self.controller.zone_queue or self.controller.soaking_zones) and not in_schedule:
                 _LOGGER.info("Schedule has ended, stopping active watering")
                 await self.controller.stop_all_watering("Schedule ended")
                 
             # If schedule end is coming up soon, check if we have enough time
-            elif self.controller.zone_queue and self.is_in_schedule():
-                remaining_minutes = self.get_schedule_remaining_time()
+            elif self.controller.zone_queue and in_schedule:
+                remaining_minutes = self._schedule_remaining_time(schedule_state)
                 if remaining_minutes is not None and remaining_minutes < 15:  # 15-minute warning
                     _LOGGER.info("Schedule ending in %.1f minutes, may not complete all zones", remaining_minutes)
                     
                     # Calculate if we need to prioritize zones
                     if remaining_minutes < 5:  # If less than 5 minutes remain, clear queue
                         _LOGGER.info("Less than 5 minutes left in schedule - clearing queue")
-                        self.controller.zone_queue.clear()
+                        self.controller.clear_zone_queue()
         except Exception as e:
             _LOGGER.error("Error in schedule check: %s", e)
\ No newline at end of file
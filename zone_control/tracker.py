@@ -1,12 +1,20 @@
 """State tracking for Smart Sprinklers."""
-import asyncio
 import logging
-from datetime import datetime
+import time
 
-from homeassistant.helpers.event import async_track_state_change
+from homeassistant.helpers.event import async_track_state_change_event
 
 _LOGGER = logging.getLogger(__name__)
 
+def _parse_moisture(state):
+    """Return a moisture sensor state as a float, or None if it has no valid reading."""
+    if state is None:
+        return None
+    try:
+        return float(state.state)
+    except (ValueError, TypeError):
+        return None
+
 class StateTracker:
     """Track state changes for zones and sensors."""
     
@@ -16,86 +24,120 @@ class StateTracker:
         self.coordinator = controller.coordinator
         self.hass = controller.hass
         
-        # Track state change listeners for cleanup
-        self._unsub_state_listeners = {}
+        # Zones fed by each moisture sensor, and the single listener that
+        # covers all of those sensors
+        self._sensor_zones = {}
+        self._unsub_moisture = None
         
-    def setup_moisture_tracking(self, zone_id):
-        """Set up moisture sensor change monitoring."""
-        try:
-            zone = self.coordinator.zones[zone_id]
-            moisture_sensor = zone["moisture_sensor"]
-            
-            # Remove any existing listener
-            if zone_id in self._unsub_state_listeners:
-                self._unsub_state_listeners[zone_id]()
+    def setup_moisture_tracking(self, *zone_ids):
+        """Set up moisture sensor change monitoring for the given zones.
+
+        The shared listener is re-subscribed once per call, so pass every
+        zone at once when setting up several.
+        """
+        for zone_id in zone_ids:
+            try:
+                zone = self.coordinator.zones[zone_id]
+                moisture_sensor = zone.moisture_sensor
                 
-            # Add state listener for moisture sensor to react immediately to changes
-            self._unsub_state_listeners[zone_id] = async_track_state_change(
+                # Drop any existing mapping for this zone
+                for sensor, sensor_zone_ids in list(self._sensor_zones.items()):
+                    if zone_id in sensor_zone_ids:
+                        sensor_zone_ids.remove(zone_id)
+                        if not sensor_zone_ids:
+                            del self._sensor_zones[sensor]
+                self._sensor_zones.setdefault(moisture_sensor, []).append(zone_id)
+                
+                # Seed the cached reading; the listener keeps it current from here
+                zone.last_moisture = _parse_moisture(self.hass.states.get(moisture_sensor))
+                
+                _LOGGER.debug("Set up moisture tracking for zone %s using sensor %s", 
+                            zone.name, moisture_sensor)
+            except Exception as e:
+                _LOGGER.error("Error setting up moisture tracking for zone %s: %s", zone_id, e)
+        
+        # One listener for every tracked sensor; events are routed to their
+        # zones by entity_id
+        try:
+            if self._unsub_moisture is not None:
+                self._unsub_moisture()
+            self._unsub_moisture = async_track_state_change_event(
                 self.hass,
-                moisture_sensor,
-                self._handle_moisture_change,
-                lambda _, __, new_state: zone_id  # Pass zone_id to the callback
+                list(self._sensor_zones),
+                self._handle_moisture_event
             )
-            
-            _LOGGER.debug("Set up moisture tracking for zone %s using sensor %s", 
-                        zone["name"], moisture_sensor)
         except Exception as e:
-            _LOGGER.error("Error setting up moisture tracking for zone %s: %s", zone_id, e)
+            _LOGGER.error("Error subscribing to moisture sensors: %s", e)
+        
+    async def _handle_moisture_event(self, event):
+        """Route a moisture sensor state change to the zones it feeds."""
+        for zone_id in self._sensor_zones.get(event.data.get("entity_id"), ()):
+            await self._handle_moisture_change(zone_id, event)
         
-    async def _handle_moisture_change(self, entity_id, old_state, new_state, zone_id):
+    async def _handle_moisture_change(self, zone_id, event):
         """Handle changes in moisture sensor readings."""
-        if not new_state or not zone_id:
+        entity_id = event.data.get("entity_id")
+        new_state = event.data.get("new_state")
+        zone = self.coordinator.zones.get(zone_id)
+        if zone is None:
+            _LOGGER.warning("Zone %s not found in coordinator zones", zone_id)
+            return
+        
+        # Readings that are missing or not numeric clear the cached value
+        zone.last_moisture = new_moisture = _parse_moisture(new_state)
+        if not new_state:
+            return
+        if new_moisture is None:
+            _LOGGER.warning("Invalid moisture reading for %s: %s", entity_id, new_state.state)
             return
             
         try:
-            # Get the new moisture value
-            new_moisture = float(new_state.state)
-            zone = self.coordinator.zones.get(zone_id)
-            
-            if not zone:
-                _LOGGER.warning("Zone %s not found in coordinator zones", zone_id)
-                return
-                
-            # Record moisture for learning
-            zone["moisture_history"].append({
-                "timestamp": datetime.now().isoformat(),
-                "value": new_moisture
-            })
-            
-            # Keep history manageable (last 30 days)
-            max_history = 30 * 24 * 12  # 30 days assuming readings every 5 minutes
-            if len(zone["moisture_history"]) > max_history:
-                zone["moisture_history"] = zone["moisture_history"][-max_history:]
+            # Record moisture for learning; the history is a fixed-size ring
+            # buffer, so the oldest reading drops off once it is full.
+            # Timestamps are formatted only when exported.
+            history = zone.moisture_history
+            history.append(time.time(), new_moisture)
                 
             # If we have a previous reading, check for moisture drop
-            if len(zone["moisture_history"]) >= 2:
-                previous_reading = zone["moisture_history"][-2]["value"]
+            if len(history) >= 2:
+                previous_reading = history[-2][1]
                 moisture_drop = previous_reading - new_moisture
                 if moisture_drop > 0:
                     # Convert moisture percentage drop to mm equivalent
                     mm_equivalent = moisture_drop * 1.0
-                    zone["moisture_deficit"] += mm_equivalent
+                    zone.moisture_deficit += mm_equivalent
                     _LOGGER.debug(
                         "Zone %s: Moisture drop of %.1f%% (%.1fmm), adjusted deficit to %.1fmm",
-                        zone["name"], moisture_drop, mm_equivalent, zone["moisture_deficit"]
+                        zone.name, moisture_drop, mm_equivalent, zone.moisture_deficit
                     )
             
-            # Process the zone if moisture is below threshold and not already watering
-            if new_moisture <= zone["min_moisture"] and zone["state"] == "idle":
+            # Process the zone if moisture is below threshold and not already
+            # watering, unless the cheap synchronous checks already rule it out
+            if (
+                new_moisture <= zone.min_moisture
+                and zone.state == "idle"
+                and self.controller.should_process_zone(zone_id)
+            ):
+                queue_manager = self.controller.queue_manager
+                reason = queue_manager.watering_skip_reason()
+                if reason is not None:
+                    queue_manager.mark_skipped(zone, reason)
+                    return
                 # Avoiding recursive calls within state changes by creating a task
-                asyncio.create_task(self.controller.process_zone(zone_id))
+                self.hass.async_create_task(self.controller.process_zone(zone_id))
                 
         except (ValueError, TypeError) as e:
             _LOGGER.warning("Invalid moisture reading for %s: %s", entity_id, e)
             
     async def unload(self):
         """Unload and clean up all resources."""
-        # Remove all state listeners
-        for zone_id, unsub in list(self._unsub_state_listeners.items()):
+        # Remove the moisture listener
+        if self._unsub_moisture is not None:
             try:
-                unsub()
+                self._unsub_moisture()
             except Exception:
                 pass
-        self._unsub_state_listeners = {}
+            self._unsub_moisture = None
+        self._sensor_zones = {}
         
         return True
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""Zone record for Smart Sprinklers."""
+from array import array
+from dataclasses import dataclass, field
+from typing import Optional
+
+from ..algorithms.absorption import AbsorptionLearner
+
+from ..const import (
+    DEFAULT_MIN_MOISTURE,
+    DEFAULT_MAX_MOISTURE,
+    DEFAULT_MAX_WATERING_HOURS,
+    DEFAULT_MAX_WATERING_MINUTES,
+    MAX_MOISTURE_HISTORY,
+    ZONE_STATE_IDLE,
+)
+
+class MoistureHistory:
+    """Ring buffer of (epoch seconds, moisture) readings.
+
+    Timestamps and values live in two preallocated float arrays; once full,
+    each append overwrites the oldest reading. Indexing and iteration yield
+    (timestamp, value) tuples, oldest first.
+    """
+
+    __slots__ = ("_timestamps", "_values", "_head", "_count", "revision")
+
+    def __init__(self, maxlen=MAX_MOISTURE_HISTORY):
+        self._timestamps = array("d", bytes(8 * maxlen))
+        self._values = array("d", bytes(8 * maxlen))
+        self._head = 0  # Slot the next reading is written to
+        self._count = 0
+        self.revision = 0  # Bumped on every change, for cached exports
+
+    @property
+    def maxlen(self):
+        """Return the number of readings kept."""
+        return len(self._values)
+
+    def append(self, timestamp, value):
+        """Record a reading, evicting the oldest one when full."""
+        head = self._head
+        self._timestamps[head] = timestamp
+        self._values[head] = value
+        self._head = (head + 1) % len(self._values)
+        if self._count < len(self._values):
+            self._count += 1
+        self.revision += 1
+
+    def clear(self):
+        """Forget every reading."""
+        self._head = 0
+        self._count = 0
+        self.revision += 1
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        count = self._count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("moisture history index out of range")
+        slot = (self._head - count + index) % len(self._values)
+        return self._timestamps[slot], self._values[slot]
+
+    def __iter__(self):
+        timestamps = self._timestamps
+        values = self._values
+        size = len(values)
+        start = self._head - self._count
+        for offset in range(self._count):
+            slot = (start + offset) % size
+            yield timestamps[slot], values[slot]
+
+@dataclass(slots=True)
+class ZoneRecord:
+    """Runtime state of a single sprinkler zone."""
+
+    # Configuration
+    name: str
+    switch: str
+    temp_sensor: str
+    moisture_sensor: str
+    min_moisture: float = DEFAULT_MIN_MOISTURE
+    max_moisture: float = DEFAULT_MAX_MOISTURE
+    max_watering_hours: int = DEFAULT_MAX_WATERING_HOURS
+    max_watering_minutes: int = DEFAULT_MAX_WATERING_MINUTES
+    max_watering_time: int = DEFAULT_MAX_WATERING_HOURS * 60 + DEFAULT_MAX_WATERING_MINUTES
+
+    # Watering state
+    state: str = ZONE_STATE_IDLE
+    last_watered: Optional[str] = None
+    next_watering: Optional[str] = None
+    cycle_count: int = 0
+    current_cycle: int = 0
+    watering_start_time: Optional[float] = None  # time.monotonic() at turn-on
+    pre_watering_moisture: Optional[float] = None
+    last_moisture: Optional[float] = None  # Latest valid sensor reading, kept by the tracker
+    watering_skipped_reason: Optional[str] = None
+    last_check_time: Optional[str] = None  # Last evaluation time
+
+    # Learned statistics
+    moisture_history: MoistureHistory = field(default_factory=MoistureHistory)
+    soaking_efficiency: float = 0
+    moisture_deficit: float = 0.0
+    efficiency_factor: float = 1.0
+    watering_expected_increase: float = 0.0
+    # The zone's entry in coordinator.absorption_learners, bound at setup or
+    # on first use through ZoneController.get_learner
+    learner: Optional[AbsorptionLearner] = field(default=None, repr=False, compare=False)